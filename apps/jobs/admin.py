@@ -0,0 +1,18 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("id", "name", "status", "attempts", "max_attempts", "run_after", "created_at")
+    list_filter = ("status", "name")
+    readonly_fields = ("created_at", "locked_at", "last_error")
+    ordering = ("run_after", "id")
+    actions = ["retry_jobs"]
+
+    @admin.action(description="Reintentar tareas seleccionadas")
+    def retry_jobs(self, request, queryset):
+        queryset.update(
+            status=Job.PENDING, attempts=0, run_after=timezone.now(), locked_at=None)
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from apps.jobs.queue import queue_depth
+from apps.jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = "Ejecuta las tareas en cola (imágenes y otros efectos lentos fuera de la petición)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true",
+                            help="Procesa lo pendiente y termina")
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--stats", action="store_true",
+                            help="Muestra la profundidad de la cola y termina")
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            for status, total in queue_depth().items():
+                self.stdout.write(f"{status}: {total}")
+            return
+
+        worker = Worker(batch_size=options["batch_size"])
+        try:
+            worker.run(stop_when_empty=options["once"])
+        except KeyboardInterrupt:
+            self.stderr.write("Worker detenido.")
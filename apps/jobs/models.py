@@ -0,0 +1,36 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    PENDING = "pending"
+    RUNNING = "running"
+    FAILED = "failed"
+
+    STATUSES = [
+        (PENDING, "Pendiente"),
+        (RUNNING, "En ejecución"),
+        (FAILED, "Fallida"),
+    ]
+
+    name = models.CharField(max_length=100, verbose_name="Tarea")
+    payload = models.JSONField(default=dict, blank=True, verbose_name="Argumentos")
+    status = models.CharField(
+        max_length=10, choices=STATUSES, default=PENDING, verbose_name="Estado")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Intentos")
+    max_attempts = models.PositiveIntegerField(default=3, verbose_name="Máx. intentos")
+    run_after = models.DateTimeField(default=timezone.now, verbose_name="Ejecutar desde")
+    locked_at = models.DateTimeField(null=True, blank=True, verbose_name="Tomada")
+    last_error = models.TextField(blank=True, verbose_name="Último error")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Creada")
+
+    def __str__(self):
+        return f"{self.name} #{self.pk} ({self.status})"
+
+    class Meta:
+        verbose_name = "Tarea en cola"
+        verbose_name_plural = "Tareas en cola"
+        ordering = ["run_after", "id"]
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="jobs_status_run_after"),
+        ]
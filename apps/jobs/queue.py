@@ -0,0 +1,68 @@
+"""
+Cola de tareas respaldada por la tabla ``jobs_job`` en PostgreSQL.
+
+``enqueue`` inserta la fila en la transacción en curso: el worker solo la
+ve después del commit y desaparece si la escritura que la originó hace
+rollback. El worker (``manage.py run_jobs``) la ejecuta fuera de la petición.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Count
+from django.utils import timezone
+
+from .models import Job
+
+DEFAULTS = {
+    "EAGER": False,
+    "MAX_ATTEMPTS": 3,
+    "RETRY_DELAY": 30,
+    "LOCK_TIMEOUT": 600,
+    "POLL_INTERVAL": 2,
+    "BATCH_SIZE": 10,
+}
+
+TASKS = {}
+
+
+def get_jobs_settings():
+    return {**DEFAULTS, **getattr(settings, "JOBS", {})}
+
+
+def task(name, max_attempts=None):
+    """Registra una función como tarea encolable con ``name``."""
+    def decorator(func):
+        func.task_name = name
+        func.max_attempts = max_attempts
+        TASKS[name] = func
+        return func
+    return decorator
+
+
+def enqueue(name, payload=None, delay=0):
+    """
+    Encola ``name`` con ``payload`` como argumentos por nombre. Con
+    ``JOBS["EAGER"]`` se ejecuta en el acto (desarrollo y pruebas).
+    """
+    if name not in TASKS:
+        raise ValueError(f"Tarea desconocida: '{name}'.")
+    payload = payload or {}
+    config = get_jobs_settings()
+    if config["EAGER"]:
+        TASKS[name](**payload)
+        return None
+    return Job.objects.create(
+        name=name,
+        payload=payload,
+        run_after=timezone.now() + timedelta(seconds=delay),
+        max_attempts=TASKS[name].max_attempts or config["MAX_ATTEMPTS"],
+    )
+
+
+def queue_depth():
+    """Cantidad de tareas por estado, p. ej. ``{"pending": 3, "running": 1, "failed": 0}``."""
+    depth = dict.fromkeys((Job.PENDING, Job.RUNNING, Job.FAILED), 0)
+    rows = Job.objects.order_by().values("status").annotate(total=Count("id"))
+    depth.update({row["status"]: row["total"] for row in rows})
+    return depth
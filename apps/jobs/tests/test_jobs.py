@@ -0,0 +1,116 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.jobs.models import Job
+from apps.jobs.queue import enqueue, queue_depth, task
+from apps.jobs.worker import Worker
+
+CALLS = []
+
+
+@task("tests.record")
+def record(value):
+    CALLS.append(value)
+
+
+@task("tests.boom", max_attempts=2)
+def boom():
+    raise RuntimeError("falló")
+
+
+class JobQueueTest(TestCase):
+    """Pruebas para la cola de tareas en la base de datos"""
+
+    def setUp(self):
+        CALLS.clear()
+
+    def test_enqueue_y_worker(self):
+        """Verifica que el worker ejecuta la tarea y la retira de la cola"""
+        enqueue("tests.record", {"value": 7})
+
+        self.assertEqual(CALLS, [])
+        self.assertEqual(Worker().run_once(), 1)
+        self.assertEqual(CALLS, [7])
+        self.assertFalse(Job.objects.exists())
+
+    def test_tarea_desconocida(self):
+        """Verifica que no se puede encolar una tarea no registrada"""
+        with self.assertRaises(ValueError):
+            enqueue("tests.no-existe")
+
+    def test_reintento_con_espera(self):
+        """Verifica que un fallo se reprograma con espera exponencial"""
+        job = enqueue("tests.boom")
+
+        Worker().run_once()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.PENDING)
+        self.assertEqual(job.attempts, 1)
+        self.assertIn("RuntimeError", job.last_error)
+        self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=20))
+        self.assertEqual(Worker().run_once(), 0)
+
+    def test_falla_al_agotar_intentos(self):
+        """Verifica el estado failed tras max_attempts"""
+        job = enqueue("tests.boom")
+        for _ in range(2):
+            Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+            Worker().run_once()
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(job.attempts, 2)
+
+    def test_rollback_descarta_la_tarea(self):
+        """Verifica que la tarea no sobrevive al rollback de la escritura que la creó"""
+        from django.db import transaction
+
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            enqueue("tests.record", {"value": 1})
+            raise RuntimeError
+
+        self.assertFalse(Job.objects.exists())
+
+    def test_recupera_tareas_de_un_worker_caido(self):
+        """Verifica que una tarea tomada hace mucho vuelve a la cola"""
+        job = enqueue("tests.record", {"value": 3})
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.RUNNING, attempts=1,
+            locked_at=timezone.now() - timedelta(hours=1))
+
+        Worker().run_once()
+
+        self.assertEqual(CALLS, [3])
+
+    @override_settings(JOBS={"EAGER": True})
+    def test_modo_eager(self):
+        """Verifica que en modo eager la tarea corre sin pasar por la tabla"""
+        enqueue("tests.record", {"value": 5})
+
+        self.assertEqual(CALLS, [5])
+        self.assertFalse(Job.objects.exists())
+
+    def test_profundidad_de_la_cola(self):
+        """Verifica queue_depth y run_jobs --stats"""
+        enqueue("tests.record", {"value": 1})
+        enqueue("tests.record", {"value": 2})
+        Job.objects.create(name="tests.boom", status=Job.FAILED)
+        out = StringIO()
+
+        call_command("run_jobs", stats=True, stdout=out)
+
+        self.assertEqual(queue_depth(), {"pending": 2, "running": 0, "failed": 1})
+        self.assertIn("pending: 2", out.getvalue())
+
+    def test_comando_once(self):
+        """Verifica que run_jobs --once vacía la cola y termina"""
+        enqueue("tests.record", {"value": 9})
+
+        call_command("run_jobs", once=True)
+
+        self.assertEqual(CALLS, [9])
@@ -0,0 +1,91 @@
+import logging
+import time
+import traceback
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+from .queue import TASKS, get_jobs_settings
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    """
+    Toma tareas pendientes con ``SELECT ... FOR UPDATE SKIP LOCKED`` para que
+    varios workers puedan correr a la vez sin ejecutar la misma tarea.
+    """
+
+    def __init__(self, batch_size=None):
+        self.config = get_jobs_settings()
+        self.batch_size = batch_size or self.config["BATCH_SIZE"]
+
+    def requeue_stale(self):
+        """Devuelve a la cola las tareas de un worker que murió a mitad de ejecución."""
+        limit = timezone.now() - timedelta(seconds=self.config["LOCK_TIMEOUT"])
+        stale = Job.objects.filter(status=Job.RUNNING, locked_at__lt=limit)
+        stale.filter(attempts__gte=F("max_attempts")).update(
+            status=Job.FAILED, last_error="Tiempo de ejecución agotado.")
+        stale.update(status=Job.PENDING, locked_at=None)
+
+    def claim(self):
+        now = timezone.now()
+        with transaction.atomic():
+            jobs = list(
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(status=Job.PENDING, run_after__lte=now)
+                .order_by("run_after", "id")[:self.batch_size]
+            )
+            Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+                status=Job.RUNNING, locked_at=now, attempts=F("attempts") + 1)
+        for job in jobs:
+            job.attempts += 1
+        return jobs
+
+    def execute(self, job):
+        func = TASKS.get(job.name)
+        try:
+            if func is None:
+                raise LookupError(f"Tarea desconocida: '{job.name}'.")
+            func(**job.payload)
+        except Exception:
+            self.fail(job, traceback.format_exc())
+            return False
+        # Las tareas completadas no se conservan; la tabla es solo la cola
+        Job.objects.filter(pk=job.pk).delete()
+        return True
+
+    def fail(self, job, error):
+        queryset = Job.objects.filter(pk=job.pk)
+        if job.attempts >= job.max_attempts:
+            queryset.update(status=Job.FAILED, last_error=error, locked_at=None)
+            logger.error("Job failed name=%s id=%s attempts=%s", job.name, job.pk, job.attempts)
+            return
+        # Espera exponencial: RETRY_DELAY, 2x, 4x...
+        delay = self.config["RETRY_DELAY"] * 2 ** (job.attempts - 1)
+        queryset.update(
+            status=Job.PENDING,
+            last_error=error,
+            locked_at=None,
+            run_after=timezone.now() + timedelta(seconds=delay),
+        )
+        logger.warning(
+            "Job retry name=%s id=%s attempts=%s delay=%ss", job.name, job.pk, job.attempts, delay)
+
+    def run_once(self):
+        """Procesa un lote; devuelve cuántas tareas ejecutó."""
+        self.requeue_stale()
+        jobs = self.claim()
+        for job in jobs:
+            self.execute(job)
+        return len(jobs)
+
+    def run(self, stop_when_empty=False):
+        while True:
+            if self.run_once() == 0:
+                if stop_when_empty:
+                    return
+                time.sleep(self.config["POLL_INTERVAL"])
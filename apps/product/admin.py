@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.utils.html import format_html
 
+from .images import current_variants, smallest_variant
 from .models import Product
 
 
@@ -30,8 +31,12 @@ class ProductAdmin(admin.ModelAdmin):
 
     def admin_image(self, obj):
         if obj.image:
+            # Miniatura derivada; el original solo si aún no hay derivados
+            thumbnail = smallest_variant(
+                current_variants(obj.image_variants, obj.image.name))
+            url = obj.image.storage.url(thumbnail) if thumbnail else obj.image.url
             return format_html(
-                '<img src="{}" style="max-height:100px;"/>', obj.image.url
+                '<img src="{}" style="max-height:100px;"/>', url
             )
         return "-"
 
@@ -0,0 +1,145 @@
+"""
+Lecturas de productos para el despliegue ASGI (``ASGI_MODE``).
+
+Cubren el caso caliente del catálogo, las lecturas anónimas de listado,
+detalle y búsqueda, con el ORM asíncrono. Django aún ejecuta cada consulta
+en el hilo ``sync_to_async`` (thread-sensitive) de la petición, así que la
+base de datos sigue ocupando un hilo; lo que se evita es retener uno por
+cada cliente lento o a la espera de la caché. Reutilizan ``ProductViewSet``
+para el queryset, los filtros, la serialización y el render, y comparten la
+caché con las vistas síncronas.
+
+Lo demás (escrituras, usuarios autenticados, paginación por cursor,
+parámetros no contemplados) se delega al ``ProductViewSet`` síncrono.
+"""
+
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.response import Response
+
+from l_atelier.metrics import timed
+
+from .cache import acached_response, asave_pending_entry
+from .conditional import (
+    acollection_validators,
+    conditional_response,
+    evaluate_preconditions,
+    has_etag_preconditions,
+    instance_validators,
+    rows_summary,
+    summary_validators,
+)
+from .views import ProductViewSet
+
+SPARSE_PARAMS = frozenset({"fields", "omit", "compact"})
+LIST_PARAMS = frozenset({"ordering"}) | SPARSE_PARAMS
+SEARCH_PARAMS = frozenset({"q", "min_price", "max_price", "ordering"}) | SPARSE_PARAMS
+DETAIL_PARAMS = frozenset({"fields", "omit"})
+
+
+def is_fast_path(request, params):
+    """GET anónimo con solo parámetros que la vista asíncrona sabe atender."""
+    return (
+        request.method == "GET"
+        and "HTTP_AUTHORIZATION" not in request.META
+        and request.GET.keys() <= params
+    )
+
+
+def as_async_view(actions, handler, params):
+    """
+    Vista asíncrona para las rutas de ``actions``: atiende el GET anónimo con
+    ``handler`` y delega el resto en ``ProductViewSet.as_view(actions)``.
+    """
+    sync_view = ProductViewSet.as_view(actions)
+
+    @csrf_exempt
+    async def view(request, **kwargs):
+        if not is_fast_path(request, params):
+            return await sync_to_async(sync_view)(request, **kwargs)
+        return await dispatch(request, actions, handler, kwargs)
+
+    return view
+
+
+async def dispatch(request, actions, handler, kwargs):
+    """Equivalente asíncrono de ``APIView.dispatch`` para un ``ProductViewSet``."""
+    self = ProductViewSet()
+    self.action_map = {**actions, "head": actions["get"]}
+    for method, action in self.action_map.items():
+        setattr(self, method, getattr(self, action))
+    self.args, self.kwargs = (), kwargs
+    self.request = request
+    request = self.initialize_request(request, **kwargs)
+    self.request = request
+    self.headers = self.default_response_headers
+    try:
+        # Sin cabecera Authorization no consulta la base de datos
+        self.initial(request, **kwargs)
+        response = await handler(self, request)
+    except Exception as exc:
+        response = self.handle_exception(exc)
+    self.response = self.finalize_response(request, response, **kwargs)
+    if isinstance(self.response, Response):
+        # Se renderiza aquí para no volver a un hilo solo para serializar
+        self.response.render()
+        await asave_pending_entry(self.response)
+    return self.response
+
+
+async def collection_response(view, queryset):
+    """``ProductViewSet.list_response`` sin paginación, con consultas asíncronas."""
+    queryset = view.sparse_queryset(queryset)
+    etag = None
+    if has_etag_preconditions(view.request):
+        etag, last_modified = await acollection_validators(view.request, queryset)
+    queryset, serialize = view.collection_serializer(queryset)
+    products = []
+    if etag is None or evaluate_preconditions(view.request, etag) is None:
+        products = [product async for product in queryset]
+    if etag is None:
+        etag, last_modified = summary_validators(view.request, rows_summary(products))
+
+    def produce():
+        with timed(view.request, "serialize"):
+            data = serialize(products)
+        return Response(data)
+
+    return conditional_response(
+        view.request, etag, last_modified, produce, compare_dates=False)
+
+
+async def list_products(view, request):
+    queryset = view.filter_queryset(view.get_queryset())
+    return await acached_response(
+        request, "list", partial(collection_response, view, queryset))
+
+
+async def search_products(view, request):
+    return await collection_response(view, view.search_queryset(request))
+
+
+async def retrieve_product(view, request):
+    async def produce():
+        queryset = view.sparse_queryset(view.get_queryset()).order_by()
+        if "pk" in view.kwargs:
+            instance = await queryset.filter(pk=view.kwargs["pk"]).afirst()
+        else:
+            instance = await queryset.filter(slug=view.kwargs["slug"]).afirst()
+        if instance is None:
+            raise Http404
+        view.check_object_permissions(request, instance)
+        etag, last_modified = instance_validators(
+            request, instance, view.get_sparse_fields())
+
+        def serialize():
+            with timed(request, "serialize"):
+                data = view.get_serializer(instance).data
+            return Response(data)
+
+        return conditional_response(request, etag, last_modified, serialize)
+
+    return await acached_response(request, "retrieve", produce)
@@ -0,0 +1,232 @@
+"""
+Caché de lectura para las respuestas de productos.
+
+Cada clave incluye la versión actual del catálogo; cualquier escritura de un
+producto incrementa esa versión y deja obsoletas todas las entradas sin
+necesidad de borrarlas una por una.
+
+Junto a los datos se guardan los bytes ya renderizados y comprimidos
+(``l_atelier.compression``): un acierto de caché no vuelve a renderizar ni a
+comprimir.
+"""
+
+import hashlib
+import time
+from urllib.parse import urlencode
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework.response import Response
+
+from l_atelier.compression import (
+    IDENTITY,
+    compress,
+    encode_response,
+    is_compressible,
+    negotiate_encoding,
+)
+from l_atelier.db_router import read_from_replica
+
+from .conditional import evaluate_preconditions
+
+VERSION_KEY = "product:catalog-version"
+CACHED_HEADERS = ("ETag", "Last-Modified")
+
+DEFAULTS = {
+    "ENABLED": True,
+    "ALIAS": "default",
+    "TIMEOUT": 300,
+    # Las respuestas leídas de una réplica pueden ir atrasadas respecto a la
+    # versión del catálogo de su clave; se guardan menos tiempo.
+    "REPLICA_TIMEOUT": 30,
+}
+
+
+def get_cache_settings():
+    return {**DEFAULTS, **getattr(settings, "PRODUCT_CACHE", {})}
+
+
+def get_cache():
+    return caches[get_cache_settings()["ALIAS"]]
+
+
+def get_catalog_version():
+    cache = get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Se inicia con un valor basado en el tiempo para no reutilizar una
+        # versión anterior si la clave fue desalojada de la caché.
+        cache.add(VERSION_KEY, time.time_ns() // 1_000_000, timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_catalog_version():
+    """Invalida todas las respuestas cacheadas del catálogo."""
+    cache = get_cache()
+    try:
+        return cache.incr(VERSION_KEY)
+    except ValueError:
+        get_catalog_version()
+        return cache.incr(VERSION_KEY)
+
+
+def get_audience(request):
+    """
+    Las respuestas dependen del tipo de usuario: ``get_queryset`` solo filtra
+    ``is_active`` para anónimos y el staff se mantiene aparte.
+    """
+    user = getattr(request, "user", None)
+    if not user or not user.is_authenticated:
+        return "anon"
+    if user.is_staff:
+        return "staff"
+    return "user"
+
+
+def build_cache_key(request, namespace):
+    params = urlencode(sorted(request.query_params.lists()), doseq=True)
+    material = f"{request.get_host()}{request.path}?{params}"
+    digest = hashlib.sha1(material.encode("utf-8")).hexdigest()
+    return (f"product:v{get_catalog_version()}:{namespace}:"
+            f"{get_audience(request)}:{digest}")
+
+
+def cached_response(request, namespace, producer):
+    """
+    Devuelve la respuesta cacheada para ``request`` o la genera con
+    ``producer()`` y la guarda, ya renderizada, si fue exitosa. Los
+    validadores (ETag/Last-Modified) se guardan junto al contenido para
+    responder 304 sin tocar la base de datos.
+    """
+    if not is_cacheable(request):
+        return producer()
+
+    key, entry = lookup(request, namespace)
+    if entry is not None:
+        response = hit_response(request, entry)
+        if getattr(response, "entry_changed", False):
+            get_cache().set(key, entry, entry_timeout())
+        return response
+
+    response = producer()
+    if response.status_code == 200:
+        store_after_render(request, response, key)
+    response["X-Cache"] = "MISS"
+    return response
+
+
+async def acached_response(request, namespace, producer):
+    """Variante de ``cached_response`` para las vistas asíncronas; ``producer`` es una corrutina."""
+    if not is_cacheable(request):
+        return await producer()
+
+    key, entry = await sync_to_async(lookup)(request, namespace)
+    if entry is not None:
+        response = hit_response(request, entry)
+        if getattr(response, "entry_changed", False):
+            await get_cache().aset(key, entry, entry_timeout())
+        return response
+
+    response = await producer()
+    if response.status_code == 200:
+        # La entrada se arma al renderizar y la guarda asave_pending_entry
+        store_after_render(request, response, key, pending=True)
+    response["X-Cache"] = "MISS"
+    return response
+
+
+async def asave_pending_entry(response):
+    """Guarda con ``aset`` la entrada preparada por ``store_after_render(pending=True)``."""
+    pending = getattr(response, "pending_cache_entry", None)
+    if pending is not None:
+        response.pending_cache_entry = None
+        await get_cache().aset(*pending)
+
+
+def is_cacheable(request):
+    return get_cache_settings()["ENABLED"] and request.method == "GET"
+
+
+def lookup(request, namespace):
+    key = build_cache_key(request, namespace)
+    return key, get_cache().get(key)
+
+
+def store_after_render(request, response, key, pending=False):
+    """
+    Guarda la entrada cuando la respuesta ya tiene sus bytes: los renderizados
+    y, si el cliente aceptó compresión, los comprimidos (que también se envían).
+    Con ``pending`` solo la deja en ``response.pending_cache_entry``: el render
+    asíncrono corre en el event loop, donde no se llama a la caché síncrona.
+    """
+    timeout = entry_timeout()
+
+    def store(response):
+        entry = make_entry(response)
+        entry["media_type"] = response.accepted_media_type
+        entry["content_type"] = response["Content-Type"]
+        entry["encoded"] = {IDENTITY: response.content}
+        encoding = negotiate_encoding(request)
+        if encoding and is_compressible(request, response):
+            body = compress(response.content, encoding)
+            if len(body) < len(response.content):
+                entry["encoded"][encoding] = body
+                encode_response(response, encoding, body)
+        if pending:
+            response.pending_cache_entry = (key, entry, timeout)
+        else:
+            get_cache().set(key, entry, timeout)
+
+    response.add_post_render_callback(store)
+
+
+def hit_response(request, entry):
+    response = None
+    if entry["validators"]:
+        response = evaluate_preconditions(request, *entry["validators"])
+    if response is None:
+        response = Response(entry["data"])
+    for header, value in entry["headers"].items():
+        response[header] = value
+    if response.status_code == 200 and entry.get("media_type") == getattr(
+            request, "accepted_media_type", None):
+        restore_content(request, response, entry)
+    response["X-Cache"] = "HIT"
+    return response
+
+
+def restore_content(request, response, entry):
+    """
+    Usa los bytes guardados en lugar de renderizar. Si el cliente pide una
+    codificación que la entrada aún no tiene, se comprime una vez y se marca
+    ``entry_changed`` para guardarla.
+    """
+    encoded = entry["encoded"]
+    response.content = encoded[IDENTITY]
+    response["Content-Type"] = entry["content_type"]
+    encoding = negotiate_encoding(request)
+    if encoding is None:
+        return
+    body = encoded.get(encoding)
+    if body is None and is_compressible(request, response):
+        body = encoded[encoding] = compress(encoded[IDENTITY], encoding)
+        response.entry_changed = True
+    if body is not None and len(body) < len(encoded[IDENTITY]):
+        encode_response(response, encoding, body)
+
+
+def make_entry(response):
+    return {
+        "data": response.data,
+        "headers": {h: response[h] for h in CACHED_HEADERS if h in response},
+        "validators": getattr(response, "validators", None),
+    }
+
+
+def entry_timeout():
+    options = get_cache_settings()
+    if read_from_replica():
+        return min(options["TIMEOUT"], options["REPLICA_TIMEOUT"])
+    return options["TIMEOUT"]
@@ -0,0 +1,132 @@
+"""
+GET condicional (ETag / Last-Modified / 304) y precondiciones de escritura
+(If-Match) para los endpoints de productos.
+"""
+
+import hashlib
+from calendar import timegm
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PreconditionFailed(APIException):
+    status_code = status.HTTP_412_PRECONDITION_FAILED
+    default_detail = "El producto cambió desde la última vez que lo consultaste."
+    default_code = "precondition_failed"
+
+
+def make_etag(*parts):
+    material = ":".join(str(part) for part in parts)
+    return quote_etag(hashlib.sha1(material.encode("utf-8")).hexdigest())
+
+
+def to_timestamp(value):
+    return timegm(value.utctimetuple()) if value else None
+
+
+def instance_validators(request, instance, fields=None):
+    """
+    ETag y Last-Modified de un producto a partir de ``updated_at``. ``fields``
+    es la selección normalizada de ?fields=/?omit=: cada subconjunto es otra
+    representación y lleva su propio ETag. Sin ``fields`` es el de la
+    representación completa, el que valida If-Match en las escrituras.
+    """
+    parts = ["product", request.get_host(), instance.pk, instance.updated_at.isoformat()]
+    if fields is not None:
+        parts.append(",".join(fields))
+    return make_etag(*parts), to_timestamp(instance.updated_at)
+
+
+def has_etag_preconditions(request):
+    """Si la petición trae un ETag que comparar (If-None-Match / If-Match)."""
+    return "HTTP_IF_NONE_MATCH" in request.META or "HTTP_IF_MATCH" in request.META
+
+
+def collection_validators(request, queryset):
+    """
+    ETag y Last-Modified de una colección con una sola consulta agregada
+    ``(max(updated_at), count)``, mucho más barata que serializarla.
+    """
+    summary = queryset.order_by().aggregate(
+        last=Max("updated_at"), total=Count("pk"))
+    return summary_validators(request, summary)
+
+
+async def acollection_validators(request, queryset):
+    """Variante asíncrona de ``collection_validators``."""
+    summary = await queryset.order_by().aaggregate(
+        last=Max("updated_at"), total=Count("pk"))
+    return summary_validators(request, summary)
+
+
+def rows_summary(rows):
+    """
+    El mismo resumen que ``collection_validators`` calculado sobre filas ya
+    leídas (dicts de ``.values()`` o instancias), sin otra consulta.
+    """
+    dates = [row["updated_at"] if isinstance(row, dict) else row.updated_at
+             for row in rows]
+    return {"last": max(dates, default=None), "total": len(dates)}
+
+
+def summary_validators(request, summary):
+    last = summary["last"]
+    etag = make_etag(
+        "products",
+        request.get_host(),
+        request.get_full_path(),
+        last.isoformat() if last else "",
+        summary["total"],
+    )
+    return etag, to_timestamp(last)
+
+
+def evaluate_preconditions(request, etag, last_modified=None):
+    """Devuelve la respuesta 304/412 que corresponda, o None."""
+    return get_conditional_response(
+        request, etag=etag, last_modified=last_modified)
+
+
+def set_validators(response, etag, last_modified):
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+
+
+def conditional_response(request, etag, last_modified, producer,
+                         compare_dates=True):
+    """
+    Responde 304 si el cliente ya tiene la versión actual; si no, genera la
+    respuesta con ``producer()`` y le agrega los validadores.
+
+    En colecciones ``compare_dates=False``: borrar un producto no cambia
+    ``max(updated_at)``, así que solo el ETag (que incluye el conteo) decide.
+    """
+    checked = last_modified if compare_dates else None
+    response = evaluate_preconditions(request, etag, checked)
+    if response is None:
+        response = producer()
+    if response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+        set_validators(response, etag, last_modified)
+    # Se guardan para reevaluarlos cuando la respuesta salga de la caché
+    response.validators = (etag, checked)
+    return response
+
+
+def check_write_preconditions(request, instance):
+    """Evita actualizaciones perdidas: valida If-Match en PUT/PATCH."""
+    etag, last_modified = instance_validators(request, instance)
+    if_match = request.META.get("HTTP_IF_MATCH")
+    if if_match:
+        # La compresión entrega el ETag como W/"..." porque cambia los bytes,
+        # pero sigue identificando la misma versión del producto.
+        etags = [tag.removeprefix("W/") for tag in parse_etags(if_match)]
+        if etags != ["*"] and etag not in etags:
+            raise PreconditionFailed()
+        return
+    if evaluate_preconditions(request, etag, last_modified) is not None:
+        raise PreconditionFailed()
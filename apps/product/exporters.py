@@ -0,0 +1,98 @@
+"""
+Exportación completa del catálogo en CSV o JSONL sin cargarlo en memoria.
+
+Las filas se leen con ``.values().iterator(chunk_size)`` (cursor del lado del
+servidor en PostgreSQL) y se formatean una a una con los campos de
+``ProductSerializer``, de modo que la memoria del worker no depende del
+tamaño del catálogo.
+"""
+
+import csv
+import json
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+
+from .importers import FORMAT_ALIASES
+from .serializer import ProductSerializer
+
+EXPORT_FORMATS = ("csv", "jsonl")
+# Solo campos del modelo: se leen con .values()
+EXPORT_FIELDS = [f for f in ProductSerializer.Meta.fields if f != "image_srcset"]
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson; charset=utf-8",
+}
+
+
+def get_export_format(value):
+    value = FORMAT_ALIASES.get((value or "csv").lower(), (value or "csv").lower())
+    if value not in EXPORT_FORMATS:
+        raise ValueError(f"Formato no soportado: '{value}'. Usa csv o jsonl.")
+    return value
+
+
+def parse_fields(value):
+    """Lista de campos de ``?fields=a,b`` (todos si viene vacío)."""
+    if not value:
+        return EXPORT_FIELDS
+    fields = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in fields if name not in EXPORT_FIELDS]
+    if unknown:
+        raise ValueError(f"Campos desconocidos: {', '.join(unknown)}.")
+    return fields
+
+
+class Echo:
+    """Buffer que devuelve lo escrito, para usar csv.writer en streaming."""
+
+    def write(self, value):
+        return value
+
+
+class ProductExporter:
+    """
+    Convierte un queryset de productos en líneas de texto. ``request`` solo
+    se usa para construir URLs absolutas de imagen como lo hace la API.
+    """
+
+    def __init__(self, fields=None, fmt="csv", chunk_size=None, request=None):
+        self.fields = fields or EXPORT_FIELDS
+        self.fmt = fmt
+        self.chunk_size = chunk_size or getattr(
+            settings, "PRODUCT_EXPORT_CHUNK_SIZE", 2000)
+        self.request = request
+        serializer_fields = ProductSerializer().fields
+        self.representations = {
+            name: serializer_fields[name].to_representation
+            for name in self.fields if name not in ("image", "owner")
+        }
+
+    def represent(self, name, value):
+        if value is None:
+            return None
+        if name == "image":
+            if not value:
+                return None
+            url = default_storage.url(value)
+            return self.request.build_absolute_uri(url) if self.request else url
+        if name == "owner":
+            return value
+        return self.representations[name](value)
+
+    def rows(self, queryset):
+        values = queryset.order_by("pk").values(*self.fields)
+        for row in values.iterator(chunk_size=self.chunk_size):
+            yield {name: self.represent(name, row[name]) for name in self.fields}
+
+    def lines(self, queryset):
+        if self.fmt == "csv":
+            writer = csv.writer(Echo())
+            yield writer.writerow(self.fields)
+            for row in self.rows(queryset):
+                yield writer.writerow(
+                    ["" if row[name] is None else row[name] for name in self.fields])
+            return
+
+        for row in self.rows(queryset):
+            yield json.dumps(row, ensure_ascii=False) + "\n"
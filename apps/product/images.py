@@ -0,0 +1,123 @@
+"""
+Derivados responsivos de ``Product.image``.
+
+Al guardar una imagen nueva se generan versiones de varios anchos en cada
+formato configurado y se guardan junto al original
+(``foo.png`` -> ``foo__w320.webp``). Las rutas quedan en
+``Product.image_variants`` para construir el ``srcset`` sin tocar el storage.
+Mientras el worker no regenera los derivados de una imagen reemplazada,
+``current_variants`` los descarta y se sirve solo el original.
+"""
+
+import io
+import logging
+import os
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WIDTHS = (160, 320, 640, 1280)
+DEFAULT_FORMATS = ("avif", "webp", "jpeg")
+DEFAULT_QUALITY = {"avif": 50, "webp": 75, "jpeg": 80}
+PIL_FORMATS = {"avif": "AVIF", "webp": "WEBP", "jpeg": "JPEG"}
+EXTENSIONS = {"avif": "avif", "webp": "webp", "jpeg": "jpg"}
+
+
+def get_widths():
+    return sorted(getattr(settings, "PRODUCT_IMAGE_WIDTHS", DEFAULT_WIDTHS))
+
+
+def get_formats():
+    """Formatos configurados que el Pillow instalado sabe escribir."""
+    Image.init()
+    formats = getattr(settings, "PRODUCT_IMAGE_FORMATS", DEFAULT_FORMATS)
+    return [fmt for fmt in formats if PIL_FORMATS[fmt] in Image.SAVE]
+
+
+def variant_name(original, width, fmt):
+    root, _ = os.path.splitext(original)
+    return f"{root}__w{width}.{EXTENSIONS[fmt]}"
+
+
+def target_widths(original_width):
+    """Anchos a generar sin ampliar; si el original es menor, solo su ancho."""
+    widths = [width for width in get_widths() if width < original_width]
+    return widths or [original_width]
+
+
+def encode(image, fmt):
+    if fmt == "jpeg" and image.mode != "RGB":
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    quality = getattr(settings, "PRODUCT_IMAGE_QUALITY", DEFAULT_QUALITY)[fmt]
+    image.save(buffer, PIL_FORMATS[fmt], quality=quality)
+    return buffer.getvalue()
+
+
+def generate_variants(field_file):
+    """
+    Genera y guarda los derivados de ``field_file``. Devuelve
+    ``{"source": nombre, "<formato>": {"<ancho>": nombre}}``.
+    """
+    storage = field_file.storage
+    try:
+        with field_file.open("rb") as handle, Image.open(handle) as opened:
+            image = ImageOps.exif_transpose(opened)
+            image.load()
+    except (OSError, UnidentifiedImageError) as exc:
+        logger.warning("Image variants skipped name=%s error=%s", field_file.name, exc)
+        return {"source": field_file.name}
+
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    variants = {"source": field_file.name}
+    for width in target_widths(image.width):
+        height = max(round(image.height * width / image.width), 1)
+        resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        for fmt in get_formats():
+            name = variant_name(field_file.name, width, fmt)
+            if storage.exists(name):
+                storage.delete(name)
+            saved = storage.save(name, ContentFile(encode(resized, fmt)))
+            variants.setdefault(fmt, {})[str(width)] = saved
+    return variants
+
+
+def current_variants(variants, image_name):
+    """``variants`` si se generaron para ``image_name``; si no, vacío."""
+    if not image_name or variants.get("source") != image_name:
+        return {}
+    return variants
+
+
+def delete_variants(storage, variants):
+    for fmt, names in variants.items():
+        if fmt != "source":
+            for name in names.values():
+                storage.delete(name)
+
+
+def build_srcset(variants, url, build_uri=None):
+    """``{"webp": "url 160w, url 320w", ...}`` a partir de ``image_variants``."""
+    srcset = {}
+    for fmt in PIL_FORMATS:
+        names = variants.get(fmt)
+        if not names:
+            continue
+        entries = []
+        for width, name in sorted(names.items(), key=lambda item: int(item[0])):
+            href = url(name)
+            entries.append(f"{build_uri(href) if build_uri else href} {width}w")
+        srcset[fmt] = ", ".join(entries)
+    return srcset
+
+
+def smallest_variant(variants, fmt="webp"):
+    names = variants.get(fmt) or variants.get("jpeg")
+    if not names:
+        return None
+    return names[min(names, key=int)]
@@ -0,0 +1,185 @@
+"""
+Importación masiva de productos desde CSV o JSONL.
+
+Los archivos se leen fila por fila (sin cargarlos completos en memoria), se
+validan con las mismas reglas de ``ProductSerializer`` y se insertan con
+``bulk_create`` en lotes, cada uno en su propia transacción. Los errores se
+reportan por línea sin abortar el resto del archivo.
+"""
+
+import csv
+import json
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+
+from .cache import bump_catalog_version
+from .models import Product
+from .search import refresh_search_vector
+from .serializer import ProductSerializer
+from .slugs import allocate_slugs, product_base_slug
+
+IMPORT_FORMATS = ("csv", "jsonl")
+FORMAT_ALIASES = {"ndjson": "jsonl", "json": "jsonl"}
+
+
+def detect_format(filename, requested=None):
+    """Formato explícito o deducido de la extensión del archivo."""
+    value = (requested or filename.rsplit(".", 1)[-1]).lower()
+    value = FORMAT_ALIASES.get(value, value)
+    if value not in IMPORT_FORMATS:
+        raise ValueError(
+            f"Formato no soportado: '{value}'. Usa csv o jsonl.")
+    return value
+
+
+def iter_rows(stream, fmt):
+    """
+    Recorre un flujo de texto y produce ``(línea, datos, error)``.
+    CSV usa la primera fila como encabezado; JSONL es un objeto por línea.
+    """
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row, None
+        return
+
+    for number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield number, None, {"non_field_errors": [f"JSON inválido: {exc}"]}
+            continue
+        if not isinstance(row, dict):
+            yield number, None, {"non_field_errors": ["Se esperaba un objeto JSON."]}
+            continue
+        yield number, row, None
+
+
+class ProductImportSerializer(ProductSerializer):
+    """
+    Mismas reglas que ``ProductSerializer`` salvo la unicidad de ``code``,
+    que el importador verifica por lote con una sola consulta.
+    """
+
+    class Meta(ProductSerializer.Meta):
+        fields = [
+            f for f in ProductSerializer.Meta.fields
+            if f not in ("image", "image_srcset")]
+        extra_kwargs = {"code": {"validators": [Product.code_validator]}}
+
+
+class ProductImporter:
+    """
+    Importa filas en lotes de ``batch_size`` asignando ``owner`` a cada
+    producto. ``run`` devuelve un resumen con los errores por línea.
+    """
+
+    def __init__(self, owner, batch_size=None, max_reported_errors=None):
+        self.owner = owner
+        self.batch_size = batch_size or getattr(
+            settings, "PRODUCT_IMPORT_BATCH_SIZE", 500)
+        self.max_reported_errors = max_reported_errors or getattr(
+            settings, "PRODUCT_IMPORT_MAX_REPORTED_ERRORS", 1000)
+        self.total = 0
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+        self.seen_codes = set()
+
+    def add_error(self, line, errors):
+        self.failed += 1
+        if len(self.errors) < self.max_reported_errors:
+            self.errors.append({"line": line, "errors": errors})
+
+    def run(self, rows):
+        batch = []
+        for line, data, error in rows:
+            self.total += 1
+            if error:
+                self.add_error(line, error)
+                continue
+            serializer = ProductImportSerializer(data=data)
+            if not serializer.is_valid():
+                self.add_error(line, serializer.errors)
+                continue
+            batch.append((line, serializer.validated_data))
+            if len(batch) >= self.batch_size:
+                self.flush(batch)
+                batch = []
+        if batch:
+            self.flush(batch)
+        if self.created:
+            bump_catalog_version()
+        return self.summary()
+
+    def flush(self, batch):
+        codes = [data["code"] for _, data in batch]
+        existing = set(
+            Product.objects.filter(code__in=codes).order_by().values_list("code", flat=True))
+
+        lines, products = [], []
+        for line, data in batch:
+            code = data["code"]
+            if code in existing or code in self.seen_codes:
+                self.add_error(
+                    line, {"code": ["Ya existe un producto con este código."]})
+                continue
+            self.seen_codes.add(code)
+            lines.append(line)
+            products.append(Product(owner=self.owner, **data))
+        if not products:
+            return
+
+        slugs = allocate_slugs(
+            [product_base_slug(p.name, p.code) for p in products])
+        for product, slug in zip(products, slugs):
+            product.slug = slug
+
+        try:
+            with transaction.atomic():
+                Product.objects.bulk_create(products)
+                refresh_search_vector(
+                    Product.objects.filter(pk__in=[p.pk for p in products]))
+        except IntegrityError:
+            # Otra escritura concurrente tomó un código o slug: se guarda
+            # fila por fila para aislar solo las que fallan.
+            self.save_one_by_one(lines, products)
+            return
+        self.created += len(products)
+
+    def save_one_by_one(self, lines, products):
+        saved = []
+        for line, product in zip(lines, products):
+            product.pk = None
+            product.slug = ""
+            try:
+                with transaction.atomic():
+                    product.save(refresh_search=False)
+            except IntegrityError as exc:
+                self.add_error(line, {"non_field_errors": [str(exc)]})
+            else:
+                saved.append(product.pk)
+        # Un solo UPDATE para los vectores del lote, como en bulk_create
+        refresh_search_vector(Product.objects.filter(pk__in=saved))
+        self.created += len(saved)
+
+    def summary(self):
+        return {
+            "total": self.total,
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+        }
+
+
+class ProductImportUploadSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(
+        choices=["csv", "jsonl", "ndjson"], required=False)
+    batch_size = serializers.IntegerField(
+        required=False, min_value=1, max_value=5000)
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.product.exporters import ProductExporter, get_export_format, parse_fields
+from apps.product.models import Product
+
+
+class Command(BaseCommand):
+    help = "Exporta el catálogo completo en CSV o JSONL leyendo por lotes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", help="Archivo de salida (por defecto stdout)")
+        parser.add_argument("--format", dest="file_format", default="csv",
+                            choices=["csv", "jsonl", "ndjson"])
+        parser.add_argument("--fields", help="Campos separados por coma")
+        parser.add_argument("--chunk-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        try:
+            fmt = get_export_format(options["file_format"])
+            fields = parse_fields(options["fields"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        exporter = ProductExporter(fields, fmt, chunk_size=options["chunk_size"])
+        lines = exporter.lines(Product.objects.all())
+        if not options["output"]:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        try:
+            with open(options["output"], "w", encoding="utf-8", newline="") as handle:
+                handle.writelines(lines)
+        except OSError as exc:
+            raise CommandError(str(exc))
+        self.stderr.write(f"Catálogo exportado en {options['output']}.")
@@ -0,0 +1,45 @@
+import csv
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.product.importers import ProductImporter, detect_format, iter_rows
+
+
+class Command(BaseCommand):
+    help = "Importa productos desde un archivo CSV o JSONL en lotes con bulk_create."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Ruta del archivo .csv, .jsonl o .ndjson")
+        parser.add_argument("--owner", help="username del propietario de los productos")
+        parser.add_argument("--format", dest="file_format", choices=["csv", "jsonl", "ndjson"])
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        try:
+            fmt = detect_format(options["path"], options["file_format"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        owner = None
+        if options["owner"]:
+            User = get_user_model()
+            try:
+                owner = User.objects.get(username=options["owner"])
+            except User.DoesNotExist:
+                raise CommandError(f"No existe el usuario '{options['owner']}'.")
+
+        importer = ProductImporter(owner, batch_size=options["batch_size"])
+        try:
+            with open(options["path"], encoding="utf-8-sig", newline="") as stream:
+                summary = importer.run(iter_rows(stream, fmt))
+        except OSError as exc:
+            raise CommandError(str(exc))
+        except (UnicodeDecodeError, csv.Error) as exc:
+            raise CommandError(f"Archivo ilegible: {exc}")
+
+        for error in summary["errors"]:
+            self.stderr.write(f"Línea {error['line']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"{summary['created']} creados, {summary['failed']} con errores "
+            f"de {summary['total']} filas."))
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:21
+
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import F, Value
+from django.db.models.functions import Replace
+
+
+def create_search_index(apps, schema_editor):
+    # El índice GIN y el backfill solo aplican a PostgreSQL
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS product_search_vector_gin "
+        "ON product_product USING gin (search_vector)"
+    )
+    Product = apps.get_model("product", "Product")
+    # Copia congelada de apps.product.search.build_search_vector
+    code = Replace(F("code"), Value("-"), Value(" "))
+    Product.objects.using(schema_editor.connection.alias).update(
+        search_vector=(
+            SearchVector("name", weight="A", config="spanish")
+            + SearchVector(code, weight="B", config="simple")
+            + SearchVector("description", weight="C", config="spanish")
+        )
+    )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS product_search_vector_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0002_product_owner"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
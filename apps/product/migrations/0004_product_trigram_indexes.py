@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:48
+
+from django.db import DatabaseError, migrations, transaction
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # Solo PostgreSQL; si pg_trgm no está disponible el autocompletado
+    # usa coincidencias por prefijo (ver apps.product.search)
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError:
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS product_name_trgm "
+        "ON product_product USING gin (name gin_trgm_ops)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS product_code_trgm "
+        "ON product_product USING gin (code gin_trgm_ops)"
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS product_name_trgm")
+    schema_editor.execute("DROP INDEX IF EXISTS product_code_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("product", "0003_product_search_vector"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
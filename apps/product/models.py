@@ -1,7 +1,14 @@
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import RegexValidator
-from django.db import models
-from django.utils.text import slugify
+from django.db import IntegrityError, models, transaction
+from django.db.models.signals import post_delete
+from django.utils import timezone
+
+from apps.jobs.queue import enqueue
+
+from .cache import bump_catalog_version
+from .slugs import format_slug, next_slug_suffix, product_base_slug
 
 User = get_user_model()
 
@@ -39,26 +46,142 @@ class Product(models.Model):
         on_delete=models.CASCADE,
         verbose_name="Creador",
         null=True,
-        blank=True)
+        blank=True,
+        # Lo cubre product_owner_created_idx
+        db_index=False)
+    # Vector de búsqueda precalculado (ver apps.product.search)
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    # Derivados de la imagen por formato y ancho (ver apps.product.images)
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
+
+    SEARCHABLE_FIELDS = {"name", "code", "description"}
+    SLUG_MAX_ATTEMPTS = 5
 
     def __str__(self):
         return f"{self.name} ({self.code})"
 
-    def save(self, *args, **kwargs):
-        if not self.slug:
-            base = slugify(self.name) or self.code
-            slug = base
-            counter = 1
-            while Product.objects.filter(
-                    slug=slug).exclude(
-                    pk=self.pk).exists():
-                slug = f"{base}-{counter}"
-                counter += 1
-            self.slug = slug
-        super().save(*args, **kwargs)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.searched_values = instance.get_searched_values()
+        return instance
+
+    def get_searched_values(self):
+        """Valores cargados de los campos indexados (sin leer los diferidos)."""
+        return {name: self.__dict__[name]
+                for name in self.SEARCHABLE_FIELDS if name in self.__dict__}
+
+    def search_text_changed(self, update_fields=None):
+        """
+        Si hay que recalcular ``search_vector``: producto sin leer de la base o
+        algún campo indexado (de ``update_fields``, si se indica) que cambió.
+        """
+        fields = self.SEARCHABLE_FIELDS
+        if update_fields is not None:
+            fields = fields & set(update_fields)
+        loaded = getattr(self, "searched_values", None)
+        if loaded is None:
+            return bool(fields)
+        current = self.__dict__
+        return any(
+            name in current and (name not in loaded or loaded[name] != current[name])
+            for name in fields)
+
+    def save(self, *args, refresh_search=True, **kwargs):
+        """
+        ``refresh_search=False`` deja el vector sin recalcular para que quien
+        guarda muchos productos lo haga con un solo UPDATE al final.
+        """
+        update_fields = kwargs.get("update_fields")
+        search_changed = self.search_text_changed(update_fields)
+        if self.slug:
+            super().save(*args, **kwargs)
+        else:
+            self.save_with_new_slug(*args, **kwargs)
+
+        if refresh_search and search_changed:
+            from .search import refresh_search_vector
+
+            refresh_search_vector(Product.objects.filter(pk=self.pk))
+        self.searched_values = self.get_searched_values()
+        if update_fields is None or "image" in update_fields:
+            self.schedule_image_variants()
+        bump_catalog_version()
+
+    def image_changed(self):
+        return (self.image.name or "") != self.image_variants.get("source", "")
+
+    def schedule_image_variants(self):
+        """Encola la generación de derivados (ver apps.product.tasks)."""
+        if self.image_changed():
+            enqueue("product.refresh_image_variants", {"pk": self.pk})
+
+    def refresh_image_variants(self):
+        """
+        Regenera los derivados si la imagen cambió desde la última generación.
+        Devuelve True si hubo cambios.
+        """
+        if not self.image_changed():
+            return False
+        current = self.image.name or ""
+        from .images import delete_variants, generate_variants
+
+        delete_variants(self.image.storage, self.image_variants)
+        self.image_variants = generate_variants(self.image) if current else {}
+        # updated_at cambia con el srcset para invalidar ETag y Last-Modified
+        self.updated_at = timezone.now()
+        Product.objects.filter(pk=self.pk).update(
+            image_variants=self.image_variants, updated_at=self.updated_at)
+        return True
+
+    def save_with_new_slug(self, *args, **kwargs):
+        """
+        Asigna el siguiente slug libre con una consulta y, si otra inserción
+        concurrente lo toma primero, reintenta con el siguiente sufijo.
+        """
+        base = product_base_slug(self.name, self.code)
+        suffix = next_slug_suffix(base, self.pk)
+        for _ in range(self.SLUG_MAX_ATTEMPTS):
+            self.slug = format_slug(base, suffix)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                taken = Product.objects.filter(
+                    slug=self.slug).exclude(pk=self.pk).exists()
+                if not taken:
+                    raise
+            suffix = max(next_slug_suffix(base, self.pk), suffix + 1)
+        self.slug = ""
+        raise IntegrityError(f"No se pudo asignar un slug único para '{base}'.")
 
     class Meta:
         verbose_name = "Producto"
         verbose_name_plural = "Productos"
         ordering = ["-created_at"]
+        # Según las consultas de la API; "-id" desempata la paginación por cursor
+        indexes = [
+            # Listado anónimo: is_active=True ORDER BY -created_at
+            models.Index(
+                fields=["is_active", "-created_at", "-id"],
+                name="product_active_created_idx"),
+            # my_products: owner=? ORDER BY -created_at (cubre también el FK)
+            models.Index(
+                fields=["owner", "-created_at", "-id"],
+                name="product_owner_created_idx"),
+            # search_products: rangos de precio sobre productos activos
+            models.Index(
+                fields=["price"], condition=models.Q(is_active=True),
+                name="product_active_price_idx"),
+        ]
+
+
+def invalidate_catalog_on_delete(sender, instance, **kwargs):
+    # Cubre delete() y los borrados en cascada (p. ej. al eliminar el owner)
+    bump_catalog_version()
+    if instance.image_variants:
+        enqueue("product.delete_image_variants", {"variants": instance.image_variants})
+
 
+post_delete.connect(invalidate_catalog_on_delete, sender=Product)
@@ -0,0 +1,167 @@
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class ProductCursorPagination(BasePagination):
+    """
+    Paginación por cursor (keyset) para las colecciones de productos.
+
+    Es opcional: solo se activa si la petición trae ``cursor`` o ``page_size``,
+    de lo contrario los endpoints siguen devolviendo la lista completa.
+    Recorre la tupla (campo de orden, id) con un cursor firmado y opaco, así
+    la página N cuesta lo mismo que la página 1.
+
+    Las búsquedas ordenadas por relevancia (``-rank`` de ``search_catalog``)
+    se paginan por posición: el rank es un cálculo float4 sin columna que
+    sirva de clave, pero el cursor sigue siendo el mismo token opaco.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    default_ordering = "-created_at"
+    ranked_ordering = "-rank"
+    signing_salt = "apps.product.pagination.cursor"
+    invalid_cursor_message = "Cursor inválido."
+
+    def is_requested(self, request):
+        params = request.query_params
+        return (self.cursor_query_param in params
+                or self.page_size_query_param in params)
+
+    def get_page_size(self, request):
+        default = getattr(settings, "PRODUCT_PAGE_SIZE", 20)
+        maximum = getattr(settings, "PRODUCT_MAX_PAGE_SIZE", 100)
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return default
+        if size <= 0:
+            return default
+        return min(size, maximum)
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Usa el mismo ``OrderingFilter`` de la vista para respetar
+        ``ordering_fields``; solo el primer campo define el recorrido.
+        """
+        for backend in getattr(view, "filter_backends", []):
+            if issubclass(backend, OrderingFilter):
+                ordering = backend().get_ordering(request, queryset, view)
+                if ordering:
+                    return ordering[0]
+        return self.default_ordering
+
+    def is_ranked(self, queryset):
+        return queryset.query.order_by[:1] == (self.ranked_ordering,)
+
+    def encode_cursor(self, item, reverse):
+        field = self.ordering.lstrip("-")
+        value = self.get_value(item, field)
+        value = value.isoformat() if hasattr(value, "isoformat") else str(value)
+        return self.cursor_link({
+            "o": self.ordering, "v": [value, self.get_value(item, "id")], "r": reverse})
+
+    def cursor_link(self, payload):
+        token = signing.dumps(payload, salt=self.signing_salt, compress=True)
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+        try:
+            cursor = signing.loads(token, salt=self.signing_salt)
+        except signing.BadSignature:
+            raise NotFound(self.invalid_cursor_message)
+        if cursor.get("o") != self.ordering:
+            raise NotFound(self.invalid_cursor_message)
+        return cursor
+
+    @staticmethod
+    def get_value(item, field):
+        if isinstance(item, dict):
+            return item[field]
+        return getattr(item, field)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if self.is_ranked(queryset):
+            self.ordering = self.ranked_ordering
+            return self.paginate_by_position(queryset, self.decode_cursor(request))
+        self.offset = None
+        self.ordering = self.get_ordering(request, queryset, view)
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor.get("r"))
+
+        field = self.ordering.lstrip("-")
+        descending = self.ordering.startswith("-") != reverse
+        if descending:
+            queryset = queryset.order_by(f"-{field}", "-id")
+        else:
+            queryset = queryset.order_by(field, "id")
+
+        if cursor:
+            value, pk = cursor["v"]
+            lookup = "lt" if descending else "gt"
+            queryset = queryset.filter(
+                Q(**{f"{field}__{lookup}": value})
+                | Q(**{field: value, f"id__{lookup}": pk})
+            )
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+            self.has_next, self.has_previous = cursor is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.page = results
+        return results
+
+    def paginate_by_position(self, queryset, cursor):
+        """Conserva el orden del queryset y guarda en el cursor la posición."""
+        self.offset = cursor["p"] if cursor else 0
+        results = list(queryset[self.offset: self.offset + self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.has_previous = self.offset > 0
+        self.page = results[: self.page_size]
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        if self.offset is not None:
+            return self.cursor_link(
+                {"o": self.ordering, "p": self.offset + len(self.page)})
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.offset is not None and self.offset > self.page_size:
+            return self.cursor_link(
+                {"o": self.ordering, "p": self.offset - self.page_size})
+        if self.offset is not None or not self.page:
+            url = self.request.build_absolute_uri()
+            return remove_query_param(url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
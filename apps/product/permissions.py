@@ -0,0 +1,22 @@
+from rest_framework import permissions
+
+
+class IsOwnerOrStaff(permissions.BasePermission):
+    """
+    Permiso de objeto: lectura libre; editar o eliminar solo el propietario
+    o staff. Compara ``owner_id`` para no consultar el usuario propietario.
+    """
+
+    messages = {
+        "DELETE": "No puedes eliminar productos de otros usuarios.",
+    }
+    default_message = "No puedes actualizar productos de otros usuarios."
+
+    def has_object_permission(self, request, view, obj):
+        if request.method in permissions.SAFE_METHODS:
+            return True
+        user = request.user
+        if user.is_staff or (obj.owner_id is not None and obj.owner_id == user.pk):
+            return True
+        self.message = self.messages.get(request.method, self.default_message)
+        return False
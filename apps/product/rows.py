@@ -0,0 +1,120 @@
+"""
+Serialización rápida, de solo lectura, para los listados de productos.
+
+``ProductSerializer(many=True)`` instancia un modelo por fila y recorre los
+campos DRF uno a uno; con miles de filas ese es el costo dominante de la
+petición. ``ProductRowSerializer`` lee dicts de ``.values()`` y arma cada
+producto con conversores resueltos una sola vez por petición, con la misma
+salida que ``ProductSerializer`` (lo comprueba test_product_rows.py).
+"""
+
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from .images import build_srcset, current_variants
+from .models import Product
+from .serializer import ProductSerializer
+
+# Campos cuyo valor de .values() ya es su representación
+IDENTITY_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+class ProductRowSerializer:
+    """
+    ``serialize(rows)`` convierte filas de ``queryset.values(*columns)`` en
+    la representación de ``serializer_class`` limitada a ``fields``.
+    """
+
+    def __init__(self, serializer_class=ProductSerializer, fields=None, request=None):
+        serializer = serializer_class(fields=fields, context={"request": request})
+        self.storage = Product._meta.get_field("image").storage
+        self.build_uri = request.build_absolute_uri if request is not None else None
+        self.converters = [
+            (name, self.get_converter(name, field))
+            for name, field in serializer.fields.items()
+        ]
+        self.columns = serializer_class.columns_for(serializer.fields)
+
+    def serialize(self, rows):
+        converters = self.converters
+        return [{name: convert(row) for name, convert in converters} for row in rows]
+
+    def get_converter(self, name, field):
+        if name == "image_srcset":
+            return self.srcset
+        if isinstance(field, serializers.SerializerMethodField):
+            raise TypeError(f"Campo calculado sin conversor de filas: {name}")
+        if isinstance(field, serializers.FileField):
+            return self.file_converter(name, field)
+        if isinstance(field, serializers.DecimalField):
+            convert = self.decimal_converter(field)
+        elif isinstance(field, serializers.DateTimeField):
+            convert = self.datetime_converter(field)
+        elif isinstance(field, IDENTITY_FIELDS):
+            convert = None
+        else:
+            convert = field.to_representation
+
+        # Como Serializer.to_representation: None no pasa por el campo
+        if convert is None:
+            return lambda row: row[name]
+        return lambda row: None if (value := row[name]) is None else convert(value)
+
+    @staticmethod
+    def decimal_converter(field):
+        """Decimales de PostgreSQL que ya traen la escala del campo se formatean directo."""
+        coerce_to_string = getattr(
+            field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+        if (not coerce_to_string or field.localize or field.normalize_output
+                or field.decimal_places is None):
+            return field.to_representation
+        exponent = -field.decimal_places
+
+        def convert(value):
+            if value.as_tuple().exponent == exponent:
+                return format(value, "f")
+            return field.to_representation(value)
+
+        return convert
+
+    @staticmethod
+    def datetime_converter(field):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if output_format is None or output_format.lower() != ISO_8601:
+            return field.to_representation
+        tz = getattr(field, "timezone", None) or field.default_timezone()
+
+        def convert(value):
+            if tz is None or not timezone.is_aware(value):
+                return field.to_representation(value)
+            value = value.astimezone(tz).isoformat()
+            return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+        return convert
+
+    def file_converter(self, name, field):
+        use_url = getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL)
+
+        def convert(row):
+            value = row[name]
+            if not value:
+                return None
+            if not use_url:
+                return value
+            url = self.storage.url(value)
+            return self.build_uri(url) if self.build_uri else url
+
+        return convert
+
+    def srcset(self, row):
+        if not row["image"]:
+            return {}
+        return build_srcset(
+            current_variants(row["image_variants"], row["image"]),
+            self.storage.url, self.build_uri)
@@ -0,0 +1,156 @@
+"""
+Motor de búsqueda de productos.
+
+En PostgreSQL usa un ``tsvector`` precalculado en ``Product.search_vector``
+(nombre > código > descripción) con índice GIN y resultados ordenados por
+relevancia. En otros motores (p. ej. SQLite en pruebas locales) recurre a
+``icontains`` sobre los mismos campos.
+
+El autocompletado usa índices trigram (``pg_trgm``) sobre ``name`` y ``code``
+para tolerar errores de escritura cuando la extensión está instalada.
+"""
+
+import re
+
+from django.conf import settings
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramSimilarity,
+    TrigramWordSimilarity,
+)
+from django.db import connections
+from django.db.models import F, Q, Value
+from django.db.models.functions import Greatest, Replace
+from rest_framework import filters
+
+SEARCH_FIELDS = ["name", "code", "description"]
+AUTOCOMPLETE_FIELDS = ["id", "slug", "name", "code"]
+AUTOCOMPLETE_MIN_LENGTH = 2
+
+_trigram_support = {}
+
+
+def is_postgres(using="default"):
+    return connections[using].vendor == "postgresql"
+
+
+def has_trigram_support(using="default"):
+    """Indica (y recuerda por alias) si ``pg_trgm`` está instalada."""
+    if using not in _trigram_support:
+        supported = False
+        if is_postgres(using):
+            with connections[using].cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                supported = cursor.fetchone() is not None
+        _trigram_support[using] = supported
+    return _trigram_support[using]
+
+
+def get_search_config():
+    return getattr(settings, "PRODUCT_SEARCH_CONFIG", "spanish")
+
+
+def build_search_vector():
+    """
+    Vector ponderado: nombre (A), código (B) y descripción (C).
+    El código se indexa sin guiones para que "PROD-001" coincida por partes.
+    """
+    config = get_search_config()
+    code = Replace(F("code"), Value("-"), Value(" "))
+    return (
+        SearchVector("name", weight="A", config=config)
+        + SearchVector(code, weight="B", config="simple")
+        + SearchVector("description", weight="C", config=config)
+    )
+
+
+def refresh_search_vector(queryset):
+    """Recalcula el vector de búsqueda de los productos con un solo UPDATE."""
+    if not is_postgres(queryset.db):
+        return 0
+    return queryset.update(search_vector=build_search_vector())
+
+
+def build_search_query(term):
+    """
+    Convierte el texto del usuario en un ``tsquery`` por prefijos, de modo que
+    "lapt" encuentre "Laptop". Devuelve None si no hay palabras utilizables.
+    """
+    words = re.findall(r"\w+", term.lower())
+    if not words:
+        return None
+    raw = " & ".join(f"{word}:*" for word in words)
+    config = get_search_config()
+    return (SearchQuery(raw, search_type="raw", config=config)
+            | SearchQuery(raw, search_type="raw", config="simple"))
+
+
+def search_catalog(queryset, term, rank=True):
+    """
+    Filtra ``queryset`` por ``term``. Con ``rank=True`` ordena por relevancia
+    (y luego por fecha de creación); si no, conserva el orden existente.
+    """
+    term = (term or "").strip()
+    if not term:
+        return queryset
+
+    if not is_postgres(queryset.db):
+        condition = Q()
+        for field in SEARCH_FIELDS:
+            condition |= Q(**{f"{field}__icontains": term})
+        return queryset.filter(condition)
+
+    query = build_search_query(term)
+    if query is None:
+        return queryset.none()
+    queryset = queryset.filter(search_vector=query)
+    if rank:
+        queryset = queryset.annotate(
+            rank=SearchRank(F("search_vector"), query)
+        ).order_by("-rank", "-created_at", "-id")
+    return queryset
+
+
+class ProductSearchFilter(filters.SearchFilter):
+    """
+    ``SearchFilter`` de DRF respaldado por el motor de búsqueda de productos.
+    Solo ordena por relevancia cuando no se pide un ``?ordering=`` explícito.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = " ".join(self.get_search_terms(request))
+        rank = filters.OrderingFilter.ordering_param not in request.query_params
+        return search_catalog(queryset, terms, rank=rank)
+
+
+def autocomplete_products(queryset, term, limit):
+    """
+    Sugerencias ligeras para el buscador: solo ``id``, ``slug``, ``name`` y
+    ``code``, como máximo ``limit`` filas. Con ``pg_trgm`` tolera errores de
+    escritura; sin la extensión usa coincidencias por prefijo/contenido.
+    """
+    term = (term or "").strip()
+    if len(term) < AUTOCOMPLETE_MIN_LENGTH:
+        return []
+
+    # Los códigos siempre se guardan en mayúsculas (ver validate_code)
+    code = term.upper()
+    if has_trigram_support(queryset.db):
+        queryset = queryset.filter(
+            Q(name__trigram_word_similar=term)
+            | Q(code__startswith=code)
+            | Q(code__trigram_similar=code)
+        ).annotate(
+            similarity=Greatest(
+                TrigramWordSimilarity(term, "name"),
+                TrigramSimilarity("code", code),
+            )
+        ).order_by("-similarity", "name")
+    else:
+        queryset = queryset.filter(
+            Q(name__icontains=term) | Q(code__startswith=code)
+        ).order_by("name")
+    return list(queryset.values(*AUTOCOMPLETE_FIELDS)[:limit])
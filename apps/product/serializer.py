@@ -1,9 +1,65 @@
 from rest_framework import serializers
 
+from .images import build_srcset, current_variants
 from .models import Product
 
 
-class ProductSerializer(serializers.ModelSerializer):
+TRUE_VALUES = ("1", "true", "yes")
+
+
+def select_fields(params, available):
+    """
+    Campos pedidos con ``?fields=a,b`` y/o ``?omit=c`` en el orden de
+    ``available``; None si no se pidió ninguno de los dos.
+    """
+    requested = {}
+    for param in ("fields", "omit"):
+        value = params.get(param)
+        if value is not None:
+            requested[param] = [name.strip() for name in value.split(",") if name.strip()]
+    if not requested:
+        return None
+    unknown = [
+        name for names in requested.values() for name in names if name not in available]
+    if unknown:
+        raise serializers.ValidationError(
+            {"fields": [f"Campos desconocidos: {', '.join(unknown)}."]})
+    fields = requested.get("fields") or available
+    return [name for name in available if name in fields and name not in requested.get("omit", ())]
+
+
+def is_compact(params):
+    """True con ``?compact=true``: representación reducida para grillas."""
+    return params.get("compact", "").lower() in TRUE_VALUES
+
+
+class SparseFieldsMixin:
+    """
+    Acepta ``fields=[...]`` para serializar solo esos campos. ``columns_for``
+    indica qué columnas del modelo pedir con ``.only()`` para ellos.
+    """
+
+    # Columnas que necesitan los campos calculados
+    field_columns = {}
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def columns_for(cls, fields):
+        columns = set()
+        for name in fields:
+            columns.update(cls.field_columns.get(name, (name,)))
+        return columns
+
+
+class ProductSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    field_columns = {"image_srcset": ("image", "image_variants")}
+    image_srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = Product
         fields = [
@@ -14,6 +70,7 @@ class ProductSerializer(serializers.ModelSerializer):
             "description",
             "comment",
             "image",
+            "image_srcset",
             "price",
             "stock",
             "is_active",
@@ -23,8 +80,24 @@ class ProductSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "slug", "created_at", "updated_at", "owner"]
 
+    def get_image_srcset(self, obj):
+        """Derivados por formato como atributo srcset ("url 320w, ...")."""
+        if not obj.image:
+            return {}
+        request = self.context.get("request")
+        return build_srcset(
+            current_variants(obj.image_variants, obj.image.name), obj.image.storage.url,
+            request.build_absolute_uri if request else None)
+
     def validate_code(self, value):
         if value is None:
             raise serializers.ValidationError("El código es obligatorio.")
         # normaliza: elimina espacios y convierte a mayúsculas
         return value.strip().upper()
+
+
+class ProductListSerializer(ProductSerializer):
+    """Versión compacta para listados (``?compact=true``): sin textos largos."""
+
+    class Meta(ProductSerializer.Meta):
+        fields = ["id", "name", "slug", "image", "image_srcset", "price"]
@@ -0,0 +1,96 @@
+"""
+Asignación de slugs únicos para productos.
+
+En lugar de probar ``base``, ``base-1``, ``base-2``... con una consulta por
+sufijo, se busca el mayor sufijo ya usado con una sola consulta sobre el
+índice de ``slug`` y se toma el siguiente.
+"""
+
+import re
+
+from django.db.models import Q
+from django.db.models.functions import Length
+from django.utils.text import slugify
+
+
+def product_base_slug(name, code):
+    return slugify(name) or code
+
+
+def format_slug(base, suffix):
+    return base if suffix == 0 else f"{base}-{suffix}"
+
+
+def parse_suffix(base, slug):
+    """Sufijo numérico de ``slug`` respecto a ``base`` (0 para la base)."""
+    return 0 if slug == base else int(slug[len(base) + 1:])
+
+
+def taken_slugs(queryset, base):
+    """Slugs de la forma ``base`` o ``base-<n>`` dentro de ``queryset``."""
+    return queryset.filter(
+        slug__startswith=base,
+        slug__regex=rf"^{re.escape(base)}(-[0-9]+)?$",
+    )
+
+
+def next_slug_suffix(base, exclude_pk=None):
+    """
+    Siguiente sufijo libre para ``base``: 0 si la base está libre, o el mayor
+    sufijo usado + 1. El más largo (y luego el mayor) es el sufijo más alto.
+    """
+    from .models import Product
+
+    queryset = taken_slugs(Product.objects.all(), base)
+    if exclude_pk is not None:
+        queryset = queryset.exclude(pk=exclude_pk)
+    last = (
+        queryset.annotate(length=Length("slug"))
+        .order_by("-length", "-slug")
+        .values_list("slug", flat=True)
+        .first()
+    )
+    if last is None:
+        return 0
+    return parse_suffix(base, last) + 1
+
+
+def allocate_slugs(bases):
+    """
+    Reserva en memoria un slug único por cada base de ``bases`` (en orden)
+    con una sola consulta, para las importaciones masivas con bulk_create.
+    """
+    from .models import Product
+
+    unique = set(bases)
+    if not unique:
+        return []
+
+    condition = Q()
+    for base in unique:
+        condition |= Q(slug__startswith=base)
+    pattern = "^(%s)(-[0-9]+)?$" % "|".join(re.escape(base) for base in unique)
+    existing = Product.objects.filter(condition, slug__regex=pattern)
+
+    # Un slug como "camiseta-1" puede ser la base "camiseta-1" y también el
+    # sufijo 1 de "camiseta"; se cuenta para ambas.
+    next_suffix = {}
+    used = set()
+    for slug in existing.order_by().values_list("slug", flat=True):
+        used.add(slug)
+        if slug in unique:
+            next_suffix[slug] = max(next_suffix.get(slug, 0), 1)
+        prefix, _, digits = slug.rpartition("-")
+        if digits.isdigit() and prefix in unique:
+            next_suffix[prefix] = max(next_suffix.get(prefix, 0), int(digits) + 1)
+
+    slugs = []
+    for base in bases:
+        suffix = next_suffix.get(base, 0)
+        while format_slug(base, suffix) in used:
+            suffix += 1
+        slug = format_slug(base, suffix)
+        next_suffix[base] = suffix + 1
+        used.add(slug)
+        slugs.append(slug)
+    return slugs
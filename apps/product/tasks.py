@@ -0,0 +1,21 @@
+from apps.jobs.queue import task
+
+from .cache import bump_catalog_version
+from .images import delete_variants
+from .models import Product
+
+
+@task("product.refresh_image_variants")
+def refresh_image_variants(pk):
+    """Genera los derivados de la imagen fuera de la petición."""
+    product = Product.objects.filter(pk=pk).first()
+    if product is None:
+        return  # borrado antes de procesar la tarea
+    if product.refresh_image_variants():
+        bump_catalog_version()
+
+
+@task("product.delete_image_variants")
+def delete_image_variants(variants):
+    """Borra los derivados de un producto eliminado."""
+    delete_variants(Product._meta.get_field("image").storage, variants)
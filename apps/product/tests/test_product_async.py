@@ -0,0 +1,177 @@
+import asyncio
+import threading
+from unittest import mock
+
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.core.cache import cache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections
+from django.http import HttpResponse
+from django.test import AsyncClient, RequestFactory, TestCase, override_settings
+from django.urls import path
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.product import async_views
+from apps.product.models import Product
+from apps.user.models import User
+from l_atelier.metrics import RequestMetricsMiddleware
+
+# Rutas de productos como quedan con ASGI_MODE=True
+urlpatterns = [
+    path("api/products/", async_views.as_async_view(
+        {"get": "list", "post": "create"},
+        async_views.list_products, async_views.LIST_PARAMS)),
+    path("api/products/search_products/", async_views.as_async_view(
+        {"get": "search_products"},
+        async_views.search_products, async_views.SEARCH_PARAMS)),
+    path("api/products/<int:pk>/", async_views.as_async_view(
+        {"get": "retrieve"}, async_views.retrieve_product, async_views.DETAIL_PARAMS)),
+    path("api/products/<slug:slug>/", async_views.as_async_view(
+        {"get": "retrieve"}, async_views.retrieve_product, async_views.DETAIL_PARAMS)),
+]
+
+
+class AsyncProductViewsTest(TestCase):
+    """Pruebas para las vistas asíncronas de lectura de productos"""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username="asincrono",
+            first_name="Asin",
+            last_name="Crono",
+            email="asincrono@example.com",
+            dni="7897897897",
+            phone_number="3007897897",
+            password="asincrono123",
+            role=User.VENDEDOR,
+        )
+        self.product = Product.objects.create(
+            code="ASY-1", name="Camiseta asíncrona", price=25, owner=self.owner)
+        Product.objects.create(
+            code="ASY-2", name="Camiseta oculta", price=30, is_active=False,
+            owner=self.owner)
+        self.sync_client = APIClient()
+
+    async def get_async(self, url, **extra):
+        with self.settings(ROOT_URLCONF=__name__):
+            return await AsyncClient().get(url, **extra)
+
+    async def get_sync(self, url, **extra):
+        return await sync_to_async(self.sync_client.get)(url, **extra)
+
+    async def test_respuestas_iguales_a_las_sincronas(self):
+        """Verifica que listado, búsqueda y detalle devuelven el mismo cuerpo y ETag"""
+        urls = [
+            "/api/products/",
+            "/api/products/?ordering=price",
+            "/api/products/search_products/?q=camiseta&max_price=100",
+            f"/api/products/{self.product.slug}/",
+            f"/api/products/{self.product.pk}/",
+            "/api/products/?compact=true",
+            "/api/products/search_products/?q=camiseta&fields=name,price",
+            f"/api/products/{self.product.slug}/?omit=description,comment",
+        ]
+        for url in urls:
+            await sync_to_async(cache.clear)()
+            async_response = await self.get_async(url)
+            await sync_to_async(cache.clear)()
+            sync_response = await self.get_sync(url)
+
+            self.assertEqual(async_response.status_code, 200, url)
+            self.assertEqual(async_response.content, sync_response.content, url)
+            self.assertEqual(async_response["ETag"], sync_response["ETag"], url)
+            self.assertEqual(async_response["Content-Type"], sync_response["Content-Type"])
+
+    @override_settings(PRODUCT_CACHE={"ENABLED": True})
+    async def test_comparte_cache_con_la_vista_sincrona(self):
+        """Verifica que la vista asíncrona sirve la entrada cacheada por la síncrona"""
+        first = await self.get_sync("/api/products/")
+        second = await self.get_async("/api/products/")
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+
+    async def test_get_condicional_responde_304(self):
+        """Verifica que un ETag vigente responde 304 sin cuerpo"""
+        url = f"/api/products/{self.product.slug}/"
+        etag = (await self.get_async(url))["ETag"]
+
+        response = await self.get_async(url, headers={"if-none-match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    async def test_producto_inexistente_da_404(self):
+        """Verifica que el detalle asíncrono responde 404 como el síncrono"""
+        response = await self.get_async("/api/products/no-existe/")
+
+        self.assertEqual(response.status_code, 404)
+
+    async def test_delega_en_la_vista_sincrona(self):
+        """Verifica que autenticados y paginación se atienden con el ViewSet síncrono"""
+        token = await sync_to_async(AccessToken.for_user)(self.owner)
+        response = await self.get_async(
+            "/api/products/", headers={"authorization": f"Bearer {token}"})
+        self.assertEqual(len(response.json()), 2)
+
+        response = await self.get_async("/api/products/?page_size=1")
+        self.assertEqual(len(response.json()["results"]), 1)
+        self.assertIn("next", response.json())
+
+    @override_settings(REQUEST_METRICS={"ENABLED": True, "SAMPLE_RATE": 1.0, "SERVER_TIMING": True})
+    async def test_middleware_asincrono_mide_la_peticion(self):
+        """Verifica que las métricas cuentan las consultas hechas con el ORM asíncrono"""
+        # Con If-None-Match: la consulta agregada del ETag y la de las filas
+        response = await self.get_async(
+            "/api/products/search_products/?q=camiseta",
+            headers={"if-none-match": '"viejo"'})
+
+        self.assertIn('"2 queries"', response["Server-Timing"])
+
+    @override_settings(PRODUCT_CACHE={"ENABLED": True})
+    async def test_miss_asincrono_guarda_con_aset(self):
+        """Verifica que la entrada se guarda con aset y no con set desde el event loop"""
+        loop_thread = threading.current_thread()
+        set_threads, aset_keys = [], []
+        original_set, original_aset = LocMemCache.set, LocMemCache.aset
+
+        def tracked_set(backend, key, *args, **kwargs):
+            set_threads.append(threading.current_thread())
+            return original_set(backend, key, *args, **kwargs)
+
+        async def tracked_aset(backend, key, *args, **kwargs):
+            aset_keys.append(key)
+            return await original_aset(backend, key, *args, **kwargs)
+
+        with mock.patch.object(LocMemCache, "set", tracked_set), \
+                mock.patch.object(LocMemCache, "aset", tracked_aset):
+            first = await self.get_async("/api/products/")
+        second = await self.get_async("/api/products/")
+
+        self.assertEqual((first["X-Cache"], second["X-Cache"]), ("MISS", "HIT"))
+        self.assertTrue(any(key.startswith("product:v") for key in aset_keys))
+        self.assertNotIn(loop_thread, set_threads)
+
+    @override_settings(REQUEST_METRICS={"ENABLED": True, "SAMPLE_RATE": 1.0, "SERVER_TIMING": True})
+    def test_metricas_en_el_hilo_thread_sensitive(self):
+        """Verifica que se cuentan las consultas hechas desde el hilo thread-sensitive de la petición"""
+        async def get_response(request):
+            total = await Product.objects.acount()
+            # Conexión propia del hilo de la petición (fuera de la transacción de la prueba)
+            await sync_to_async(connections.close_all)()
+            return HttpResponse(str(total))
+
+        async def handle():
+            # Como ASGIHandler bajo uvicorn: event loop sin async_to_sync externo
+            async with ThreadSensitiveContext():
+                return await middleware(RequestFactory().get("/api/products/"))
+
+        middleware = RequestMetricsMiddleware(get_response)
+        responses = []
+        thread = threading.Thread(target=lambda: responses.append(asyncio.run(handle())))
+        thread.start()
+        thread.join()
+
+        self.assertIn('"1 queries"', responses[0]["Server-Timing"])
@@ -0,0 +1,107 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.user.models import User
+from apps.product.cache import get_catalog_version
+from apps.product.models import Product
+
+
+@override_settings(PRODUCT_CACHE={"ENABLED": True})
+class ProductResponseCacheTest(TestCase):
+    """Pruebas para la caché de lectura de productos"""
+
+    def setUp(self):
+        cache.clear()
+        self.owner_user = User.objects.create_user(
+            username="vendedor",
+            first_name="Vendedor",
+            last_name="Test",
+            email="vendedor@example.com",
+            dni="9876543210",
+            phone_number="3009876543",
+            password="vendedor123",
+            role=User.VENDEDOR,
+        )
+        self.product = Product.objects.create(
+            code="CACHE001",
+            name="Producto Cacheado",
+            price=100.00,
+            owner=self.owner_user,
+        )
+        self.client = APIClient()
+
+    def test_segunda_lectura_anonima_no_consulta_la_base(self):
+        """Verifica que un acierto de caché no ejecuta consultas"""
+        first = self.client.get("/api/products/")
+
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/products/")
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.data, second.data)
+
+    def test_retrieve_se_cachea(self):
+        """Verifica que el detalle por slug se sirve desde la caché"""
+        url = f"/api/products/{self.product.slug}/"
+        self.client.get(url)
+
+        response = self.client.get(url)
+
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(response.data["code"], "CACHE001")
+
+    def test_guardar_producto_invalida_la_cache(self):
+        """Verifica que Product.save incrementa la versión del catálogo"""
+        version = get_catalog_version()
+        self.client.get("/api/products/")
+
+        self.product.name = "Nombre Nuevo"
+        self.product.save()
+        response = self.client.get("/api/products/")
+
+        self.assertGreater(get_catalog_version(), version)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data[0]["name"], "Nombre Nuevo")
+
+    def test_eliminar_producto_invalida_la_cache(self):
+        """Verifica que borrar un producto deja la caché obsoleta"""
+        self.client.get("/api/products/")
+
+        self.product.delete()
+        response = self.client.get("/api/products/")
+
+        self.assertEqual(response.data, [])
+
+    def test_anonimos_y_autenticados_no_comparten_entradas(self):
+        """Verifica que la clave depende del tipo de usuario"""
+        Product.objects.create(
+            code="HIDDEN001", name="Inactivo", price=1, is_active=False)
+        anonymous = self.client.get("/api/products/")
+
+        self.client.force_authenticate(user=self.owner_user)
+        authenticated = self.client.get("/api/products/")
+
+        self.assertEqual(authenticated["X-Cache"], "MISS")
+        self.assertEqual(len(anonymous.data), 1)
+        self.assertEqual(len(authenticated.data), 2)
+
+    def test_parametros_distintos_usan_claves_distintas(self):
+        """Verifica que los query params forman parte de la clave"""
+        self.client.get("/api/products/?ordering=price")
+
+        response = self.client.get("/api/products/?ordering=-price")
+
+        self.assertEqual(response["X-Cache"], "MISS")
+
+    @override_settings(PRODUCT_CACHE={"ENABLED": False})
+    def test_cache_deshabilitada(self):
+        """Verifica que con ENABLED=False no se usa la caché"""
+        self.client.get("/api/products/")
+
+        response = self.client.get("/api/products/")
+
+        self.assertNotIn("X-Cache", response)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
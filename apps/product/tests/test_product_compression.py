@@ -0,0 +1,135 @@
+import gzip
+from unittest import mock, skipIf
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.product.models import Product
+from apps.user.models import User
+from l_atelier import compression
+from l_atelier.compression import brotli, compress, negotiate_encoding, zstandard
+
+
+class NegotiateEncodingTest(SimpleTestCase):
+    """Pruebas para la negociación de Accept-Encoding"""
+
+    def negotiate(self, header):
+        return negotiate_encoding(RequestFactory().get("/", HTTP_ACCEPT_ENCODING=header))
+
+    def test_respeta_q_y_preferencia_del_servidor(self):
+        """Verifica q-values, q=0, comodín y sin cabecera"""
+        self.assertEqual(self.negotiate("gzip"), "gzip")
+        self.assertEqual(self.negotiate("gzip;q=1, deflate;q=0.9, x;q=0.5"), "gzip")
+        self.assertIsNone(self.negotiate("gzip;q=0"))
+        self.assertIsNone(self.negotiate("identity"))
+        self.assertIsNone(self.negotiate(""))
+        with mock.patch.object(compression, "brotli", None), \
+                mock.patch.object(compression, "zstandard", None):
+            self.assertEqual(self.negotiate("br, zstd, *;q=0.1"), "gzip")
+
+    @skipIf(brotli is None or zstandard is None, "brotli/zstandard no instalados")
+    def test_prefiere_zstd_y_brotli(self):
+        """Verifica zstd > br > gzip con el mismo q y que un q mayor gana"""
+        self.assertEqual(self.negotiate("gzip, deflate, br, zstd"), "zstd")
+        self.assertEqual(self.negotiate("gzip, br"), "br")
+        self.assertEqual(self.negotiate("gzip, br;q=0.5"), "gzip")
+
+
+class ProductCompressionTest(TestCase):
+    """Pruebas para la compresión de respuestas y la caché precomprimida"""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username="vendedor",
+            email="vendedor@example.com",
+            dni="9876543210",
+            phone_number="3009876543",
+            password="vendedor123",
+            role=User.VENDEDOR,
+        )
+        for index in range(20):
+            Product.objects.create(
+                code=f"GZ-{index}",
+                name=f"Camisa comprimida {index}",
+                description="Algodón peinado, manga larga. " * 5,
+                price=100 + index,
+                stock=5,
+                owner=self.owner,
+            )
+        self.client = APIClient()
+
+    def test_listado_con_gzip(self):
+        """Verifica cuerpo gzip idéntico al original, Vary y ETag débil"""
+        plain = self.client.get("/api/products/")
+        cache.clear()
+        response = self.client.get("/api/products/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(response["ETag"], "W/" + plain["ETag"])
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+        self.assertLess(len(response.content), len(plain.content))
+
+    def test_respuestas_pequenas_sin_comprimir(self):
+        """Verifica que no se comprime por debajo de MIN_SIZE ni el login"""
+        product = Product.objects.first()
+        with self.settings(API_COMPRESSION={"MIN_SIZE": 100_000}):
+            response = self.client.get(
+                f"/api/products/{product.slug}/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+        with self.settings(API_COMPRESSION={"MIN_SIZE": 10}):
+            response = self.client.post(
+                "/api/auth/login/", {"username": "vendedor", "password": "vendedor123"},
+                format="json", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @override_settings(PRODUCT_CACHE={"ENABLED": True})
+    def test_acierto_de_cache_no_recomprime(self):
+        """Verifica que la caché guarda los bytes comprimidos y los reutiliza"""
+        with mock.patch.object(compression, "compress", wraps=compress) as spy, \
+                mock.patch("apps.product.cache.compress", wraps=compress) as cache_spy:
+            first = self.client.get("/api/products/", HTTP_ACCEPT_ENCODING="gzip")
+            second = self.client.get("/api/products/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual((first["X-Cache"], second["X-Cache"]), ("MISS", "HIT"))
+        self.assertEqual(cache_spy.call_count, 1)
+        spy.assert_not_called()
+        self.assertEqual(second["Content-Encoding"], "gzip")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+        # Sin compresión el acierto sirve los bytes renderizados
+        plain = self.client.get("/api/products/")
+        self.assertEqual(plain["X-Cache"], "HIT")
+        self.assertFalse(plain.has_header("Content-Encoding"))
+        self.assertEqual(plain.content, gzip.decompress(first.content))
+
+    @skipIf(brotli is None, "brotli no instalado")
+    @override_settings(PRODUCT_CACHE={"ENABLED": True})
+    def test_nueva_codificacion_se_agrega_a_la_entrada(self):
+        """Verifica que otra codificación se comprime una sola vez y queda guardada"""
+        self.client.get("/api/products/", HTTP_ACCEPT_ENCODING="gzip")
+        with mock.patch("apps.product.cache.compress", wraps=compress) as cache_spy:
+            first = self.client.get("/api/products/", HTTP_ACCEPT_ENCODING="br")
+            second = self.client.get("/api/products/", HTTP_ACCEPT_ENCODING="br")
+        self.assertEqual(cache_spy.call_count, 1)
+        self.assertEqual((first["X-Cache"], second["X-Cache"]), ("HIT", "HIT"))
+        self.assertEqual(second["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(second.content), brotli.decompress(first.content))
+
+    def test_if_match_acepta_etag_debilitado(self):
+        """Verifica que el ETag W/ recibido con compresión sirve para If-Match"""
+        product = Product.objects.first()
+        url = f"/api/products/{product.slug}/"
+        with self.settings(API_COMPRESSION={"MIN_SIZE": 100}):
+            etag = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+        self.assertTrue(etag.startswith("W/"))
+
+        self.client.force_authenticate(self.owner)
+        response = self.client.patch(url, {"stock": 9}, format="json", HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.patch(url, {"stock": 8}, format="json", HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 412)
@@ -0,0 +1,162 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.user.models import User
+from apps.product.models import Product
+
+
+class ProductConditionalRequestTest(TestCase):
+    """Pruebas para ETag / Last-Modified / 304 e If-Match en productos"""
+
+    def setUp(self):
+        cache.clear()
+        self.owner_user = User.objects.create_user(
+            username="vendedor",
+            first_name="Vendedor",
+            last_name="Test",
+            email="vendedor@example.com",
+            dni="9876543210",
+            phone_number="3009876543",
+            password="vendedor123",
+            role=User.VENDEDOR,
+        )
+        self.product = Product.objects.create(
+            code="ETAG001",
+            name="Producto Etiquetado",
+            description="Texto largo",
+            price=100.00,
+            owner=self.owner_user,
+        )
+        self.url = f"/api/products/{self.product.slug}/"
+        self.client = APIClient()
+
+    def test_retrieve_incluye_validadores(self):
+        """Verifica que el detalle incluye ETag fuerte y Last-Modified"""
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+
+    def test_retrieve_if_none_match_devuelve_304(self):
+        """Verifica que un ETag vigente devuelve 304 sin cuerpo"""
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+    @override_settings(PRODUCT_CACHE={"ENABLED": True})
+    def test_retrieve_304_desde_cache_sin_consultas(self):
+        """Verifica que el 304 se resuelve desde la caché sin consultas"""
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_if_modified_since(self):
+        """Verifica que If-Modified-Since con la fecha actual devuelve 304"""
+        last_modified = self.client.get(self.url)["Last-Modified"]
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_cambia_etag_al_actualizar(self):
+        """Verifica que modificar el producto invalida el ETag"""
+        etag = self.client.get(self.url)["ETag"]
+        self.product.price = 120
+        self.product.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_if_none_match_devuelve_304(self):
+        """Verifica el 304 en el listado usando el ETag agregado"""
+        etag = self.client.get("/api/products/")["ETag"]
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/products/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_list_borrado_cambia_etag(self):
+        """Verifica que borrar un producto cambia el ETag de la colección"""
+        Product.objects.create(code="ETAG002", name="Otro", price=1)
+        etag = self.client.get("/api/products/")["ETag"]
+        self.product.delete()
+
+        response = self.client.get("/api/products/", HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_search_y_my_products_soportan_304(self):
+        """Verifica el GET condicional en search_products y my_products"""
+        self.client.force_authenticate(user=self.owner_user)
+        for url in ("/api/products/search_products/?q=etiquetado",
+                    "/api/products/my_products/"):
+            etag = self.client.get(url)["ETag"]
+
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_retrieve_etag_distinto_por_seleccion_de_campos(self):
+        """Verifica que ?fields= / ?omit= cambian el ETag y que el orden no importa"""
+        full = self.client.get(self.url)["ETag"]
+        sparse = self.client.get(f"{self.url}?fields=name,code")["ETag"]
+
+        self.assertNotEqual(sparse, full)
+        self.assertEqual(self.client.get(f"{self.url}?fields=code,name")["ETag"], sparse)
+        self.assertNotEqual(self.client.get(f"{self.url}?omit=description")["ETag"], full)
+        response = self.client.get(f"{self.url}?fields=name", HTTP_IF_NONE_MATCH=full)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_list_sin_if_none_match_no_consulta_el_agregado(self):
+        """Verifica que sin If-None-Match el ETag sale de las filas, sin consulta agregada"""
+        for fast in (True, False):
+            with self.subTest(fast=fast), override_settings(PRODUCT_FAST_SERIALIZER=fast):
+                cache.clear()
+                with CaptureQueriesContext(connection) as queries:
+                    etag = self.client.get("/api/products/?fields=name")["ETag"]
+                self.assertEqual(len(queries), 1)
+                self.assertNotIn("MAX(", queries[0]["sql"])
+
+                response = self.client.get(
+                    "/api/products/?fields=name", HTTP_IF_NONE_MATCH=etag)
+
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_patch_con_if_match_obsoleto_devuelve_412(self):
+        """Verifica que If-Match evita actualizaciones perdidas"""
+        self.client.force_authenticate(user=self.owner_user)
+        etag = self.client.get(self.url)["ETag"]
+        self.product.stock = 99
+        self.product.save()
+
+        response = self.client.patch(
+            self.url, {"price": 1}, format="json", HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.product.refresh_from_db()
+        self.assertEqual(float(self.product.price), 100.00)
+
+    def test_put_con_if_match_vigente_actualiza(self):
+        """Verifica que un If-Match vigente permite actualizar"""
+        self.client.force_authenticate(user=self.owner_user)
+        etag = self.client.get(self.url)["ETag"]
+        data = {"code": "ETAG001", "name": "Producto Etiquetado", "price": 150}
+
+        response = self.client.put(self.url, data, format="json", HTTP_IF_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -0,0 +1,92 @@
+import csv
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.product.models import Product
+from apps.product.serializer import ProductSerializer
+from apps.user.models import User
+
+
+class ProductExportTest(TestCase):
+    """Pruebas para la exportación del catálogo en streaming"""
+
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="admin",
+            first_name="Admin",
+            last_name="Test",
+            email="admin@example.com",
+            dni="1234567890",
+            phone_number="3001234567",
+            password="admin123",
+            is_staff=True,
+        )
+        for i in range(3):
+            Product.objects.create(
+                code=f"EXP-{i}", name=f"Producto {i}", price=10 + i,
+                is_active=i != 2, owner=self.admin)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def content(self, response):
+        return b"".join(response.streaming_content).decode("utf-8")
+
+    def test_csv_en_streaming(self):
+        """Verifica que el CSV se entrega en streaming con todo el catálogo"""
+        response = self.client.get("/api/products/export/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment", response["Content-Disposition"])
+        rows = list(csv.DictReader(StringIO(self.content(response))))
+        self.assertEqual([row["code"] for row in rows], ["EXP-0", "EXP-1", "EXP-2"])
+        self.assertEqual(rows[0]["price"], "10.00")
+
+    def test_jsonl_coincide_con_el_serializer(self):
+        """Verifica que cada línea JSONL tiene la misma forma que la API"""
+        response = self.client.get("/api/products/export/?output=ndjson")
+
+        lines = self.content(response).splitlines()
+        product = Product.objects.get(code="EXP-0")
+        expected = dict(ProductSerializer(product).data)
+        expected.pop("image_srcset")
+        self.assertEqual(json.loads(lines[0]), expected)
+        self.assertEqual(len(lines), 3)
+
+    def test_seleccion_de_campos(self):
+        """Verifica que ?fields= limita las columnas"""
+        response = self.client.get("/api/products/export/?fields=code,price")
+
+        header = self.content(response).splitlines()[0]
+        self.assertEqual(header, "code,price")
+
+    def test_campo_o_formato_invalido(self):
+        """Verifica el 400 con campos o formatos desconocidos"""
+        for query in ("fields=code,password", "output=xlsx"):
+            response = self.client.get(f"/api/products/export/?{query}")
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_solo_administradores(self):
+        """Verifica que un vendedor no puede exportar el catálogo"""
+        self.admin.is_staff = False
+        self.admin.save()
+
+        response = self.client.get("/api/products/export/")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_comando_export_products(self):
+        """Verifica el comando de gestión export_products"""
+        out = StringIO()
+
+        call_command("export_products", format="jsonl", fields="code",
+                     chunk_size=1, stdout=out)
+
+        self.assertEqual(out.getvalue().splitlines(),
+                         ['{"code": "EXP-0"}', '{"code": "EXP-1"}', '{"code": "EXP-2"}'])
@@ -0,0 +1,87 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.product.models import Product
+from apps.user.models import User
+
+
+class ProductSparseFieldsTest(TestCase):
+    """Pruebas para ?fields=, ?omit= y ?compact=true en las lecturas de productos"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username="vendedor",
+            email="vendedor@example.com",
+            dni="9876543210",
+            phone_number="3009876543",
+            password="vendedor123",
+            role=User.VENDEDOR,
+        )
+        for index in range(3):
+            Product.objects.create(
+                code=f"P{index}",
+                name=f"Camisa {index}",
+                description="x" * 500,
+                comment="comentario",
+                price=100 + index,
+                stock=5,
+                owner=self.owner,
+            )
+
+    def product_selects(self, queries):
+        return [q["sql"] for q in queries
+                if 'FROM "product_product"' in q["sql"] and "MAX(" not in q["sql"]]
+
+    def test_fields_limita_campos_y_columnas(self):
+        """Verifica que ?fields= emite solo esos campos y no lee las columnas de texto"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/products/?fields=name,price")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 3)
+        self.assertEqual(set(response.data[0]), {"name", "price"})
+        [sql] = self.product_selects(queries)
+        self.assertNotIn('"description"', sql)
+        self.assertNotIn('"comment"', sql)
+
+    def test_omit_excluye_campos(self):
+        """Verifica que ?omit= quita los campos indicados y no hace consultas por fila"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/products/?omit=description,comment")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("description", response.data[0])
+        self.assertIn("code", response.data[0])
+        [sql] = self.product_selects(queries)
+        self.assertNotIn('"description"', sql)
+
+    def test_compact_usa_el_serializer_reducido(self):
+        """Verifica la representación compacta en listado y búsqueda"""
+        expected = {"id", "name", "slug", "image", "image_srcset", "price"}
+        response = self.client.get("/api/products/?compact=true")
+        self.assertEqual(set(response.data[0]), expected)
+        response = self.client.get("/api/products/search_products/?q=Camisa&compact=1")
+        self.assertEqual(set(response.data[0]), expected)
+
+    def test_compact_con_cursor(self):
+        """Verifica que la paginación por cursor funciona con columnas limitadas"""
+        response = self.client.get("/api/products/?compact=true&page_size=2&ordering=price")
+        self.assertEqual([p["price"] for p in response.data["results"]], ["100.00", "101.00"])
+        response = self.client.get(response.data["next"])
+        self.assertEqual([p["price"] for p in response.data["results"]], ["102.00"])
+
+    def test_detalle_con_fields(self):
+        """Verifica que el detalle también acepta ?fields="""
+        product = Product.objects.first()
+        response = self.client.get(f"/api/products/{product.slug}/?fields=slug,stock")
+        self.assertEqual(response.data, {"slug": product.slug, "stock": 5})
+        self.assertIn("ETag", response)
+
+    def test_campo_desconocido(self):
+        """Verifica 400 con un campo que no existe"""
+        response = self.client.get("/api/products/?fields=name,password")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("password", response.data["fields"][0])
@@ -0,0 +1,158 @@
+import io
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from apps.jobs.models import Job
+from apps.jobs.worker import Worker
+from apps.product.admin import ProductAdmin
+from apps.product.images import get_formats
+from apps.product.models import Product
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_upload(name="foto.png", size=(800, 600)):
+    buffer = io.BytesIO()
+    Image.new("RGBA", size, (200, 30, 30, 255)).save(buffer, "PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT,
+    PRODUCT_IMAGE_WIDTHS=(160, 320, 1280),
+    PRODUCT_IMAGE_FORMATS=("avif", "webp", "jpeg"),
+)
+class ProductImageVariantsTest(TestCase):
+    """Pruebas para los derivados responsivos de Product.image"""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.product = Product.objects.create(
+            code="IMG-1", name="Foto", price=1, image=make_upload())
+        self.run_jobs()
+
+    def run_jobs(self):
+        Worker().run_once()
+        self.product.refresh_from_db()
+
+    def test_derivados_fuera_de_la_peticion(self):
+        """Verifica que guardar solo encola la tarea y el worker genera los derivados"""
+        product = Product.objects.create(
+            code="IMG-2", name="Otra", price=1, image=make_upload())
+
+        self.assertEqual(product.image_variants, {})
+        self.assertEqual(Job.objects.filter(name="product.refresh_image_variants").count(), 1)
+
+        Worker().run_once()
+
+        product.refresh_from_db()
+        self.assertIn("webp", product.image_variants)
+        self.assertFalse(Job.objects.exists())
+
+    def test_genera_derivados_sin_ampliar(self):
+        """Verifica anchos menores al original en cada formato soportado"""
+        variants = self.product.image_variants
+
+        self.assertEqual(variants["source"], self.product.image.name)
+        for fmt in get_formats():
+            self.assertEqual(sorted(variants[fmt], key=int), ["160", "320"])
+        name = variants["webp"]["160"]
+        with self.product.image.storage.open(name) as handle:
+            self.assertEqual(Image.open(handle).size, (160, 120))
+
+    def test_derivados_junto_al_original(self):
+        """Verifica la convención foo.png -> foo__w160.jpg"""
+        root = self.product.image.name.rsplit(".", 1)[0]
+
+        self.assertEqual(self.product.image_variants["jpeg"]["160"], f"{root}__w160.jpg")
+
+    def test_serializer_expone_srcset(self):
+        """Verifica el mapa srcset con URLs absolutas en la API"""
+        response = APIClient().get(f"/api/products/{self.product.slug}/")
+
+        srcset = response.data["image_srcset"]
+        self.assertIn("webp", srcset)
+        self.assertTrue(srcset["webp"].startswith("http://testserver/media/"))
+        self.assertTrue(srcset["webp"].endswith("320w"))
+
+    def test_get_condicional_tras_generar_derivados(self):
+        """Verifica que el ETag cambia cuando el worker genera el srcset"""
+        product = Product.objects.create(
+            code="IMG-3", name="Nueva", price=1, image=make_upload())
+        client = APIClient()
+        url = f"/api/products/{product.slug}/"
+        first = client.get(url)
+        self.assertEqual(first.data["image_srcset"], {})
+
+        Worker().run(stop_when_empty=True)
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertIn("webp", response.data["image_srcset"])
+
+    def test_reemplazar_imagen_regenera_y_borra(self):
+        """Verifica que una imagen nueva reemplaza los derivados anteriores"""
+        old = self.product.image_variants["webp"]["160"]
+        self.product.image = make_upload("otra.png", size=(200, 100))
+        self.product.save()
+        self.run_jobs()
+
+        storage = self.product.image.storage
+        self.assertFalse(storage.exists(old))
+        self.assertEqual(list(self.product.image_variants["webp"]), ["160"])
+
+    def test_imagen_reemplazada_sin_derivados_viejos(self):
+        """Verifica que antes del worker no se sirven los derivados de la imagen anterior"""
+        self.product.image = make_upload("otra.png", size=(200, 100))
+        self.product.save()
+        client = APIClient()
+
+        detail = client.get(f"/api/products/{self.product.slug}/")
+        listing = client.get("/api/products/")
+        html = ProductAdmin(Product, None).admin_image(self.product)
+
+        self.assertEqual(detail.data["image_srcset"], {})
+        self.assertTrue(detail.data["image"].endswith(".png"))
+        self.assertEqual(listing.data[0]["image_srcset"], {})
+        self.assertNotIn("__w160.", html)
+
+    def test_eliminar_producto_borra_derivados(self):
+        """Verifica que los derivados de un producto eliminado se borran del storage"""
+        storage = self.product.image.storage
+        names = list(self.product.image_variants["webp"].values())
+        self.product.delete()
+        self.assertTrue(all(storage.exists(name) for name in names))
+
+        Worker().run(stop_when_empty=True)
+
+        self.assertFalse(any(storage.exists(name) for name in names))
+
+    def test_guardar_sin_cambiar_imagen_no_regenera(self):
+        """Verifica que guardar otros campos no vuelve a procesar la imagen"""
+        variants = self.product.image_variants
+        self.product.refresh_from_db()
+        self.product.price = 5
+
+        # Solo el UPDATE del producto: ni vector de búsqueda ni derivados
+        with self.assertNumQueries(1):
+            self.product.save()
+
+        self.assertEqual(self.product.image_variants, variants)
+
+    def test_admin_usa_la_miniatura(self):
+        """Verifica que la lista del admin no descarga el original"""
+        html = ProductAdmin(Product, None).admin_image(self.product)
+
+        self.assertIn("__w160.", html)
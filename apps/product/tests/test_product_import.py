@@ -0,0 +1,155 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.product.importers import ProductImporter, iter_rows
+from apps.product.models import Product
+from apps.product.search import search_catalog
+from apps.product.slugs import allocate_slugs
+from apps.user.models import User
+
+CSV_BODY = (
+    "code,name,description,price,stock\n"
+    "IMP-1,Camiseta,Algodón,10.00,5\n"
+    "IMP-2,Camiseta,Lino,12.50,3\n"
+    "imp-3,Mala,,abc,1\n"
+    "IMP-1,Repetida,,1,1\n"
+)
+
+
+class ProductImportTest(TestCase):
+    """Pruebas para la importación masiva de productos"""
+
+    def setUp(self):
+        cache.clear()
+        self.vendor = User.objects.create_user(
+            username="vendedor",
+            first_name="Vendedor",
+            last_name="Test",
+            email="vendedor@example.com",
+            dni="9876543210",
+            phone_number="3009876543",
+            password="vendedor123",
+            role=User.VENDEDOR,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.vendor)
+
+    def upload(self, body, name="productos.csv", **data):
+        data["file"] = SimpleUploadedFile(name, body.encode("utf-8"))
+        return self.client.post("/api/products/import/", data, format="multipart")
+
+    def test_importa_csv_y_reporta_errores_por_linea(self):
+        """Verifica que las filas válidas se crean y las inválidas se reportan"""
+        response = self.upload(CSV_BODY)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["total"], 4)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual([e["line"] for e in response.data["errors"]], [4, 5])
+        self.assertEqual(
+            set(Product.objects.values_list("slug", flat=True)),
+            {"camiseta", "camiseta-1"})
+        self.assertEqual(Product.objects.filter(owner=self.vendor).count(), 2)
+
+    def test_importa_jsonl(self):
+        """Verifica el formato JSONL con líneas inválidas"""
+        body = '{"code": "J-1", "name": "Gorra", "price": "5"}\n\nno es json\n'
+
+        response = self.upload(body, name="productos.ndjson")
+
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["errors"][0]["line"], 3)
+
+    def test_codigo_existente_se_rechaza(self):
+        """Verifica que un código ya guardado no se duplica"""
+        Product.objects.create(code="IMP-1", name="Previo", price=1)
+
+        response = self.upload("code,name\nIMP-1,Otro\nIMP-9,Nuevo\n")
+
+        self.assertEqual(response.data["created"], 1)
+        self.assertIn("code", response.data["errors"][0]["errors"])
+
+    def test_producto_importado_es_buscable(self):
+        """Verifica que el vector de búsqueda se calcula tras bulk_create"""
+        self.upload("code,name\nIMP-7,Chaqueta impermeable\n")
+
+        found = search_catalog(Product.objects.all(), "impermeable")
+
+        self.assertEqual([p.code for p in found], ["IMP-7"])
+
+    def test_consultas_no_crecen_con_las_filas(self):
+        """Verifica que cada lote usa un número fijo de consultas"""
+        rows = "".join(f"B-{i},Bolso\n" for i in range(50))
+        importer = ProductImporter(self.vendor, batch_size=100)
+
+        with self.assertNumQueries(6):
+            summary = importer.run(iter_rows(StringIO("code,name\n" + rows), "csv"))
+
+        self.assertEqual(summary["created"], 50)
+
+    def test_guardado_fila_por_fila_recalcula_vectores_en_un_update(self):
+        """Verifica que el reintento fila por fila recalcula los vectores con un solo UPDATE"""
+        rows = "".join(f"R-{i},Mochila viajera\n" for i in range(5))
+        importer = ProductImporter(self.vendor)
+
+        with mock.patch.object(
+                Product.objects, "bulk_create", side_effect=IntegrityError), \
+                CaptureQueriesContext(connection) as queries:
+            summary = importer.run(iter_rows(StringIO("code,name\n" + rows), "csv"))
+
+        self.assertEqual(summary["created"], 5)
+        refreshes = [q for q in queries if 'SET "search_vector"' in q["sql"]]
+        self.assertEqual(len(refreshes), 1)
+        found = search_catalog(Product.objects.all(), "viajera")
+        self.assertEqual(len(found), 5)
+
+    def test_formato_no_soportado(self):
+        """Verifica el 400 con una extensión desconocida"""
+        response = self.upload("x", name="productos.xlsx")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_cliente_no_puede_importar(self):
+        """Verifica que solo vendedores o staff importan"""
+        self.vendor.role = User.CLIENTE
+        self.vendor.save()
+
+        response = self.upload(CSV_BODY)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_allocate_slugs_respeta_los_existentes(self):
+        """Verifica la reserva de slugs en lote con una consulta"""
+        Product.objects.create(code="S-1", name="Camiseta", price=1)
+        Product.objects.create(code="S-2", name="Camiseta", price=1)
+
+        with self.assertNumQueries(1):
+            slugs = allocate_slugs(["camiseta", "gorra", "camiseta", "camiseta-1"])
+
+        self.assertEqual(slugs, ["camiseta-2", "gorra", "camiseta-3", "camiseta-1-1"])
+
+    def test_comando_import_products(self):
+        """Verifica el comando de gestión import_products"""
+        with tempfile.NamedTemporaryFile(
+                "w", suffix=".csv", delete=False, encoding="utf-8") as handle:
+            handle.write(CSV_BODY)
+        self.addCleanup(os.remove, handle.name)
+        out, err = StringIO(), StringIO()
+
+        call_command("import_products", handle.name, owner="vendedor",
+                     batch_size=1, stdout=out, stderr=err)
+
+        self.assertIn("2 creados", out.getvalue())
+        self.assertIn("Línea 4", err.getvalue())
+        self.assertEqual(Product.objects.filter(owner=self.vendor).count(), 2)
@@ -0,0 +1,60 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from apps.product.models import Product
+from apps.user.models import User
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN de PostgreSQL")
+class ProductIndexesTest(TestCase):
+    """Pruebas de que las consultas calientes de la API usan los índices compuestos"""
+
+    SIZE = 5000
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owners = [
+            User.objects.create_user(
+                username=f"vendedor{index}",
+                email=f"vendedor{index}@example.com",
+                dni=f"900000000{index}",
+                phone_number=f"300000000{index}",
+                role=User.VENDEDOR,
+            )
+            for index in range(10)
+        ]
+        Product.objects.bulk_create(
+            Product(
+                code=f"IDX-{i}",
+                name=f"Producto {i}",
+                slug=f"producto-{i}",
+                price=i % 1000,
+                is_active=i % 10 != 0,
+                owner=cls.owners[i % len(cls.owners)],
+            )
+            for i in range(cls.SIZE)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Product._meta.db_table}")
+
+    def assert_uses_index(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan, plan)
+        self.assertNotIn("Seq Scan", plan, plan)
+
+    def test_listado_de_activos(self):
+        """Verifica is_active=True ORDER BY -created_at, -id con product_active_created_idx"""
+        queryset = Product.objects.filter(is_active=True).order_by("-created_at", "-id")[:21]
+        self.assert_uses_index(queryset, "product_active_created_idx")
+
+    def test_productos_del_vendedor(self):
+        """Verifica owner=? ORDER BY -created_at, -id con product_owner_created_idx"""
+        queryset = Product.objects.filter(owner=self.owners[3]).order_by("-created_at", "-id")[:21]
+        self.assert_uses_index(queryset, "product_owner_created_idx")
+
+    def test_rango_de_precio_en_activos(self):
+        """Verifica el filtro de precio de search_products con el índice parcial"""
+        queryset = Product.objects.filter(is_active=True, price__gte=100, price__lte=105)
+        self.assert_uses_index(queryset, "product_active_price_idx")
@@ -0,0 +1,109 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.product.models import Product
+from apps.user.models import User
+from l_atelier.metrics import timed
+
+ALWAYS = {"ENABLED": True, "SAMPLE_RATE": 1.0, "SERVER_TIMING": True}
+NEVER = {"ENABLED": True, "SAMPLE_RATE": 0.0, "SERVER_TIMING": True}
+STAFF_ONLY = {"ENABLED": True, "SAMPLE_RATE": 1.0}
+
+
+def parse_server_timing(header):
+    entries = {}
+    for entry in header.split(", "):
+        name, *params = entry.split(";")
+        entries[name] = dict(param.split("=", 1) for param in params)
+    return entries
+
+
+class RequestMetricsTest(TestCase):
+    """Pruebas para la instrumentación Server-Timing por petición"""
+
+    def setUp(self):
+        cache.clear()
+        Product.objects.create(code="MET-1", name="Camiseta medida", price=10)
+        self.client = APIClient()
+
+    @override_settings(REQUEST_METRICS=ALWAYS)
+    def test_server_timing_con_fases(self):
+        """Verifica que la cabecera incluye db, auth, view, serialize, render y total"""
+        with self.assertLogs("l_atelier.metrics", level="INFO") as logs:
+            response = self.client.get(
+                "/api/products/search_products/?q=camiseta")
+
+        timing = parse_server_timing(response["Server-Timing"])
+        self.assertEqual(
+            list(timing), ["db", "auth", "view", "serialize", "render", "total"])
+        self.assertEqual(timing["db"]["desc"], '"1 queries"')
+        self.assertIn("path=/api/products/search_products/", logs.output[0])
+        self.assertIn("queries=1", logs.output[0])
+        self.assertIn("serialize_ms=", logs.output[0])
+
+    @override_settings(REQUEST_METRICS=ALWAYS)
+    def test_serialize_en_el_detalle(self):
+        """Verifica que el serializer del detalle se mide aparte de la vista"""
+        product = Product.objects.get()
+        with mock.patch("apps.product.views.timed", wraps=timed) as spy:
+            response = self.client.get(f"/api/products/{product.slug}/")
+
+        timing = parse_server_timing(response["Server-Timing"])
+        self.assertIn("serialize", timing)
+        spy.assert_called_once_with(mock.ANY, "serialize")
+
+    @override_settings(REQUEST_METRICS=ALWAYS)
+    def test_mide_la_autenticacion_jwt(self):
+        """Verifica que la fase auth se mide con un token JWT real"""
+        user = User.objects.create_user(
+            username="medido",
+            first_name="Medido",
+            last_name="Test",
+            email="medido@example.com",
+            dni="1231231231",
+            phone_number="3001231231",
+            password="medido123",
+        )
+        token = self.client.post(
+            "/api/auth/login/",
+            {"username": "medido", "password": "medido123"},
+            format="json").data["access"]
+
+        response = self.client.get(
+            "/api/auth/me/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        timing = parse_server_timing(response["Server-Timing"])
+        self.assertEqual(response.data["id"], user.id)
+        self.assertGreater(float(timing["auth"]["dur"]), 0)
+
+    @override_settings(REQUEST_METRICS=NEVER)
+    def test_peticiones_no_muestreadas(self):
+        """Verifica que sin muestreo no se agrega la cabecera"""
+        response = self.client.get("/api/products/")
+
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(REQUEST_METRICS=STAFF_ONLY)
+    def test_server_timing_solo_para_staff_por_defecto(self):
+        """Verifica que sin SERVER_TIMING los anónimos no reciben tiempos internos"""
+        with self.assertLogs("l_atelier.metrics", level="INFO"):
+            response = self.client.get("/api/products/")
+        self.assertNotIn("Server-Timing", response)
+
+        staff = User.objects.create_user(
+            username="staff",
+            first_name="Staff",
+            last_name="Test",
+            email="staff@example.com",
+            dni="4564564564",
+            phone_number="3004564564",
+            password="staff123",
+            is_staff=True,
+        )
+        self.client.force_authenticate(user=staff)
+        response = self.client.get("/api/products/")
+
+        self.assertIn("total;dur=", response["Server-Timing"])
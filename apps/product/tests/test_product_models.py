@@ -0,0 +1,77 @@
+from unittest import mock
+
+from django.db import IntegrityError
+from django.test import TestCase
+
+from apps.product.models import Product
+from apps.product.slugs import next_slug_suffix
+
+
+class ProductSlugTest(TestCase):
+    """Pruebas para la asignación de slugs en Product.save"""
+
+    def create(self, code, name="Camiseta"):
+        return Product.objects.create(code=code, name=name, price=10)
+
+    def test_slug_desde_el_nombre(self):
+        """Verifica que el primer producto usa el slug base"""
+        self.assertEqual(self.create("CAM-1").slug, "camiseta")
+
+    def test_slug_incrementa_el_sufijo(self):
+        """Verifica que los repetidos reciben -1, -2, ..."""
+        slugs = [self.create(f"CAM-{i}").slug for i in range(3)]
+
+        self.assertEqual(slugs, ["camiseta", "camiseta-1", "camiseta-2"])
+
+    def test_slug_usa_el_codigo_si_el_nombre_no_sirve(self):
+        """Verifica el respaldo slugify(name) or code"""
+        self.assertEqual(self.create("ABC-9", name="???").slug, "ABC-9")
+
+    def test_slug_existente_no_cambia(self):
+        """Verifica que guardar de nuevo no modifica el slug"""
+        product = self.create("CAM-1")
+        product.name = "Pantalón"
+        product.save()
+
+        product.refresh_from_db()
+        self.assertEqual(product.slug, "camiseta")
+
+    def test_slugs_de_otra_base_no_cuentan(self):
+        """Verifica que 'camiseta-roja' no afecta el sufijo de 'camiseta'"""
+        self.create("CAM-1")
+        self.create("CAM-2", name="Camiseta roja")
+
+        self.assertEqual(self.create("CAM-3").slug, "camiseta-1")
+
+    def test_sufijos_de_dos_digitos(self):
+        """Verifica que camiseta-10 se considera mayor que camiseta-9"""
+        Product.objects.create(code="CAM-9", name="X", slug="camiseta-9", price=1)
+        Product.objects.create(code="CAM-10", name="X", slug="camiseta-10", price=1)
+
+        self.assertEqual(self.create("CAM-11").slug, "camiseta-11")
+
+    def test_una_sola_consulta_sin_importar_los_repetidos(self):
+        """Verifica que el costo de asignar el slug no crece con los repetidos"""
+        for i in range(20):
+            self.create(f"CAM-{i}")
+
+        with self.assertNumQueries(1):
+            suffix = next_slug_suffix("camiseta")
+
+        self.assertEqual(suffix, 20)
+
+    def test_reintenta_si_otra_insercion_toma_el_slug(self):
+        """Verifica el reintento ante una colisión concurrente en el índice único"""
+        self.create("CAM-1")
+        # Simula que el sufijo se calculó antes de la inserción concurrente
+        with mock.patch("apps.product.models.next_slug_suffix", side_effect=[0, 0]):
+            product = self.create("CAM-2")
+
+        self.assertEqual(product.slug, "camiseta-1")
+
+    def test_codigo_duplicado_no_se_reintenta(self):
+        """Verifica que un IntegrityError ajeno al slug se propaga"""
+        self.create("CAM-1", name="Uno")
+
+        with self.assertRaises(IntegrityError):
+            self.create("CAM-1", name="Dos")
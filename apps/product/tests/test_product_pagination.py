@@ -0,0 +1,108 @@
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.user.models import User
+from apps.product.models import Product
+
+
+class ProductCursorPaginationTest(TestCase):
+    """Pruebas para la paginación por cursor de productos"""
+
+    def setUp(self):
+        self.owner_user = User.objects.create_user(
+            username="vendedor",
+            first_name="Vendedor",
+            last_name="Test",
+            email="vendedor@example.com",
+            dni="9876543210",
+            phone_number="3009876543",
+            password="vendedor123",
+            role=User.VENDEDOR,
+        )
+        for i in range(5):
+            Product.objects.create(
+                code=f"PAG00{i}",
+                name=f"Producto {i}",
+                description="Producto paginado",
+                price=100 + i % 2,
+                stock=1,
+                is_active=True,
+                owner=self.owner_user,
+            )
+        self.client = APIClient()
+
+    def walk(self, url):
+        """Recorre todas las páginas siguiendo el enlace next"""
+        codes = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            codes.extend(p["code"] for p in response.data["results"])
+            url = response.data["next"]
+        return codes
+
+    def test_sin_parametros_devuelve_lista_plana(self):
+        """Verifica que sin page_size la respuesta sigue siendo una lista"""
+        response = self.client.get("/api/products/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.data, list)
+        self.assertEqual(len(response.data), 5)
+
+    def test_recorre_todas_las_paginas_sin_duplicados(self):
+        """Verifica que el cursor recorre el catálogo por created_at descendente"""
+        codes = self.walk("/api/products/?page_size=2")
+
+        self.assertEqual(codes, ["PAG004", "PAG003", "PAG002", "PAG001", "PAG000"])
+
+    def test_respeta_ordering_por_precio(self):
+        """Verifica que el cursor respeta ordering_fields con empates en precio"""
+        codes = self.walk("/api/products/?page_size=2&ordering=price")
+        expected = list(
+            Product.objects.order_by("price", "id").values_list("code", flat=True))
+
+        self.assertEqual(codes, expected)
+
+    def test_enlace_previous_regresa_a_la_pagina_anterior(self):
+        """Verifica que previous devuelve la página anterior"""
+        first = self.client.get("/api/products/?page_size=2")
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+
+        self.assertIsNone(first.data["previous"])
+        self.assertEqual(
+            [p["code"] for p in back.data["results"]],
+            [p["code"] for p in first.data["results"]],
+        )
+
+    def test_cursor_alterado_devuelve_404(self):
+        """Verifica que un cursor manipulado es rechazado"""
+        response = self.client.get("/api/products/?cursor=manipulado")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_con_otro_ordering_devuelve_404(self):
+        """Verifica que un cursor no se puede reutilizar con otro ordering"""
+        first = self.client.get("/api/products/?page_size=2")
+        url = first.data["next"] + "&ordering=name"
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_my_products_paginado(self):
+        """Verifica la paginación en my_products"""
+        self.client.force_authenticate(user=self.owner_user)
+
+        codes = self.walk("/api/products/my_products/?page_size=3")
+
+        self.assertEqual(len(codes), 5)
+        self.assertEqual(len(set(codes)), 5)
+
+    def test_search_products_paginado(self):
+        """Verifica la paginación en search_products"""
+        codes = self.walk("/api/products/search_products/?q=producto&page_size=2")
+
+        self.assertEqual(len(codes), 5)
+        self.assertEqual(codes[0], "PAG004")
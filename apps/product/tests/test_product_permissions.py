@@ -0,0 +1,84 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.product.models import Product
+from apps.user.models import User
+
+
+class ProductWriteQueriesTest(TestCase):
+    """Pruebas de IsOwnerOrStaff y de una sola lectura del producto por escritura"""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username="vendedor",
+            email="vendedor@example.com",
+            dni="9876543210",
+            phone_number="3009876543",
+            password="vendedor123",
+            role=User.VENDEDOR,
+        )
+        self.other = User.objects.create_user(
+            username="otro",
+            email="otro@example.com",
+            dni="5555555555",
+            phone_number="3005555555",
+            password="otro123",
+            role=User.CLIENTE,
+        )
+        self.product = Product.objects.create(
+            code="PERM-1", name="Camisa", price=10, stock=1, owner=self.owner)
+        self.url = f"/api/products/{self.product.slug}/"
+        self.client = APIClient()
+
+    def product_selects(self, queries):
+        table = f'FROM "{Product._meta.db_table}"'
+        return [q["sql"] for q in queries
+                if q["sql"].startswith("SELECT") and table in q["sql"]]
+
+    def test_patch_lee_el_producto_una_vez(self):
+        """Verifica un solo SELECT del producto en PATCH, sin ORDER BY ni consulta del owner"""
+        self.client.force_authenticate(self.owner)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(self.url, {"stock": 7}, format="json")
+        self.assertEqual(response.status_code, 200)
+        selects = self.product_selects(queries)
+        self.assertEqual(len(selects), 1, selects)
+        self.assertNotIn("ORDER BY", selects[0])
+        self.assertFalse(any('FROM "user' in q["sql"] for q in queries))
+
+    def test_put_lee_el_producto_una_vez(self):
+        """Verifica un SELECT del producto en PUT más la validación de unicidad de code"""
+        self.client.force_authenticate(self.owner)
+        data = {"code": "PERM-1", "name": "Camisa nueva", "price": 12, "stock": 2}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(self.url, data, format="json")
+        self.assertEqual(response.status_code, 200)
+        selects = [sql for sql in self.product_selects(queries) if "LIMIT 1" not in sql]
+        self.assertEqual(len(selects), 1, selects)
+
+    def test_delete_lee_el_producto_una_vez(self):
+        """Verifica un solo SELECT del producto al eliminar"""
+        self.client.force_authenticate(self.owner)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(len(self.product_selects(queries)), 1)
+
+    def test_otro_usuario_recibe_403_con_un_select(self):
+        """Verifica que el permiso de objeto rechaza antes de validar o escribir"""
+        self.client.force_authenticate(self.other)
+        with CaptureQueriesContext(connection) as queries:
+            patch = self.client.patch(self.url, {"stock": 0}, format="json")
+        self.assertEqual(patch.status_code, 403)
+        self.assertIn("No puedes actualizar productos", str(patch.data))
+        self.assertEqual(len(self.product_selects(queries)), 1)
+
+        delete = self.client.delete(self.url)
+        self.assertEqual(delete.status_code, 403)
+        self.assertIn("No puedes eliminar productos", str(delete.data))
+        self.product.refresh_from_db()
+        self.assertEqual(self.product.stock, 1)
@@ -0,0 +1,94 @@
+import datetime
+import decimal
+import io
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.product.models import Product
+from apps.product.serializer import ProductSerializer
+from l_atelier.parsers import FastJSONParser
+from l_atelier.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTest(SimpleTestCase):
+    """Pruebas para la compatibilidad del renderer con orjson"""
+
+    def assert_same_output(self, data, accepted_media_type=None):
+        expected = JSONRenderer().render(data, accepted_media_type)
+        self.assertEqual(FastJSONRenderer().render(data, accepted_media_type), expected)
+
+    def test_misma_salida_que_drf(self):
+        """Verifica bytes idénticos con decimales, fechas, unicode y separadores de línea"""
+        utc = datetime.timezone.utc
+        data = {
+            "price": decimal.Decimal("10.50"),
+            "created_at": datetime.datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=utc),
+            "naive": datetime.datetime(2026, 1, 2, 3, 4, 5),
+            "bogota": datetime.datetime(
+                2026, 1, 2, tzinfo=datetime.timezone(datetime.timedelta(hours=-5))),
+            "date": datetime.date(2026, 1, 2),
+            "name": "Pantalón ñandú 👖",
+            "description": "línea\u2028separada\u2029",
+            "lazy": gettext_lazy("texto"),
+            "nested": [{"a": None, "b": True, "c": 1.5}, ()],
+            1: "clave entera",
+            "big": 2 ** 70,
+        }
+        self.assert_same_output(data)
+
+    def test_indentacion_usa_el_renderer_de_drf(self):
+        """Verifica que ?indent mantiene el formato del JSONRenderer"""
+        self.assert_same_output({"a": [1, 2]}, "application/json; indent=4")
+
+    def test_sin_orjson_usa_el_renderer_de_drf(self):
+        """Verifica el respaldo con json de la librería estándar"""
+        with mock.patch("l_atelier.renderers.orjson", None):
+            self.assert_same_output({"price": decimal.Decimal("1.10")})
+
+
+class FastJSONParserTest(SimpleTestCase):
+    """Pruebas para el parser JSON con orjson"""
+
+    def parse(self, parser, body):
+        return parser.parse(io.BytesIO(body), "application/json", {"encoding": "utf-8"})
+
+    def test_mismo_resultado_que_drf(self):
+        """Verifica el mismo resultado, incluidos enteros grandes"""
+        body = '{"name": "Camisa ñ", "price": "10.50", "big": 18446744073709551616}'.encode()
+
+        self.assertEqual(self.parse(FastJSONParser(), body), self.parse(JSONParser(), body))
+
+    def test_json_invalido_da_el_mismo_error(self):
+        """Verifica que el error de parseo coincide con el de DRF"""
+        errors = []
+        for parser in (JSONParser(), FastJSONParser()):
+            with self.assertRaises(ParseError) as context:
+                self.parse(parser, b'{"name": NaN}')
+            errors.append(str(context.exception.detail))
+
+        self.assertEqual(errors[0], errors[1])
+
+
+class FastJSONApiTest(TestCase):
+    """Pruebas del renderer en la API de productos"""
+
+    def test_listado_identico_al_renderer_de_drf(self):
+        """Verifica que la respuesta de la API es la del JSONRenderer"""
+        Product.objects.create(
+            code="ORJ-1", name="Camiseta ñ", price=decimal.Decimal("19.99"),
+            description="con\u2028salto")
+
+        response = APIClient().get("/api/products/")
+
+        data = ProductSerializer(
+            Product.objects.order_by("-created_at"), many=True,
+            context={"request": response.wsgi_request}).data
+        self.assertEqual(response.content, JSONRenderer().render(data))
+        self.assertIn(b'"price":"19.99"', response.content)
+        self.assertIn(b"con\\u2028salto", response.content)
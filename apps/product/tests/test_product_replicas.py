@@ -0,0 +1,112 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.product.cache import get_cache
+from apps.product.models import Product
+from apps.user.models import User
+from l_atelier.db_router import ReplicaRouter, routing_state, use_primary
+
+ROUTING = {"REPLICAS": ["replica"], "STICKY_SECONDS": 10}
+
+
+@override_settings(DATABASE_ROUTING=ROUTING)
+class ReplicaRoutingTest(TestCase):
+    """Pruebas para el envío de lecturas de productos a la réplica"""
+
+    # "replica" es espejo de default: no ve los datos sin confirmar de la prueba
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        cache.clear()
+        self.vendor = User.objects.create_user(
+            username="replicas",
+            first_name="Rep",
+            last_name="Lica",
+            email="replicas@example.com",
+            dni="4564564564",
+            phone_number="3004564564",
+            password="replicas123",
+            role=User.VENDEDOR,
+        )
+        Product.objects.create(code="REP-1", name="Camiseta réplica", price=10)
+        self.client = APIClient()
+
+    def get(self, url, **extra):
+        with CaptureQueriesContext(connections["default"]) as primary, \
+                CaptureQueriesContext(connections["replica"]) as replica:
+            response = self.client.get(url, **extra)
+        self.assertEqual(response.status_code, 200)
+        return response, len(primary), len(replica)
+
+    def test_lecturas_anonimas_van_a_la_replica(self):
+        """Verifica que el listado y la búsqueda se leen de la réplica"""
+        for url in ("/api/products/", "/api/products/search_products/?q=camiseta"):
+            _, primary, replica = self.get(url)
+            self.assertEqual(primary, 0, url)
+            self.assertGreater(replica, 0, url)
+
+    def test_sin_replicas_todo_va_al_primario(self):
+        """Verifica que sin réplicas configuradas se lee de default"""
+        with self.settings(DATABASE_ROUTING={"REPLICAS": []}):
+            response, primary, replica = self.get("/api/products/")
+
+        self.assertEqual(replica, 0)
+        self.assertEqual(len(response.data), 1)
+
+    def test_cabecera_fuerza_el_primario(self):
+        """Verifica que X-DB-Primary lleva la lectura al primario"""
+        response, primary, replica = self.get("/api/products/", HTTP_X_DB_PRIMARY="1")
+
+        self.assertEqual(replica, 0)
+        self.assertEqual(len(response.data), 1)
+
+    def test_tras_escribir_el_cliente_lee_del_primario(self):
+        """Verifica que después de crear un producto el autor lee su escritura"""
+        self.client.force_authenticate(user=self.vendor)
+        created = self.client.post(
+            "/api/products/", {"code": "REP-2", "name": "Pantalón", "price": 20},
+            format="json")
+        self.assertEqual(created.status_code, 201)
+        self.assertIn("db_primary", created.cookies)
+        cookie = created.cookies["db_primary"]
+        self.assertEqual((cookie["samesite"], cookie["secure"]), ("None", True))
+
+        _, primary, replica = self.get("/api/products/my_products/")
+        self.assertEqual(replica, 0)
+
+        # Sin la cookie, la marca por usuario también lo mantiene en el primario
+        other_client = APIClient()
+        other_client.force_authenticate(user=self.vendor)
+        self.client = other_client
+        response, primary, replica = self.get("/api/products/my_products/")
+        self.assertEqual(replica, 0)
+        self.assertEqual(len(response.data), 1)
+
+    def test_escritura_fija_el_resto_de_la_peticion(self):
+        """Verifica que una escritura y use_primary() desvían las lecturas al primario"""
+        router = ReplicaRouter()
+        with routing_state() as state:
+            state.replica_reads = True
+            self.assertEqual(router.db_for_read(Product), "replica")
+            with use_primary():
+                self.assertEqual(router.db_for_read(Product), "default")
+            self.assertEqual(router.db_for_read(Product), "replica")
+
+            self.assertEqual(router.db_for_write(Product), "default")
+            self.assertEqual(router.db_for_read(Product), "default")
+
+        self.assertEqual(router.db_for_read(Product), "default")
+
+    def test_respuesta_de_replica_se_cachea_menos_tiempo(self):
+        """Verifica que el listado leído de la réplica usa REPLICA_TIMEOUT"""
+        product_cache = get_cache()
+        with self.settings(PRODUCT_CACHE={"REPLICA_TIMEOUT": 7}), \
+                mock.patch.object(product_cache, "set", wraps=product_cache.set) as spy:
+            self.get("/api/products/")
+
+        self.assertEqual(spy.call_args.args[2], 7)
@@ -0,0 +1,85 @@
+import decimal
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.request import Request
+from rest_framework.test import APIClient
+
+from apps.product.models import Product
+from apps.product.rows import ProductRowSerializer
+from apps.product.serializer import ProductListSerializer, ProductSerializer
+from apps.user.models import User
+
+
+class ProductRowSerializerTest(TestCase):
+    """Pruebas de paridad entre ProductRowSerializer y ProductSerializer"""
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            username="vendedor",
+            email="vendedor@example.com",
+            dni="9876543210",
+            phone_number="3009876543",
+            password="vendedor123",
+            role=User.VENDEDOR,
+        )
+        prices = ["0", "10.5", "99999.99", "1234.1"]
+        for index, price in enumerate(prices):
+            Product.objects.create(
+                code=f"ROW-{index}",
+                name=f"Pantalón ñandú {index}",
+                description="línea\nsegunda" if index % 2 else "",
+                comment="",
+                price=decimal.Decimal(price),
+                stock=index,
+                is_active=index != 3,
+                owner=self.owner,
+            )
+        # Imagen con derivados sin pasar por el procesamiento de imágenes
+        Product.objects.filter(code="ROW-1").update(
+            image="products/camisa.jpg",
+            image_variants={
+                "source": "products/camisa.jpg",
+                "webp": {"640": "products/camisa-640.webp", "160": "products/camisa-160.webp"},
+                "jpeg": {"160": "products/camisa-160.jpg"},
+            },
+        )
+        self.request = Request(RequestFactory().get("/api/products/"))
+
+    def assert_parity(self, serializer_class=ProductSerializer, fields=None, request=None):
+        queryset = Product.objects.order_by("id")
+        context = {"request": request}
+        expected = serializer_class(queryset, many=True, fields=fields, context=context).data
+        rows = ProductRowSerializer(serializer_class, fields, request)
+        self.assertEqual(rows.serialize(queryset.values(*rows.columns)), expected)
+
+    def test_misma_salida_que_product_serializer(self):
+        """Verifica campos, orden, decimales, fechas e imágenes idénticos"""
+        self.assert_parity()
+        self.assert_parity(request=self.request)
+
+    def test_misma_salida_con_campos_parciales(self):
+        """Verifica la paridad con ?fields= y con el serializer compacto"""
+        self.assert_parity(fields=["name", "price", "image_srcset"], request=self.request)
+        self.assert_parity(ProductListSerializer, request=self.request)
+
+    def test_respuestas_de_la_api_iguales_con_y_sin_camino_rapido(self):
+        """Verifica listado, búsqueda, compacto y cursor con y sin PRODUCT_FAST_SERIALIZER"""
+        client = APIClient()
+        client.force_authenticate(self.owner)
+        urls = [
+            "/api/products/",
+            "/api/products/?ordering=price",
+            "/api/products/?compact=true&page_size=2",
+            "/api/products/my_products/?fields=code,created_at",
+            "/api/products/search_products/?q=pantalon&omit=description",
+        ]
+        for url in urls:
+            cache.clear()
+            fast = client.get(url)
+            cache.clear()
+            with override_settings(PRODUCT_FAST_SERIALIZER=False):
+                slow = client.get(url)
+            self.assertEqual(fast.status_code, 200, url)
+            self.assertEqual(fast.content, slow.content, url)
@@ -0,0 +1,197 @@
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.user.models import User
+from apps.product.models import Product
+from apps.product.search import has_trigram_support
+
+
+class ProductSearchEngineTest(TestCase):
+    """Pruebas para el motor de búsqueda de productos"""
+
+    def setUp(self):
+        self.owner_user = User.objects.create_user(
+            username="vendedor",
+            first_name="Vendedor",
+            last_name="Test",
+            email="vendedor@example.com",
+            dni="9876543210",
+            phone_number="3009876543",
+            password="vendedor123",
+            role=User.VENDEDOR,
+        )
+        self.by_description = Product.objects.create(
+            code="DESC-001",
+            name="Accesorio",
+            description="Funda para laptop",
+            price=20.00,
+            owner=self.owner_user,
+        )
+        self.by_name = Product.objects.create(
+            code="NAME-001",
+            name="Laptop Gamer",
+            description="Equipo portátil",
+            price=1500.00,
+            owner=self.owner_user,
+        )
+        self.client = APIClient()
+
+    def codes(self, response):
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [p["code"] for p in response.data]
+
+    def test_vector_se_actualiza_al_guardar(self):
+        """Verifica que el vector de búsqueda se recalcula al cambiar el nombre"""
+        self.by_description.name = "Teclado mecánico"
+        self.by_description.save()
+
+        response = self.client.get("/api/products/search_products/?q=teclado")
+
+        self.assertEqual(self.codes(response), ["DESC-001"])
+
+    def test_vector_se_actualiza_al_editar_un_producto_leido(self):
+        """Verifica que un producto leído de la base recalcula el vector si cambia el texto"""
+        product = Product.objects.get(pk=self.by_description.pk)
+        product.description = "Teclado inalámbrico"
+        product.save(update_fields=["description"])
+
+        response = self.client.get("/api/products/search_products/?q=inalambrico")
+
+        self.assertEqual(self.codes(response), ["DESC-001"])
+
+    def test_guardar_sin_cambiar_el_texto_no_recalcula_el_vector(self):
+        """Verifica que guardar sin cambiar nombre, código ni descripción omite el UPDATE del vector"""
+        product = Product.objects.get(pk=self.by_name.pk)
+        product.price = 1400
+        product.name = "Laptop Gamer"
+
+        for update_fields in (None, ["price"], ["name", "price"]):
+            with self.subTest(update_fields=update_fields):
+                # Un único UPDATE: el del producto
+                with self.assertNumQueries(1):
+                    product.save(update_fields=update_fields)
+
+    def test_nombre_pesa_mas_que_descripcion(self):
+        """Verifica que las coincidencias en el nombre aparecen primero"""
+        response = self.client.get("/api/products/search_products/?q=laptop")
+
+        self.assertEqual(self.codes(response), ["NAME-001", "DESC-001"])
+
+    def test_busqueda_por_prefijo(self):
+        """Verifica que un prefijo encuentra la palabra completa"""
+        response = self.client.get("/api/products/search_products/?q=lapt")
+
+        self.assertIn("NAME-001", self.codes(response))
+
+    def test_busqueda_por_codigo_con_guiones(self):
+        """Verifica que el código con guiones se encuentra por partes"""
+        response = self.client.get("/api/products/search_products/?q=NAME-001")
+
+        self.assertEqual(self.codes(response), ["NAME-001"])
+
+    def test_ordering_explicito_tiene_prioridad(self):
+        """Verifica que ?ordering= reemplaza el orden por relevancia"""
+        response = self.client.get(
+            "/api/products/search_products/?q=laptop&ordering=price")
+
+        self.assertEqual(self.codes(response), ["DESC-001", "NAME-001"])
+
+    def test_list_search_usa_el_mismo_motor(self):
+        """Verifica que ?search= del listado usa el motor con relevancia"""
+        response = self.client.get("/api/products/?search=laptop")
+
+        self.assertEqual(self.codes(response), ["NAME-001", "DESC-001"])
+
+    def test_paginado_conserva_la_relevancia(self):
+        """Verifica que page_size recorre los resultados en orden de relevancia"""
+        Product.objects.create(
+            code="DESC-002",
+            name="Mochila",
+            description="Mochila para laptop",
+            price=40.00,
+            owner=self.owner_user,
+        )
+        expected = ["NAME-001", "DESC-002", "DESC-001"]
+        for url in ("/api/products/search_products/?q=laptop&page_size=1",
+                    "/api/products/?search=laptop&page_size=1"):
+            codes, pages = [], []
+            while url:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                codes.extend(p["code"] for p in response.data["results"])
+                pages.append(response.data)
+                url = response.data["next"]
+            self.assertEqual(codes, expected)
+
+            previous = self.client.get(pages[-1]["previous"])
+            self.assertEqual(previous.data["results"], pages[-2]["results"])
+
+    def test_termino_sin_palabras_no_devuelve_resultados(self):
+        """Verifica que un término sin palabras no rompe el tsquery"""
+        response = self.client.get("/api/products/search_products/?q=%26%21")
+
+        self.assertEqual(self.codes(response), [])
+
+    def test_fallback_sin_postgres_usa_icontains(self):
+        """Verifica el respaldo con icontains para motores distintos a PostgreSQL"""
+        with mock.patch("apps.product.search.is_postgres", return_value=False):
+            response = self.client.get("/api/products/search_products/?q=portát")
+
+        self.assertEqual(self.codes(response), ["NAME-001"])
+
+
+class ProductAutocompleteTest(TestCase):
+    """Pruebas para el endpoint de autocompletado"""
+
+    url = "/api/products/autocomplete/"
+
+    def setUp(self):
+        for i in range(30):
+            Product.objects.create(
+                code=f"CAM-{i:03d}",
+                name=f"Camiseta {i}",
+                price=10.00,
+            )
+        Product.objects.create(
+            code="PANT-001", name="Pantalón oculto", price=10.00, is_active=False)
+        self.client = APIClient()
+
+    def test_devuelve_solo_campos_ligeros(self):
+        """Verifica que cada sugerencia solo trae id, slug, name y code"""
+        response = self.client.get(self.url, {"q": "CAM-001"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["code"], "CAM-001")
+        self.assertEqual(set(response.data[0]), {"id", "slug", "name", "code"})
+
+    def test_limite_por_defecto_y_maximo(self):
+        """Verifica que los resultados se limitan y el máximo se respeta"""
+        default = self.client.get(self.url, {"q": "cam"})
+        capped = self.client.get(self.url, {"q": "cam", "limit": 1000})
+
+        self.assertEqual(len(default.data), 10)
+        self.assertEqual(len(capped.data), 25)
+
+    def test_termino_corto_no_consulta(self):
+        """Verifica que términos de menos de dos caracteres no devuelven nada"""
+        response = self.client.get(self.url, {"q": "c"})
+
+        self.assertEqual(response.data, [])
+
+    def test_anonimos_no_ven_inactivos(self):
+        """Verifica que el autocompletado respeta la visibilidad de get_queryset"""
+        response = self.client.get(self.url, {"q": "PANT"})
+
+        self.assertEqual(response.data, [])
+
+    def test_tolera_errores_de_escritura(self):
+        """Verifica la búsqueda difusa con pg_trgm"""
+        if not has_trigram_support():
+            self.skipTest("pg_trgm no está instalada")
+        response = self.client.get(self.url, {"q": "camisetta"})
+
+        self.assertTrue(response.data)
+        self.assertTrue(response.data[0]["name"].startswith("Camiseta"))
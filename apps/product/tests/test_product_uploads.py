@@ -0,0 +1,103 @@
+import io
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.product.models import Product
+from apps.product.uploads import ProductImageUploadHandler, UploadTooLarge
+from apps.user.models import User
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def png(size, noise=False):
+    image = Image.new("RGB", size, (10, 120, 200))
+    if noise:
+        image = Image.effect_noise(size, 100).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, JOBS={"EAGER": True})
+class ProductImageUploadTest(TestCase):
+    """Pruebas para la subida en streaming con límites de Product.image"""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.vendor = User.objects.create_user(
+            username="vendedor",
+            first_name="Vendedor",
+            last_name="Test",
+            email="vendedor@example.com",
+            dni="9876543210",
+            phone_number="3009876543",
+            password="vendedor123",
+            role=User.VENDEDOR,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.vendor)
+
+    def post(self, content):
+        data = {
+            "code": "UP-1",
+            "name": "Subida",
+            "price": "10.00",
+            "image": SimpleUploadedFile("foto.png", content, content_type="image/png"),
+        }
+        return self.client.post("/api/products/", data, format="multipart")
+
+    def test_subida_valida(self):
+        """Verifica que una imagen dentro de los límites se guarda"""
+        response = self.post(png((300, 200)))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(Product.objects.get(code="UP-1").image)
+
+    @override_settings(PRODUCT_IMAGE_MAX_UPLOAD_SIZE=4 * 1024)
+    def test_archivo_demasiado_grande(self):
+        """Verifica el 413 cuando la imagen supera el tamaño máximo"""
+        response = self.post(png((200, 200), noise=True))
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertFalse(Product.objects.exists())
+
+    @override_settings(PRODUCT_IMAGE_MAX_PIXELS=1_000_000)
+    def test_demasiados_pixeles(self):
+        """Verifica que una bomba de descompresión se rechaza por dimensiones"""
+        # 4000x4000 de un solo color pesa pocos KB pero son 16 MP
+        response = self.post(png((4000, 4000)))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("píxeles", str(response.data["image"]))
+        self.assertFalse(Product.objects.exists())
+
+    def test_handler_escribe_a_disco_y_corta_por_bloques(self):
+        """Verifica que el handler usa archivo temporal y corta al superar el límite"""
+        handler = ProductImageUploadHandler()
+        handler.max_size = 10
+        handler.new_file("image", "foto.png", "image/png", 0)
+
+        self.assertIsInstance(handler.file, TemporaryUploadedFile)
+        handler.receive_data_chunk(b"12345", 0)
+        with self.assertRaises(UploadTooLarge):
+            handler.receive_data_chunk(b"123456", 5)
+
+    @override_settings(PRODUCT_IMAGE_MAX_UPLOAD_SIZE=1024)
+    def test_content_length_excesivo(self):
+        """Verifica el rechazo por Content-Length antes de leer el cuerpo"""
+        handler = ProductImageUploadHandler()
+
+        with self.assertRaises(UploadTooLarge):
+            handler.handle_raw_input(None, {}, 10 * 1024 * 1024, b"x")
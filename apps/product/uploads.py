@@ -0,0 +1,86 @@
+"""
+Subida de imágenes de producto en streaming y con límites.
+
+``ProductImageUploadHandler`` escribe el archivo a disco por bloques (nunca
+lo retiene en memoria) y corta la subida en cuanto supera
+``PRODUCT_IMAGE_MAX_UPLOAD_SIZE``. Al terminar, lee solo la cabecera de la
+imagen para rechazar dimensiones excesivas (bombas de descompresión) antes
+de que Pillow la decodifique al validarla.
+"""
+
+from django.conf import settings
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from PIL import Image, UnidentifiedImageError
+from rest_framework import serializers, status
+from rest_framework.exceptions import APIException
+
+IMAGE_FIELDS = ("image",)
+# Margen para los demás campos y las cabeceras del multipart
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def get_max_upload_size():
+    return getattr(settings, "PRODUCT_IMAGE_MAX_UPLOAD_SIZE", 10 * 1024 * 1024)
+
+
+def get_max_pixels():
+    return getattr(settings, "PRODUCT_IMAGE_MAX_PIXELS", 40_000_000)
+
+
+class UploadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = "El archivo supera el tamaño máximo permitido."
+    default_code = "upload_too_large"
+
+
+def check_image_dimensions(file):
+    """Rechaza imágenes con más de PRODUCT_IMAGE_MAX_PIXELS leyendo solo la cabecera."""
+    max_pixels = get_max_pixels()
+    try:
+        with Image.open(file) as image:
+            width, height = image.size
+    except Image.DecompressionBombError:
+        width = height = None
+    except (UnidentifiedImageError, OSError):
+        # No es una imagen: lo reporta la validación del serializer
+        file.seek(0)
+        return
+    file.seek(0)
+    if width is None or width * height > max_pixels:
+        raise serializers.ValidationError(
+            {"image": [f"La imagen supera el máximo de {max_pixels} píxeles."]})
+
+
+class ProductImageUploadHandler(TemporaryFileUploadHandler):
+    """Handler de subida para crear/editar productos (ver ProductViewSet.initialize_request)."""
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        self.max_size = get_max_upload_size()
+        self.received = 0
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # Rechazo inmediato por Content-Length, sin leer el cuerpo
+        if content_length and content_length > self.max_size + MULTIPART_OVERHEAD:
+            raise UploadTooLarge()
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > self.max_size:
+            self.upload_interrupted()
+            raise UploadTooLarge()
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        if self.field_name in IMAGE_FIELDS:
+            try:
+                check_image_dimensions(file)
+            except serializers.ValidationError:
+                self.upload_interrupted()
+                raise
+        return file
@@ -1,12 +1,35 @@
+from django.conf import settings
 from django.urls import path
 from .views import ProductViewSet
 
+list_actions = {'get': 'list', 'post': 'create'}
+detail_actions = {'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}
+search_actions = {'get': 'search_products'}
+
+if getattr(settings, "ASGI_MODE", False):
+    # Lecturas anónimas con vistas asíncronas (ver async_views.py)
+    from . import async_views
+
+    product_list = async_views.as_async_view(
+        list_actions, async_views.list_products, async_views.LIST_PARAMS)
+    product_detail = async_views.as_async_view(
+        detail_actions, async_views.retrieve_product, async_views.DETAIL_PARAMS)
+    product_search = async_views.as_async_view(
+        search_actions, async_views.search_products, async_views.SEARCH_PARAMS)
+else:
+    product_list = ProductViewSet.as_view(list_actions)
+    product_detail = ProductViewSet.as_view(detail_actions)
+    product_search = ProductViewSet.as_view(search_actions)
+
 urlpatterns = [
-    path("products/", ProductViewSet.as_view({'get': 'list', 'post': 'create'}), name='product-list'),
+    path("products/", product_list, name='product-list'),
     path("products/my_products/", ProductViewSet.as_view({'get': 'my_products'}), name='my-products'),
-    path("products/search_products/", ProductViewSet.as_view({'get': 'search_products'}), name='search-products'),
+    path("products/search_products/", product_search, name='search-products'),
+    path("products/autocomplete/", ProductViewSet.as_view({'get': 'autocomplete'}), name='product-autocomplete'),
+    path("products/import/", ProductViewSet.as_view({'post': 'import_products'}), name='product-import'),
+    path("products/export/", ProductViewSet.as_view({'get': 'export'}), name='product-export'),
     # Soporte para ID (compatibilidad con frontend existente) - DEBE IR PRIMERO
-    path("products/<int:pk>/", ProductViewSet.as_view({'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}), name='product-detail-by-id'),
+    path("products/<int:pk>/", product_detail, name='product-detail-by-id'),
     # Soporte para slug (preferido)
-    path("products/<slug:slug>/", ProductViewSet.as_view({'get': 'retrieve', 'put': 'update', 'patch': 'partial_update', 'delete': 'destroy'}), name='product-detail'),
+    path("products/<slug:slug>/", product_detail, name='product-detail'),
 ]
@@ -1,4 +1,11 @@
-from django.db.models import Q
+import csv
+import io
+from functools import partial
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from rest_framework import filters, permissions, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied
@@ -6,51 +13,143 @@ from rest_framework import generics, viewsets
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+
+from l_atelier.db_router import ReplicaReadMixin
+from l_atelier.metrics import timed
+
+from .cache import bump_catalog_version, cached_response
+from .conditional import (
+    check_write_preconditions,
+    collection_validators,
+    conditional_response,
+    has_etag_preconditions,
+    instance_validators,
+    rows_summary,
+    summary_validators,
+)
+from .exporters import CONTENT_TYPES, ProductExporter, get_export_format, parse_fields
+from .importers import (
+    ProductImporter,
+    ProductImportUploadSerializer,
+    detect_format,
+    iter_rows,
+)
 from .models import Product
-from .serializer import ProductSerializer
+from .pagination import ProductCursorPagination
+from .permissions import IsOwnerOrStaff
+from .rows import ProductRowSerializer
+from .search import ProductSearchFilter, autocomplete_products, search_catalog
+from .serializer import (
+    ProductListSerializer,
+    ProductSerializer,
+    is_compact,
+    select_fields,
+)
+from .uploads import ProductImageUploadHandler
 
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     """
     CRUD para Productos.
     - Lectura pública (solo activos para usuarios anónimos).
     - Cualquier usuario autenticado puede crear productos (vendedores).
     - Solo el propietario o staff puede editar/eliminar sus productos.
+    - Paginación por cursor opcional con ?page_size= / ?cursor=.
+    - Lecturas con ?fields= / ?omit= / ?compact=true: solo esos campos y columnas.
     """
 
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
-    permission_classes = [permissions.IsAuthenticatedOrReadOnly]
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsOwnerOrStaff]
+    filter_backends = [filters.OrderingFilter, ProductSearchFilter]
     search_fields = ["name", "code", "description"]
     ordering_fields = ["created_at", "price", "name"]
     ordering = ["-created_at"]
     lookup_field = "slug"
+    pagination_class = ProductCursorPagination
+    upload_actions = ("create", "update", "partial_update")
+    collection_actions = ("list", "my_products", "search_products")
+    sparse_actions = collection_actions + ("retrieve",)
+    _object = None
+
+    def initialize_request(self, request, *args, **kwargs):
+        # Imágenes a disco por bloques y con límites de bytes/píxeles
+        action_name = self.action_map.get(request.method.lower())
+        if action_name in self.upload_actions:
+            request.upload_handlers = [ProductImageUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
 
     def get_object(self):
         """
-        Override para soportar búsqueda por slug o pk
-        Mantiene compatibilidad con frontend que use IDs
+        Busca por slug o pk (compatibilidad con frontend que use IDs). Se
+        guarda en la vista: una escritura lee el producto una sola vez.
         """
-        queryset = self.filter_queryset(self.get_queryset())
-        
-        # Si viene pk en la URL, buscar por pk
-        if 'pk' in self.kwargs:
-            obj = queryset.filter(pk=self.kwargs['pk']).first()
-            if obj:
-                self.check_object_permissions(self.request, obj)
-                return obj
-        
-        # Si viene slug en la URL, buscar por slug
-        if 'slug' in self.kwargs:
-            obj = queryset.filter(slug=self.kwargs['slug']).first()
-            if obj:
-                self.check_object_permissions(self.request, obj)
-                return obj
-        
-        # Si no se encuentra, lanzar 404
-        from django.http import Http404
-        raise Http404
+        if self._object is None:
+            queryset = self.get_queryset()
+            if self.action == "retrieve":
+                queryset = self.sparse_queryset(queryset)
+            # Sin filter_queryset: búsqueda y orden no aplican a un solo objeto
+            if 'pk' in self.kwargs:
+                lookup = {"pk": self.kwargs['pk']}
+            else:
+                lookup = {"slug": self.kwargs['slug']}
+            obj = get_object_or_404(queryset.order_by(), **lookup)
+            self.check_object_permissions(self.request, obj)
+            self._object = obj
+        return self._object
+
+    def list(self, request, *args, **kwargs):
+        return cached_response(
+            request, "list",
+            lambda: self.list_response(self.filter_queryset(self.get_queryset())))
+
+    def retrieve(self, request, *args, **kwargs):
+        return cached_response(request, "retrieve", self.retrieve_response)
+
+    def retrieve_response(self):
+        """
+        Detalle con ETag/Last-Modified derivados de updated_at; responde 304
+        antes de serializar si el cliente ya tiene la versión actual.
+        """
+        instance = self.get_object()
+        etag, last_modified = instance_validators(
+            self.request, instance, self.get_sparse_fields())
+
+        def produce():
+            with timed(self.request, "serialize"):
+                data = self.get_serializer(instance).data
+            return Response(data)
+
+        return conditional_response(self.request, etag, last_modified, produce)
+
+    def get_serializer_class(self):
+        if self.action in self.collection_actions and is_compact(self.request.query_params):
+            return ProductListSerializer
+        return super().get_serializer_class()
+
+    def get_serializer(self, *args, **kwargs):
+        if self.request.method in ("GET", "HEAD") and self.action in self.sparse_actions:
+            kwargs.setdefault("fields", self.get_sparse_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_sparse_fields(self):
+        """Campos de ?fields= / ?omit= o None si la petición no los restringe."""
+        return select_fields(
+            self.request.query_params, self.get_serializer_class().Meta.fields)
+
+    def sparse_queryset(self, queryset):
+        """
+        Limita el SELECT con ``.only()`` a las columnas de los campos que se van
+        a serializar, más las de orden/cursor y ``updated_at`` para el ETag.
+        """
+        serializer_class = self.get_serializer_class()
+        fields = self.get_sparse_fields()
+        if fields is None:
+            if serializer_class is ProductSerializer:
+                return queryset
+            fields = serializer_class.Meta.fields
+        columns = serializer_class.columns_for(fields)
+        return queryset.only("id", "updated_at", *self.ordering_fields, *columns)
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -65,9 +164,9 @@ class ProductViewSet(viewsets.ModelViewSet):
         Endpoint para que los vendedores vean solo sus propios productos.
         GET /api/products/my_products/
         """
-        products = Product.objects.filter(owner=request.user)
-        serializer = self.get_serializer(products, many=True)
-        return Response(serializer.data)
+        products = self.filter_queryset(
+            Product.objects.filter(owner=request.user))
+        return self.list_response(products)
     
     @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny])
     def search_products(self, request):
@@ -75,6 +174,10 @@ class ProductViewSet(viewsets.ModelViewSet):
         Búsqueda avanzada de productos
         GET /api/products/search_products/?q=termino&min_price=100&max_price=500
         """
+        return self.list_response(self.search_queryset(request))
+
+    def search_queryset(self, request):
+        """Queryset de ``search_products`` (compartido con la vista asíncrona)."""
         queryset = self.get_queryset()
         
         # Parámetros de búsqueda
@@ -82,64 +185,154 @@ class ProductViewSet(viewsets.ModelViewSet):
         min_price = request.query_params.get('min_price', None)
         max_price = request.query_params.get('max_price', None)
         
-        # Filtrar por término de búsqueda
-        if query:
-            queryset = queryset.filter(
-                Q(name__icontains=query) | 
-                Q(description__icontains=query) | 
-                Q(code__icontains=query)
-            )
+        # Filtrar por término de búsqueda (ordenado por relevancia)
+        explicit_ordering = filters.OrderingFilter.ordering_param in request.query_params
+        queryset = search_catalog(queryset, query, rank=not explicit_ordering)
         
         # Filtrar por rango de precios
         if min_price:
             queryset = queryset.filter(price__gte=min_price)
         if max_price:
             queryset = queryset.filter(price__lte=max_price)
-        
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+
+        if explicit_ordering or not query:
+            queryset = filters.OrderingFilter().filter_queryset(
+                request, queryset, self)
+        return queryset
+
+    @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny])
+    def autocomplete(self, request):
+        """
+        Sugerencias para el buscador (tolera errores de escritura)
+        GET /api/products/autocomplete/?q=lapt&limit=10
+        """
+        default = getattr(settings, "PRODUCT_AUTOCOMPLETE_LIMIT", 10)
+        maximum = getattr(settings, "PRODUCT_AUTOCOMPLETE_MAX_LIMIT", 25)
+        try:
+            limit = int(request.query_params.get('limit', default))
+        except ValueError:
+            limit = default
+        limit = max(1, min(limit, maximum))
+
+        results = autocomplete_products(
+            self.get_queryset(), request.query_params.get('q'), limit)
+        return Response(results)
+
+    @action(detail=False, methods=['post'], url_path='import',
+            permission_classes=[permissions.IsAuthenticated])
+    def import_products(self, request):
+        """
+        Importación masiva desde un archivo CSV o JSONL (multipart, campo "file")
+        POST /api/products/import/
+        """
+        if not (request.user.is_staff or request.user.role == "VENDEDOR"):
+            raise PermissionDenied("Solo vendedores o administradores pueden crear productos.")
+        upload = ProductImportUploadSerializer(data=request.data)
+        upload.is_valid(raise_exception=True)
+        file = upload.validated_data["file"]
+        try:
+            fmt = detect_format(file.name, upload.validated_data.get("file_format"))
+        except ValueError as exc:
+            return Response({"file_format": [str(exc)]}, status=400)
+
+        stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        importer = ProductImporter(
+            request.user, batch_size=upload.validated_data.get("batch_size"))
+        try:
+            summary = importer.run(iter_rows(stream, fmt))
+        except (UnicodeDecodeError, csv.Error) as exc:
+            return Response({"file": [f"Archivo ilegible: {exc}"]}, status=400)
+        finally:
+            stream.detach()
+        return Response(summary, status=201 if summary["created"] else 200)
+
+    @action(detail=False, methods=['get'], permission_classes=[permissions.IsAdminUser])
+    def export(self, request):
+        """
+        Exportación completa del catálogo en streaming
+        GET /api/products/export/?output=csv|jsonl|ndjson&fields=id,code,price
+        """
+        if not request.user.is_staff:
+            raise PermissionDenied("Solo administradores pueden exportar el catálogo.")
+        try:
+            fmt = get_export_format(request.query_params.get('output'))
+            fields = parse_fields(request.query_params.get('fields'))
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=400)
+
+        exporter = ProductExporter(fields, fmt, request=request)
+        response = StreamingHttpResponse(
+            exporter.lines(Product.objects.all()), content_type=CONTENT_TYPES[fmt])
+        filename = f"productos-{timezone.now():%Y%m%d}.{fmt}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    def list_response(self, queryset):
+        """
+        Serializa una colección aplicando la paginación por cursor si se pidió.
+        Con If-None-Match (o paginación) el ETag sale de una consulta agregada
+        y el 304 se responde antes de serializar; sin ellos no hay 304 posible
+        y el resumen se calcula sobre las filas ya leídas, sin esa consulta.
+        """
+        queryset = self.sparse_queryset(queryset)
+        if (has_etag_preconditions(self.request)
+                or self.paginator.is_requested(self.request)):
+            etag, last_modified = collection_validators(self.request, queryset)
+            return conditional_response(
+                self.request, etag, last_modified,
+                partial(self.serialize_collection, queryset), compare_dates=False)
+        queryset, serialize = self.collection_serializer(queryset)
+        rows = list(queryset)
+        etag, last_modified = summary_validators(self.request, rows_summary(rows))
+        return conditional_response(
+            self.request, etag, last_modified,
+            partial(self.serialize_rows, rows, serialize), compare_dates=False)
+
+    def serialize_collection(self, queryset):
+        queryset, serialize = self.collection_serializer(queryset)
+        page = self.paginate_queryset(queryset)
+        # Se evalúa antes para que la consulta no cuente como serialize
+        rows = list(queryset) if page is None else page
+        return self.serialize_rows(rows, serialize, paginated=page is not None)
+
+    def serialize_rows(self, rows, serialize, paginated=False):
+        with timed(self.request, "serialize"):
+            data = serialize(rows)
+        if paginated:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def collection_serializer(self, queryset):
+        """
+        (queryset, serialize) para una colección. Con ``PRODUCT_FAST_SERIALIZER``
+        el queryset devuelve dicts de ``.values()`` y ``ProductRowSerializer``
+        los serializa sin instanciar modelos ni campos DRF por fila.
+        """
+        if not getattr(settings, "PRODUCT_FAST_SERIALIZER", True):
+            return queryset, lambda rows: self.get_serializer(rows, many=True).data
+        rows = ProductRowSerializer(
+            self.get_serializer_class(), self.get_sparse_fields(), self.request)
+        columns = {"id", "updated_at", *self.ordering_fields, *rows.columns}
+        return queryset.values(*columns), rows.serialize
 
     def perform_create(self, serializer):
         if not (self.request.user.is_staff or self.request.user.role == "VENDEDOR"):
            raise PermissionDenied("Solo vendedores o administradores pueden crear productos.")
         serializer.save(owner=self.request.user)
+        bump_catalog_version()
 
     def update(self, request, *args, **kwargs):
         """
-        Override update para verificar permisos antes de actualizar
+        PUT y PATCH (``partial_update`` delega aquí): If-Match antes de
+        validar. Los permisos los aplica ``IsOwnerOrStaff`` en get_object.
         """
-        instance = self.get_object()
-        # Verificar que el usuario sea el propietario o staff
-        if not (request.user.is_staff or instance.owner == request.user):
-            raise PermissionDenied(
-                "No puedes actualizar productos de otros usuarios.")
+        check_write_preconditions(request, self.get_object())
         return super().update(request, *args, **kwargs)
 
-    def partial_update(self, request, *args, **kwargs):
-        """
-        Override partial_update para verificar permisos antes de actualizar
-        """
-        instance = self.get_object()
-        # Verificar que el usuario sea el propietario o staff
-        if not (request.user.is_staff or instance.owner == request.user):
-            raise PermissionDenied(
-                "No puedes actualizar productos de otros usuarios.")
-        return super().partial_update(request, *args, **kwargs)
-
     def perform_update(self, serializer):
-        # solo staff o creador pueden actualizar
-        if not (
-                self.request.user.is_staff or serializer.instance.owner == self.request.user):
-            raise PermissionDenied(
-                "No puedes actualizar productos de otros usuarios.")
         serializer.save()
+        bump_catalog_version()
 
     def perform_destroy(self, instance):
-        # solo el creador puede eliminar el producto
-        if instance.owner == self.request.user or self.request.user.is_staff:
-            instance.delete()
-        else:
-            from rest_framework.exceptions import PermissionDenied
-
-            raise PermissionDenied(
-                "No puedes eliminar productos de otros usuarios.")
+        instance.delete()
+        bump_catalog_version()
@@ -0,0 +1,51 @@
+"""
+Caché corta de usuarios autenticados por JWT (ver CachedJWTAuthentication).
+
+Solo guarda los campos que usan la autenticación y los permisos; el hash de
+la contraseña y los datos del perfil no van a la caché compartida. El
+usuario se reconstruye con el resto de campos diferidos.
+
+Se invalida con las señales post_save/post_delete de User, que cubren
+User.save, MeView, UserViewSet y las ediciones desde el admin.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+
+KEY_PREFIX = "user:auth"
+CACHED_FIELDS = ("id", "username", "role", "is_active", "is_staff", "is_superuser")
+
+
+def get_user_cache_timeout():
+    return getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 60)
+
+
+def get_user_cache():
+    return caches[getattr(settings, "AUTH_USER_CACHE_ALIAS", "default")]
+
+
+def user_cache_key(user_id):
+    return f"{KEY_PREFIX}:{user_id}"
+
+
+def get_cached_user(user_id):
+    """``(usuario, extra)`` guardados por ``cache_user`` o None."""
+    entry = get_user_cache().get(user_cache_key(user_id))
+    if entry is None:
+        return None
+    fields, extra = entry
+    User = get_user_model()
+    names = [f.attname for f in User._meta.concrete_fields if f.attname in fields]
+    return User.from_db(None, names, [fields[name] for name in names]), extra
+
+
+def cache_user(user, **extra):
+    timeout = get_user_cache_timeout()
+    if timeout:
+        fields = {name: getattr(user, name) for name in CACHED_FIELDS}
+        get_user_cache().set(user_cache_key(user.pk), (fields, extra), timeout)
+
+
+def invalidate_cached_user(user_id):
+    get_user_cache().delete(user_cache_key(user_id))
@@ -0,0 +1,79 @@
+"""
+Política de hashing de contraseñas configurable desde settings.
+
+``PASSWORD_HASHING["ALGORITHM"]`` elige el hasher preferido (pbkdf2, scrypt
+o argon2) y el resto de claves fija su costo. Los hashers leen el costo en
+cada uso, así que al cambiarlo ``check_password`` detecta el hash viejo
+(``must_update``) y lo regenera en el siguiente login exitoso.
+"""
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, identify_hasher
+
+DEFAULTS = {
+    "ALGORITHM": "pbkdf2",
+    "PBKDF2_ITERATIONS": hashers.PBKDF2PasswordHasher.iterations,
+    "SCRYPT_WORK_FACTOR": hashers.ScryptPasswordHasher.work_factor,
+    "SCRYPT_BLOCK_SIZE": hashers.ScryptPasswordHasher.block_size,
+    "SCRYPT_PARALLELISM": hashers.ScryptPasswordHasher.parallelism,
+    "ARGON2_TIME_COST": hashers.Argon2PasswordHasher.time_cost,
+    "ARGON2_MEMORY_COST": hashers.Argon2PasswordHasher.memory_cost,
+    "ARGON2_PARALLELISM": hashers.Argon2PasswordHasher.parallelism,
+}
+
+
+def get_policy():
+    return {**DEFAULTS, **getattr(settings, "PASSWORD_HASHING", {})}
+
+
+def is_password_hashed(value):
+    """True si ``value`` ya es un hash de cualquier hasher configurado (o inutilizable)."""
+    if value.startswith(UNUSABLE_PASSWORD_PREFIX):
+        return True
+    try:
+        identify_hasher(value)
+    except ValueError:
+        return False
+    return True
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return get_policy()["PBKDF2_ITERATIONS"]
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    @property
+    def work_factor(self):
+        return get_policy()["SCRYPT_WORK_FACTOR"]
+
+    @property
+    def block_size(self):
+        return get_policy()["SCRYPT_BLOCK_SIZE"]
+
+    @property
+    def parallelism(self):
+        return get_policy()["SCRYPT_PARALLELISM"]
+
+    @property
+    def maxmem(self):
+        # hashlib limita scrypt a 32 MB por defecto; se amplía si el costo lo exige
+        return 256 * self.work_factor * self.block_size * self.parallelism
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """Requiere ``argon2-cffi`` instalado."""
+
+    @property
+    def time_cost(self):
+        return get_policy()["ARGON2_TIME_COST"]
+
+    @property
+    def memory_cost(self):
+        return get_policy()["ARGON2_MEMORY_COST"]
+
+    @property
+    def parallelism(self):
+        return get_policy()["ARGON2_PARALLELISM"]
@@ -0,0 +1,55 @@
+import time
+
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.crypto import get_random_string
+
+from apps.user.hashers import get_policy
+
+ALGORITHMS = {
+    "pbkdf2": "pbkdf2_sha256",
+    "scrypt": "scrypt",
+    "argon2": "argon2",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide hashes por segundo por núcleo (un solo hilo) con la política "
+        "de PASSWORD_HASHING, para elegir el costo según la CPU del despliegue."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--algorithms", default=None,
+            help="Lista separada por comas (pbkdf2,scrypt,argon2); por defecto el configurado")
+        parser.add_argument("--seconds", type=float, default=2.0,
+                            help="Duración mínima de cada medición")
+
+    def handle(self, *args, **options):
+        names = (options["algorithms"] or get_policy()["ALGORITHM"]).split(",")
+        for name in names:
+            name = name.strip()
+            if name not in ALGORITHMS:
+                raise CommandError(f"Algoritmo desconocido: '{name}'.")
+            try:
+                hasher = get_hasher(ALGORITHMS[name])
+                hasher.encode("calentamiento", hasher.salt())
+            except ValueError as exc:
+                self.stderr.write(f"{name}: no disponible ({exc})")
+                continue
+            rate = self.measure(hasher, options["seconds"])
+            self.stdout.write(
+                f"{name}: {rate:.1f} hashes/s por núcleo "
+                f"({1000 / rate:.1f} ms por login)")
+
+    def measure(self, hasher, seconds):
+        password = get_random_string(16)
+        count = 0
+        start = time.perf_counter()
+        while True:
+            hasher.encode(password, hasher.salt())
+            count += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= seconds:
+                return count / elapsed
@@ -1,6 +1,10 @@
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+
+from .cache import invalidate_cached_user
+from .hashers import is_password_hashed
 
 
 class User(AbstractUser):
@@ -70,6 +74,16 @@ class User(AbstractUser):
         self.first_name = self.first_name.upper()
         self.last_name = self.last_name.upper()
         self.email = self.email.lower()
-        if self.password and not self.password.startswith("pbkdf2_"):
+        # Solo texto plano: un hash de cualquier hasher configurado se respeta
+        if self.password and not is_password_hashed(self.password):
             self.set_password(self.password)
         super().save(*args, **kwargs)
+
+
+def invalidate_user_cache(sender, instance, **kwargs):
+    # Cubre User.save, MeView.put/delete, UserViewSet y el admin
+    invalidate_cached_user(instance.pk)
+
+
+post_save.connect(invalidate_user_cache, sender=User)
+post_delete.connect(invalidate_user_cache, sender=User)
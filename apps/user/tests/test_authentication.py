@@ -0,0 +1,173 @@
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from apps.user.cache import CACHED_FIELDS, user_cache_key
+from apps.user.models import User
+
+
+@override_settings(AUTH_USER_CACHE_TIMEOUT=60)
+class CachedJWTAuthenticationTest(TestCase):
+    """Tests para la autenticación JWT con usuario en caché"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='cacheado',
+            first_name='Cache',
+            last_name='User',
+            email='cache@test.com',
+            dni='5555555555',
+            phone_number='3005555555',
+            password='cachepass123',
+            role=User.VENDEDOR,
+        )
+        self.client = APIClient()
+        token = self.client.post(
+            '/api/auth/login/',
+            {'username': 'cacheado', 'password': 'cachepass123'},
+            format='json',
+        ).data['access']
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def login(self, password):
+        return APIClient().post(
+            '/api/auth/login/',
+            {'username': 'cacheado', 'password': password},
+            format='json',
+        ).data['access']
+
+    def get_as(self, token):
+        return APIClient().get(
+            '/api/products/my_products/', HTTP_AUTHORIZATION=f'Bearer {token}')
+
+    def user_queries(self, queries):
+        return [q['sql'] for q in queries if 'FROM "user"' in q['sql']]
+
+    def test_segunda_peticion_sin_consultar_usuario(self):
+        """Test: Tras la primera petición el usuario sale de la caché"""
+        self.client.get('/api/products/my_products/')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/products/my_products/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.user_queries(queries), [])
+
+    def test_cache_sin_hash_de_contrasena(self):
+        """Test: La caché solo guarda los campos de permisos; /me/ carga el perfil"""
+        self.client.get('/api/auth/me/')
+
+        fields, _ = cache.get(user_cache_key(self.user.pk))
+        self.assertEqual(set(fields), set(CACHED_FIELDS))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/auth/me/')
+
+        self.assertEqual(len(self.user_queries(queries)), 1)
+        self.assertEqual(response.data['email'], 'cache@test.com')
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT=0)
+    def test_sin_cache_compartida_consulta_el_usuario(self):
+        """Test: Con el timeout en 0 cada petición lee el usuario de la base"""
+        self.client.get('/api/products/my_products/')
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/products/my_products/')
+
+        self.assertEqual(len(self.user_queries(queries)), 1)
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+
+    def test_revoke_token_sin_hash_en_cache(self):
+        """Test: CHECK_REVOKE_TOKEN compara con la huella guardada, no con el hash"""
+        with mock.patch.object(api_settings, 'CHECK_REVOKE_TOKEN', True):
+            old = self.login('cachepass123')
+            # Cambio de contraseña sin señales: no invalida la caché
+            User.objects.filter(pk=self.user.pk).update(password=make_password('nueva123'))
+            new = self.login('nueva123')
+            self.assertEqual(self.get_as(new).status_code, status.HTTP_200_OK)
+
+            password = User.objects.get(pk=self.user.pk).password
+            _, extra = cache.get(user_cache_key(self.user.pk))
+            self.assertEqual(extra, {'revoke': get_md5_hash_password(password)})
+            self.assertEqual(self.get_as(new).status_code, status.HTTP_200_OK)
+            response = self.get_as(old)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_save_invalida_la_cache(self):
+        """Test: Un cambio en el usuario se ve en la siguiente petición"""
+        self.client.get('/api/auth/me/')
+        self.user.role = User.CLIENTE
+        self.user.save()
+
+        response = self.client.get('/api/auth/me/')
+
+        self.assertEqual(response.data['role'], User.CLIENTE)
+
+    def test_usuario_desactivado_es_rechazado(self):
+        """Test: Desactivar al usuario corta el acceso aunque estuviera en caché"""
+        self.client.get('/api/auth/me/')
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get('/api/auth/me/')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_me_put_invalida_la_cache(self):
+        """Test: MeView.put refresca el usuario en caché"""
+        self.client.put('/api/auth/me/', {'first_name': 'Nuevo'}, format='json')
+
+        response = self.client.get('/api/auth/me/')
+
+        self.assertEqual(response.data['first_name'], 'NUEVO')
+
+    def test_me_delete_invalida_la_cache(self):
+        """Test: Tras eliminar la cuenta el token deja de funcionar"""
+        self.client.get('/api/auth/me/')
+        self.client.delete('/api/auth/me/')
+
+        response = self.client.get('/api/auth/me/')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_edicion_desde_admin_invalida_la_cache(self):
+        """Test: Editar el usuario desde el admin invalida la caché"""
+        admin = User.objects.create_superuser(
+            username='root',
+            first_name='Root',
+            last_name='Admin',
+            email='root@test.com',
+            dni='6666666666',
+            phone_number='3006666666',
+            password='rootpass123',
+            role=User.ADMINISTRADOR,
+        )
+        self.client.get('/api/auth/me/')
+        browser = Client()
+        browser.force_login(admin)
+
+        admin_response = browser.post(f'/admin/user/user/{self.user.pk}/change/', {
+            'username': 'cacheado',
+            'first_name': 'Editado',
+            'last_name': 'User',
+            'email': 'cache@test.com',
+            'dni': '5555555555',
+            'phone_number': '3005555555',
+            'role': User.VENDEDOR,
+            'is_active': 'on',
+            'date_joined_0': '2026-01-01',
+            'date_joined_1': '00:00:00',
+        })
+
+        self.assertEqual(admin_response.status_code, 302)
+        response = self.client.get('/api/auth/me/')
+        self.assertEqual(response.data['first_name'], 'EDITADO')
@@ -0,0 +1,102 @@
+from io import StringIO
+
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from apps.user.models import User
+
+FAST_PBKDF2 = {"ALGORITHM": "pbkdf2", "PBKDF2_ITERATIONS": 1000}
+SCRYPT_HASHERS = [
+    "apps.user.hashers.ScryptPasswordHasher",
+    "apps.user.hashers.PBKDF2PasswordHasher",
+]
+FAST_SCRYPT = {"ALGORITHM": "scrypt", "SCRYPT_WORK_FACTOR": 2**10}
+
+
+@override_settings(PASSWORD_HASHING=FAST_PBKDF2)
+class PasswordHashingPolicyTest(TestCase):
+    """Tests para la política de hashing configurable"""
+
+    def create_user(self, password="clave-segura-1"):
+        return User.objects.create_user(
+            username='hasheado',
+            first_name='Hash',
+            last_name='User',
+            email='hash@test.com',
+            dni='7777777777',
+            phone_number='3007777777',
+            password=password,
+        )
+
+    def login(self, password="clave-segura-1"):
+        return self.client.post(
+            '/api/auth/login/',
+            {'username': 'hasheado', 'password': password},
+            content_type='application/json',
+        )
+
+    def test_usa_las_iteraciones_configuradas(self):
+        """Test: El hash usa PBKDF2_ITERATIONS de settings"""
+        user = self.create_user()
+
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$1000$'))
+
+    def test_save_no_vuelve_a_hashear_otros_hashers(self):
+        """Test: Un hash scrypt no se toma como texto plano al guardar"""
+        user = self.create_user()
+        with override_settings(PASSWORD_HASHING=FAST_SCRYPT):
+            user.password = make_password('otra-clave-2', hasher='scrypt')
+        user.save()
+
+        user.refresh_from_db()
+        with override_settings(PASSWORD_HASHING=FAST_SCRYPT):
+            self.assertTrue(user.check_password('otra-clave-2'))
+
+    def test_save_respeta_password_inutilizable(self):
+        """Test: set_unusable_password sobrevive a save()"""
+        user = self.create_user()
+        user.set_unusable_password()
+        user.save()
+
+        user.refresh_from_db()
+        self.assertFalse(user.has_usable_password())
+
+    def test_save_hashea_texto_plano(self):
+        """Test: Una contraseña en texto plano se sigue hasheando"""
+        user = self.create_user()
+        user.password = 'texto-plano-3'
+        user.save()
+
+        user.refresh_from_db()
+        self.assertTrue(user.check_password('texto-plano-3'))
+
+    def test_login_regenera_hash_al_cambiar_costo(self):
+        """Test: Tras subir las iteraciones el login actualiza el hash"""
+        self.create_user()
+
+        with override_settings(PASSWORD_HASHING={**FAST_PBKDF2, "PBKDF2_ITERATIONS": 2000}):
+            response = self.login()
+
+        self.assertEqual(response.status_code, 200)
+        password = User.objects.get(username='hasheado').password
+        self.assertTrue(password.startswith('pbkdf2_sha256$2000$'))
+
+    def test_login_migra_al_hasher_preferido(self):
+        """Test: Al cambiar a scrypt el login migra el hash sin romper el acceso"""
+        self.create_user()
+
+        with override_settings(PASSWORD_HASHERS=SCRYPT_HASHERS, PASSWORD_HASHING=FAST_SCRYPT):
+            self.assertEqual(self.login().status_code, 200)
+            user = User.objects.get(username='hasheado')
+            self.assertTrue(user.password.startswith('scrypt$'))
+            self.assertEqual(self.login().status_code, 200)
+
+    def test_comando_benchmark(self):
+        """Test: El micro-benchmark reporta hashes por segundo por núcleo"""
+        out = StringIO()
+
+        call_command('benchmark_password_hashers', seconds=0.05, stdout=out)
+
+        self.assertIn('pbkdf2:', out.getvalue())
+        self.assertIn('hashes/s por núcleo', out.getvalue())
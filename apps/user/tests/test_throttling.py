@@ -0,0 +1,159 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.user.models import User
+from apps.user.throttling import CacheBucketStore, LocalMemoryBucketStore, get_store
+
+RATES = {
+    "ENABLED": True,
+    "STORE": "apps.user.throttling.LocalMemoryBucketStore",
+    "RATES": {"login_ip": "5/min", "login_username": "2/min", "register_ip": "1/hour"},
+}
+
+
+@override_settings(AUTH_THROTTLE=RATES)
+class AuthThrottleTest(TestCase):
+    """Tests para el límite de intentos de login y registro"""
+
+    def setUp(self):
+        get_store().reset()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='limitado',
+            first_name='Limit',
+            last_name='User',
+            email='limit@test.com',
+            dni='8888888888',
+            phone_number='3008888888',
+            password='limitpass123',
+        )
+
+    def login(self, username='limitado', password='incorrecta', **extra):
+        return self.client.post(
+            '/api/auth/login/', {'username': username, 'password': password},
+            format='json', **extra)
+
+    def test_rechaza_por_username_antes_de_check_password(self):
+        """Test: El tercer intento sobre la misma cuenta da 429 sin hashear"""
+        self.login()
+        self.login()
+
+        with mock.patch.object(User, 'check_password') as check_password:
+            response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+        check_password.assert_not_called()
+
+    def test_rechaza_por_ip_con_usernames_distintos(self):
+        """Test: El balde por IP limita aunque cambie el username"""
+        codes = [self.login(username=f'user{i}').status_code for i in range(6)]
+
+        self.assertEqual(codes[:5], [401] * 5)
+        self.assertEqual(codes[5], status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_ips_distintas_tienen_baldes_distintos(self):
+        """Test: Otra IP no hereda el límite"""
+        for i in range(5):
+            self.login(username=f'user{i}')
+
+        response = self.login(username='otro', REMOTE_ADDR='10.0.0.2')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_rotar_x_forwarded_for_no_reinicia_el_balde(self):
+        """Test: Cambiar X-Forwarded-For no da un balde nuevo"""
+        codes = [
+            self.login(username=f'user{i}', HTTP_X_FORWARDED_FOR=f'10.1.0.{i}').status_code
+            for i in range(6)
+        ]
+
+        self.assertEqual(codes[5], status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_ip_del_proxy_de_confianza(self):
+        """Test: Con NUM_PROXIES solo cuenta el salto que agregó el proxy"""
+        rest = {**settings.REST_FRAMEWORK, 'NUM_PROXIES': 1}
+        with override_settings(REST_FRAMEWORK=rest):
+            codes = [
+                self.login(username=f'user{i}',
+                           HTTP_X_FORWARDED_FOR=f'10.1.0.{i}, 200.1.1.1').status_code
+                for i in range(6)
+            ]
+            other = self.login(username='otro', HTTP_X_FORWARDED_FOR='200.1.1.2')
+
+        self.assertEqual(codes[5], status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(other.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_registro_limitado_por_ip(self):
+        """Test: El registro se rechaza antes de set_password al agotar el balde"""
+        data = {'username': 'nuevo', 'password': 'x'}
+        self.client.post('/api/auth/register/', data, format='json')
+
+        with mock.patch.object(User, 'set_password') as set_password:
+            response = self.client.post('/api/auth/register/', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        set_password.assert_not_called()
+
+    def test_balde_se_rellena_con_el_tiempo(self):
+        """Test: Tras el periodo de relleno se vuelve a permitir"""
+        store = LocalMemoryBucketStore()
+        with mock.patch('apps.user.throttling.time.monotonic', side_effect=[0, 0, 30]):
+            self.assertEqual(store.take('k', 1, 1 / 60), 0)
+            self.assertAlmostEqual(store.take('k', 1, 1 / 60), 60)
+            self.assertAlmostEqual(store.take('k', 1, 1 / 60), 30)
+
+    def test_descarta_la_clave_usada_hace_mas_tiempo(self):
+        """Test: Al pasar max_keys se expulsa solo el balde menos reciente"""
+        store = LocalMemoryBucketStore()
+        store.max_keys = 2
+        store.take('a', 1, 1 / 60)
+        store.take('b', 1, 1 / 60)
+        store.take('a', 1, 1 / 60)
+        store.take('c', 1, 1 / 60)
+
+        self.assertEqual(list(store.buckets), ['a', 'c'])
+
+    def test_contadores_para_monitoreo(self):
+        """Test: Los contadores registran intentos permitidos y rechazados"""
+        for _ in range(3):
+            self.login()
+        admin = User.objects.create_user(
+            username='admin', first_name='A', last_name='B', email='a@test.com',
+            dni='9999999999', phone_number='3009999999', password='adminpass',
+            is_staff=True)
+        self.client.force_authenticate(user=admin)
+
+        response = self.client.get('/api/auth/throttle-stats/')
+
+        self.assertEqual(response.data['login_username:allowed'], 2)
+        self.assertEqual(response.data['login_username:throttled'], 1)
+        self.assertEqual(response.data['login_ip:allowed'], 3)
+
+    @override_settings(AUTH_THROTTLE={**RATES, "STORE": "apps.user.throttling.CacheBucketStore"})
+    def test_store_compartido_en_cache(self):
+        """Test: El almacén en caché aplica el mismo límite"""
+        cache.clear()
+        self.login()
+        self.login()
+
+        self.assertEqual(self.login().status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    @override_settings(AUTH_THROTTLE={**RATES, "STORE": "apps.user.throttling.CacheBucketStore"})
+    def test_reset_del_store_en_cache_vacia_los_baldes(self):
+        """Test: reset() del almacén en caché devuelve las fichas y los contadores"""
+        cache.clear()
+        store = CacheBucketStore()
+        self.assertEqual(store.take('k', 1, 1 / 60), 0)
+        self.assertGreater(store.take('k', 1, 1 / 60), 0)
+        store.incr('login_ip:allowed')
+
+        store.reset()
+
+        self.assertEqual(store.take('k', 1, 1 / 60), 0)
+        self.assertEqual(store.get_counters(['login_ip:allowed']), {'login_ip:allowed': 0})
@@ -0,0 +1,217 @@
+"""
+Límite de intentos para login y registro con token buckets.
+
+Cada clave (IP o username) tiene un balde de ``capacidad`` fichas que se
+rellena a ``capacidad / periodo`` por segundo; cada intento consume una.
+DRF evalúa los throttles en ``initial()``, antes de que la vista llegue a
+``check_password`` / ``set_password``, así que una ráfaga rechazada no
+cuesta trabajo de hashing.
+
+El almacén es configurable: ``LocalMemoryBucketStore`` (por proceso) o
+``CacheBucketStore`` (compartido entre workers vía la caché de Django).
+"""
+
+import logging
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "ENABLED": True,
+    "STORE": "apps.user.throttling.LocalMemoryBucketStore",
+    "CACHE_ALIAS": "default",
+    "RATES": {
+        "login_ip": "20/min",
+        "login_username": "5/min",
+        "register_ip": "10/hour",
+    },
+}
+PERIODS = {"s": 1, "sec": 1, "min": 60, "hour": 3600, "day": 86400}
+
+_stores = {}
+
+
+def get_throttle_settings():
+    return {**DEFAULTS, **getattr(settings, "AUTH_THROTTLE", {})}
+
+
+def parse_rate(rate):
+    """``"5/min"`` -> (capacidad 5, 5/60 fichas por segundo)."""
+    capacity, period = rate.split("/")
+    capacity = int(capacity)
+    return capacity, capacity / PERIODS[period]
+
+
+def get_store():
+    path = get_throttle_settings()["STORE"]
+    if path not in _stores:
+        _stores[path] = import_string(path)()
+    return _stores[path]
+
+
+class LocalMemoryBucketStore:
+    """
+    Baldes en memoria del proceso; cada worker de gunicorn limita por separado.
+    Con más de ``max_keys`` claves descarta la usada hace más tiempo (LRU), en
+    O(1) por intento aunque lleguen muchas IPs o usernames distintos.
+    """
+
+    max_keys = 100_000
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = OrderedDict()
+        self.counters = Counter()
+
+    def take(self, key, capacity, refill_rate):
+        """Consume una ficha; devuelve 0 si se permitió o los segundos de espera."""
+        now = time.monotonic()
+        with self.lock:
+            tokens, updated = self.buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_rate)
+            if tokens >= 1:
+                self.buckets[key] = (tokens - 1, now)
+                wait = 0.0
+            else:
+                self.buckets[key] = (tokens, now)
+                wait = (1 - tokens) / refill_rate
+            self.buckets.move_to_end(key)
+            if len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+        return wait
+
+    def incr(self, name):
+        with self.lock:
+            self.counters[name] += 1
+
+    def get_counters(self, names):
+        with self.lock:
+            return {name: self.counters[name] for name in names}
+
+    def reset(self):
+        with self.lock:
+            self.buckets.clear()
+            self.counters.clear()
+
+
+class CacheBucketStore:
+    """
+    Baldes en la caché de Django (p. ej. Redis) compartidos entre workers y
+    servidores. La lectura-escritura no es atómica: bajo concurrencia alta
+    puede dejar pasar algún intento extra, nunca bloquear de más.
+
+    Las claves de los baldes llevan una generación: ``reset`` la incrementa y
+    los baldes anteriores quedan huérfanos hasta expirar.
+    """
+
+    prefix = "throttle"
+
+    def __init__(self):
+        self.cache = caches[get_throttle_settings()["CACHE_ALIAS"]]
+
+    def generation_key(self):
+        return f"{self.prefix}:generation"
+
+    def get_generation(self):
+        return self.cache.get_or_set(self.generation_key(), 0, None)
+
+    def take(self, key, capacity, refill_rate):
+        now = time.time()
+        cache_key = f"{self.prefix}:{self.get_generation()}:{key}"
+        tokens, updated = self.cache.get(cache_key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * refill_rate)
+        wait = 0.0 if tokens >= 1 else (1 - tokens) / refill_rate
+        if not wait:
+            tokens -= 1
+        # Expira cuando el balde ya se habría rellenado por completo
+        self.cache.set(cache_key, (tokens, now), int(capacity / refill_rate) + 1)
+        return wait
+
+    def incr(self, name):
+        key = f"{self.prefix}:counter:{name}"
+        self.cache.add(key, 0, None)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.set(key, 1, None)
+
+    def get_counters(self, names):
+        keys = {f"{self.prefix}:counter:{name}": name for name in names}
+        values = self.cache.get_many(list(keys))
+        return {name: values.get(key, 0) for key, name in keys.items()}
+
+    def reset(self):
+        try:
+            self.cache.incr(self.generation_key())
+        except ValueError:
+            self.cache.set(self.generation_key(), 1, None)
+        self.cache.delete_many([f"{self.prefix}:counter:{name}" for name in counter_names()])
+
+
+def counter_names():
+    return [
+        f"{scope}:{outcome}"
+        for scope in get_throttle_settings()["RATES"]
+        for outcome in ("allowed", "throttled")
+    ]
+
+
+def get_throttle_counters():
+    """Intentos permitidos y rechazados por scope, para monitoreo."""
+    return get_store().get_counters(counter_names())
+
+
+class TokenBucketThrottle(BaseThrottle, metaclass=ABCMeta):
+    scope = None
+
+    @abstractmethod
+    def get_key(self, request):
+        """Identidad del balde dentro de ``scope``; None no limita la petición."""
+
+    def allow_request(self, request, view):
+        config = get_throttle_settings()
+        rate = config["RATES"].get(self.scope)
+        key = self.get_key(request)
+        if not config["ENABLED"] or rate is None or key is None:
+            return True
+
+        store = get_store()
+        self.wait_time = store.take(f"{self.scope}:{key}", *parse_rate(rate))
+        allowed = not self.wait_time
+        store.incr(f"{self.scope}:{'allowed' if allowed else 'throttled'}")
+        if not allowed:
+            logger.warning("Throttled scope=%s key=%s wait=%.1fs", self.scope, key, self.wait_time)
+        return allowed
+
+    def wait(self):
+        return self.wait_time
+
+
+class LoginIPThrottle(TokenBucketThrottle):
+    scope = "login_ip"
+
+    def get_key(self, request):
+        return self.get_ident(request)
+
+
+class LoginUsernameThrottle(TokenBucketThrottle):
+    scope = "login_username"
+
+    def get_key(self, request):
+        username = request.data.get("username")
+        return username.lower() if isinstance(username, str) and username else None
+
+
+class RegisterIPThrottle(TokenBucketThrottle):
+    scope = "register_ip"
+
+    def get_key(self, request):
+        return self.get_ident(request)
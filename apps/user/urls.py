@@ -2,7 +2,7 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import TokenRefreshView
 
-from .views import LoginView, MeView, RegisterView, UserViewSet
+from .views import LoginView, MeView, RegisterView, ThrottleStatsView, UserViewSet
 
 app_name = 'user'
 
@@ -20,4 +20,8 @@ urlpatterns = [
         TokenRefreshView.as_view(),
         name="token_refresh"),
     path("auth/me/", MeView.as_view(), name="me"),
+    path(
+        "auth/throttle-stats/",
+        ThrottleStatsView.as_view(),
+        name="throttle_stats"),
 ]
@@ -5,14 +5,21 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from l_atelier.db_router import ReplicaReadMixin
 from .models import User
 from .serializer import RegisterSerializer, UserSerializer
+from .throttling import (
+    LoginIPThrottle,
+    LoginUsernameThrottle,
+    RegisterIPThrottle,
+    get_throttle_counters,
+)
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(ReplicaReadMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAdminUser]  # Solo admins
@@ -28,6 +35,7 @@ class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
+    throttle_classes = [RegisterIPThrottle]
 
     def create(self, request, *args, **kwargs):
         try:
@@ -48,16 +56,23 @@ class RegisterView(generics.CreateAPIView):
         return response
 
 
-class MeView(APIView):
+class MeView(ReplicaReadMixin, APIView):
     permission_classes = [IsAuthenticated]
 
+    def get_profile(self, request):
+        # El usuario de la caché de autenticación solo trae los campos de permisos
+        user = request.user
+        if user.get_deferred_fields():
+            user = User.objects.get(pk=user.pk)
+        return user
+
     def get(self, request):
-        serializer = UserSerializer(request.user)
+        serializer = UserSerializer(self.get_profile(request))
         return Response(serializer.data)
 
     def put(self, request):
         serializer = UserSerializer(
-            request.user, data=request.data, partial=True)
+            self.get_profile(request), data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
@@ -73,6 +88,8 @@ class MeView(APIView):
 @method_decorator(csrf_exempt, name='dispatch')
 class LoginView(APIView):
     permission_classes = [AllowAny]
+    # Se evalúan antes de post(), es decir, antes de check_password
+    throttle_classes = [LoginIPThrottle, LoginUsernameThrottle]
 
     def post(self, request):
         username = request.data.get('username')
@@ -111,3 +128,11 @@ class LoginView(APIView):
                 'is_staff': user.is_staff
              }
         }, status=200)
+
+
+class ThrottleStatsView(APIView):
+    """Intentos de login/registro permitidos y rechazados (solo admins)."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_throttle_counters())
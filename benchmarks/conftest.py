@@ -0,0 +1,153 @@
+"""
+Infraestructura de la suite de benchmarks (marcador ``benchmark``).
+
+No corre con ``pytest`` a secas; se ejecuta explícitamente:
+
+    pytest -m benchmark benchmarks/
+    BENCHMARK_SIZES=1000 pytest -m benchmark benchmarks/    # solo 1k
+    BENCHMARK_UPDATE=1 pytest -m benchmark benchmarks/      # reescribe la línea base
+
+Cada medición registra las consultas por petición y la mediana del tiempo
+de pared; la prueba falla si superan lo guardado en ``baseline.json``.
+"""
+
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.product.models import Product
+from apps.product.search import refresh_search_vector
+from apps.user.models import User
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+SIZES = [
+    int(size) for size in
+    os.environ.get("BENCHMARK_SIZES", "1000,10000,100000").split(",") if size.strip()
+]
+ROUNDS = int(os.environ.get("BENCHMARK_ROUNDS", 5))
+# Margen relativo sobre el tiempo base (0.5 = hasta 50 % más lento) y
+# margen absoluto en ms para que las mediciones pequeñas no sean ruidosas.
+TIME_TOLERANCE = float(os.environ.get("BENCHMARK_TIME_TOLERANCE", 0.5))
+TIME_SLACK_MS = float(os.environ.get("BENCHMARK_TIME_SLACK_MS", 5))
+UPDATE = os.environ.get("BENCHMARK_UPDATE") == "1"
+
+BENCHMARK_PASSWORD = "bench-password-123"
+NAMES = ["Camiseta", "Pantalón", "Chaqueta", "Vestido", "Bolso", "Gorra", "Zapatos"]
+SEED_BATCH_SIZE = 5000
+
+
+def measure(call, rounds=ROUNDS):
+    """
+    Ejecuta ``call(i)`` una vez para calentar y luego ``rounds`` veces con la
+    caché vacía. Devuelve el máximo de consultas y la mediana en ms.
+    """
+    call(0)
+    queries, timings = [], []
+    for i in range(1, rounds + 1):
+        cache.clear()
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            call(i)
+            timings.append((time.perf_counter() - start) * 1000)
+        queries.append(len(captured.captured_queries))
+    return {"queries": max(queries), "ms": round(statistics.median(timings), 2)}
+
+
+@pytest.fixture(scope="session")
+def benchmark_results():
+    results = {}
+    yield results
+    if UPDATE and results:
+        baseline = {}
+        if BASELINE_PATH.exists():
+            baseline = json.loads(BASELINE_PATH.read_text())
+        baseline.update(results)
+        BASELINE_PATH.write_text(
+            json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+@pytest.fixture(scope="session")
+def check_benchmark(benchmark_results):
+    """Compara una medición con la línea base (o la registra con BENCHMARK_UPDATE=1)."""
+    baseline = json.loads(BASELINE_PATH.read_text()) if BASELINE_PATH.exists() else {}
+
+    def check(name, result):
+        benchmark_results[name] = result
+        if UPDATE:
+            return
+        expected = baseline.get(name)
+        if expected is None:
+            pytest.skip(f"Sin línea base para {name}; ejecuta con BENCHMARK_UPDATE=1.")
+        assert result["queries"] <= expected["queries"], (
+            f"{name}: {result['queries']} consultas por petición "
+            f"(línea base {expected['queries']})")
+        limit = expected["ms"] * (1 + TIME_TOLERANCE) + TIME_SLACK_MS
+        assert result["ms"] <= limit, (
+            f"{name}: {result['ms']} ms (línea base {expected['ms']} ms, "
+            f"límite {limit:.2f} ms)")
+
+    return check
+
+
+@pytest.fixture(autouse=True)
+def disable_auth_throttle(settings):
+    """Las mediciones repiten login/registro más rápido de lo que permite el límite."""
+    settings.AUTH_THROTTLE = {**getattr(settings, "AUTH_THROTTLE", {}), "ENABLED": False}
+
+
+@pytest.fixture(scope="session")
+def benchmark_user(django_db_setup, django_db_blocker):
+    with django_db_blocker.unblock():
+        user = User.objects.create_user(
+            username="bench-vendedor",
+            first_name="Bench",
+            last_name="Vendedor",
+            email="bench@example.com",
+            dni="5550000001",
+            phone_number="3005550001",
+            password=BENCHMARK_PASSWORD,
+            role=User.VENDEDOR,
+        )
+    yield user
+    with django_db_blocker.unblock():
+        user.delete()
+
+
+def seed_products(size, owner):
+    """Inserta ``size`` productos (la mitad de ``owner``) con su vector de búsqueda."""
+    for start in range(0, size, SEED_BATCH_SIZE):
+        Product.objects.bulk_create(
+            Product(
+                code=f"BENCH-{i}",
+                name=f"{NAMES[i % len(NAMES)]} {i}",
+                slug=f"bench-{i}",
+                description=f"Producto de prueba número {i}",
+                price=i % 500 + 1,
+                stock=i % 50,
+                is_active=i % 10 != 0,
+                owner=owner if i % 2 == 0 else None,
+            )
+            for i in range(start, min(start + SEED_BATCH_SIZE, size))
+        )
+    refresh_search_vector(Product.objects.all())
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size // 1000}k")
+def catalog(request, benchmark_user, django_db_blocker):
+    """Catálogo de ``size`` productos compartido por las pruebas del módulo."""
+    size = request.param
+    with django_db_blocker.unblock():
+        seed_products(size, benchmark_user)
+        sample = Product.objects.get(slug=f"bench-{size // 2 + 2}")
+    yield SimpleNamespace(size=size, owner=benchmark_user, sample=sample)
+    with django_db_blocker.unblock(), connection.cursor() as cursor:
+        # DELETE directo: Product.delete() emitiría una señal por fila
+        cursor.execute(f"DELETE FROM {Product._meta.db_table}")
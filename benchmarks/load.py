@@ -0,0 +1,203 @@
+"""
+Prueba de carga: gunicorn WSGI (workers síncronos) contra uvicorn ASGI
+(``ASGI_MODE=True``, vistas asíncronas de productos).
+
+Levanta cada servidor contra la base de datos configurada, lanza
+``--concurrency`` clientes HTTP/1.1 con keep-alive durante ``--duration``
+segundos y reporta peticiones/s y latencias p50/p99:
+
+    python -m benchmarks.load --workers 2 --concurrency 64 --duration 15
+    python -m benchmarks.load --seed 10000          # siembra si la tabla está vacía
+    python -m benchmarks.load --slow-clients 8      # clientes que envían la petición lento
+
+Los clientes lentos ocupan un worker síncrono cada uno mientras envían la
+petición; en ASGI solo ocupan una conexión del event loop.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+ROOT = Path(__file__).resolve().parent.parent
+SERVERS = {
+    "wsgi": ["gunicorn", "l_atelier.wsgi:application", "--workers", "{workers}",
+             "--bind", "127.0.0.1:{port}"],
+    "asgi": ["uvicorn", "l_atelier.asgi:application", "--workers", "{workers}",
+             "--port", "{port}", "--no-access-log"],
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def load_products(seed):
+    """(slug, nombre) de productos activos para las peticiones de detalle y búsqueda."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "l_atelier.settings")
+    import django
+
+    django.setup()
+    from apps.product.models import Product
+
+    if seed and not Product.objects.exists():
+        from apps.user.models import User
+        from benchmarks.conftest import seed_products
+
+        owner, _ = User.objects.get_or_create(
+            username="load-vendedor",
+            defaults={"email": "load@example.com", "dni": "5550000099",
+                      "phone_number": "3005550099", "role": User.VENDEDOR},
+        )
+        seed_products(seed, owner)
+    products = list(Product.objects.filter(is_active=True).values_list("slug", "name")[:100])
+    if not products:
+        sys.exit("No hay productos activos; usa --seed N para sembrar el catálogo.")
+    return products
+
+
+def build_urls(products):
+    """Detalles (cacheados tras la primera petición) y búsquedas por nombre (siempre a la BD)."""
+    urls = [f"/api/products/{slug}/" for slug, _ in products[:50]]
+    urls += [
+        f"/api/products/search_products/?q={quote(name)}&max_price=1000"
+        for _, name in products[50:]
+    ]
+    return urls
+
+
+async def request(reader, writer, url):
+    writer.write(f"GET {url} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length, keep_alive = 0, True
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+        elif name.lower() == "connection":
+            keep_alive = value.strip().lower() != "close"
+    await reader.readexactly(length)
+    return status, keep_alive
+
+
+async def client(port, urls, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                status, keep_alive = await request(reader, writer, random.choice(urls))
+            except (ConnectionError, asyncio.IncompleteReadError, IndexError):
+                errors.append("connection")
+                keep_alive = status = None
+            if not keep_alive:
+                # gunicorn con workers síncronos cierra la conexión tras cada respuesta
+                writer.close()
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            if status == 200:
+                latencies.append((time.perf_counter() - start) * 1000)
+            elif status is not None:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def slow_client(port, url, deadline):
+    """Envía la petición de a un byte por segundo, como un cliente móvil lento."""
+    payload = f"GET {url} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+    while time.perf_counter() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for byte in payload:
+                if time.perf_counter() >= deadline:
+                    break
+                writer.write(bytes([byte]))
+                await writer.drain()
+                await asyncio.sleep(1)
+            writer.close()
+        except ConnectionError:
+            await asyncio.sleep(0.1)
+
+
+async def run_load(port, urls, args):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + args.duration
+    tasks = [client(port, urls, deadline, latencies, errors) for _ in range(args.concurrency)]
+    tasks += [slow_client(port, urls[0], deadline) for _ in range(args.slow_clients)]
+    await asyncio.gather(*tasks)
+    latencies.sort()
+    if not latencies:
+        return {"requests": 0, "errors": len(errors)}
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": round(len(latencies) / args.duration, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 2),
+        "max_ms": round(latencies[-1], 2),
+    }
+
+
+def wait_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1) as sock:
+                sock.sendall(b"GET /api/products/?page_size=1 HTTP/1.1\r\nHost: localhost\r\n"
+                             b"Connection: close\r\n\r\n")
+                if sock.recv(12).endswith(b"200"):
+                    return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"El servidor no respondió en el puerto {port}")
+
+
+def benchmark_server(name, urls, args):
+    port = free_port()
+    command = [part.format(workers=args.workers, port=port) for part in SERVERS[name]]
+    env = {**os.environ, "ASGI_MODE": str(name == "asgi"), "REQUEST_METRICS_ENABLED": "False"}
+    server = subprocess.Popen(command, cwd=ROOT, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_ready(port)
+        asyncio.run(run_load(port, urls, argparse.Namespace(**{**vars(args), "duration": 2})))
+        return asyncio.run(run_load(port, urls, args))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--servers", default="wsgi,asgi")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=15)
+    parser.add_argument("--slow-clients", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="guarda los resultados en JSON")
+    args = parser.parse_args()
+
+    urls = build_urls(load_products(args.seed))
+    results = {}
+    for name in args.servers.split(","):
+        results[name] = benchmark_server(name, urls, args)
+        print(name, " ".join(f"{key}={value}" for key, value in results[name].items()))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
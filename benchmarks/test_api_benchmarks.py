@@ -0,0 +1,72 @@
+import pytest
+from rest_framework.test import APIClient
+
+from .conftest import BENCHMARK_PASSWORD, measure
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+def get_ok(client, url):
+    def call(i):
+        response = client.get(url)
+        assert response.status_code == 200, response.content
+    return call
+
+
+def test_list(api_client, catalog, check_benchmark):
+    result = measure(get_ok(api_client, "/api/products/?page_size=20"))
+    check_benchmark(f"list[{catalog.size}]", result)
+
+
+def test_search_products(api_client, catalog, check_benchmark):
+    url = "/api/products/search_products/?q=camiseta&page_size=20"
+    check_benchmark(f"search_products[{catalog.size}]", measure(get_ok(api_client, url)))
+
+
+def test_my_products(api_client, catalog, check_benchmark):
+    api_client.force_authenticate(user=catalog.owner)
+    url = "/api/products/my_products/?page_size=20"
+    check_benchmark(f"my_products[{catalog.size}]", measure(get_ok(api_client, url)))
+
+
+def test_retrieve_by_slug(api_client, catalog, check_benchmark):
+    url = f"/api/products/{catalog.sample.slug}/"
+    check_benchmark(f"retrieve_slug[{catalog.size}]", measure(get_ok(api_client, url)))
+
+
+def test_retrieve_by_pk(api_client, catalog, check_benchmark):
+    url = f"/api/products/{catalog.sample.pk}/"
+    check_benchmark(f"retrieve_pk[{catalog.size}]", measure(get_ok(api_client, url)))
+
+
+def test_login(api_client, benchmark_user, check_benchmark):
+    data = {"username": benchmark_user.username, "password": BENCHMARK_PASSWORD}
+
+    def call(i):
+        response = api_client.post("/api/auth/login/", data, format="json")
+        assert response.status_code == 200, response.content
+
+    check_benchmark("login", measure(call))
+
+
+def test_register(api_client, check_benchmark):
+    def call(i):
+        data = {
+            "username": f"bench-registro-{i}",
+            "first_name": "Bench",
+            "last_name": "Registro",
+            "email": f"registro{i}@example.com",
+            "dni": f"{7000000000 + i}",
+            "phone_number": f"3{i:09d}",
+            "password": BENCHMARK_PASSWORD,
+            "role": "CLIENTE",
+        }
+        response = api_client.post("/api/auth/register/", data, format="json")
+        assert response.status_code == 201, response.content
+
+    check_benchmark("register", measure(call))
@@ -0,0 +1,65 @@
+"""
+Costo de CPU contra bytes ahorrados al comprimir el JSON de 1000 productos
+con cada codificación de ``l_atelier.compression`` (niveles de
+``API_COMPRESSION``). Sin base de datos.
+"""
+
+import decimal
+import statistics
+import time
+
+import pytest
+from django.utils import timezone
+
+from apps.product.models import Product
+from apps.product.serializer import ProductSerializer
+from l_atelier.compression import available_encodings, compress, get_compression_settings
+from l_atelier.renderers import FastJSONRenderer
+
+from .conftest import NAMES, ROUNDS
+
+pytestmark = pytest.mark.benchmark
+
+SIZE = 1000
+ENCODINGS = ("gzip", "br", "zstd")
+
+
+@pytest.fixture(scope="module")
+def content():
+    now = timezone.now()
+    products = [
+        Product(
+            id=i,
+            code=f"BENCH-{i}",
+            name=f"{NAMES[i % len(NAMES)]} {i}",
+            slug=f"bench-{i}",
+            description=f"Producto de prueba número {i}",
+            price=decimal.Decimal(i % 500 + 1) / 4,
+            stock=i % 50,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(SIZE)
+    ]
+    return FastJSONRenderer().render(ProductSerializer(products, many=True).data)
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+def test_compress_1k(encoding, content, check_benchmark):
+    config = get_compression_settings()
+    if encoding not in available_encodings(config):
+        pytest.skip(f"{encoding} no está disponible")
+    body = compress(content, encoding, config)
+
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        compress(content, encoding, config)
+        timings.append((time.perf_counter() - start) * 1000)
+    check_benchmark(f"compress_1k[{encoding}]", {
+        "queries": 0,
+        "ms": round(statistics.median(timings), 2),
+        "bytes": len(body),
+        "saved_bytes": len(content) - len(body),
+        "ratio": round(len(content) / len(body), 2),
+    })
@@ -0,0 +1,100 @@
+"""
+Costo de abrir una conexión a PostgreSQL por petición.
+
+Las peticiones pasan por ``WSGIHandler`` (no por el cliente de pruebas, que
+desconecta ``close_old_connections``), así que CONN_MAX_AGE y
+CONN_HEALTH_CHECKS se aplican igual que en producción. La conexión
+``default`` se sustituye durante la prueba por una propia, fuera de la
+transacción de la prueba, para poder cerrarla y reabrirla.
+"""
+
+import statistics
+import time
+
+import pytest
+from django.core.cache import cache
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+from django.db.backends.signals import connection_created
+from django.test import RequestFactory
+
+from apps.product.models import Product
+
+from .conftest import ROUNDS, seed_products
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+URL = "/api/products/?page_size=20"
+# Una conexión cuesta pocos ms en local; hacen falta más rondas para separarla del ruido
+CONNECTION_ROUNDS = max(ROUNDS, 20)
+SCENARIOS = {
+    "fresh": {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False},
+    "persistent": {"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": False},
+    "persistent_health_checks": {"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": True},
+}
+
+
+@pytest.fixture(scope="module")
+def small_catalog(benchmark_user, django_db_blocker):
+    with django_db_blocker.unblock():
+        seed_products(100, benchmark_user)
+    yield
+    with django_db_blocker.unblock(), connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {Product._meta.db_table}")
+
+
+@pytest.fixture
+def scenario_connection(request):
+    """Conexión ``default`` en autocommit con los ajustes del escenario."""
+    values = SCENARIOS[request.getfixturevalue("scenario")]
+    original = connections[DEFAULT_DB_ALIAS]
+    wrapper = type(original)({**original.settings_dict, **values}, DEFAULT_DB_ALIAS)
+    connections[DEFAULT_DB_ALIAS] = wrapper
+    yield wrapper
+    wrapper.close()
+    connections[DEFAULT_DB_ALIAS] = original
+
+
+def measure_requests(handler, rounds):
+    """Mediana en ms, consultas y conexiones abiertas por petición (tras calentar)."""
+    factory = RequestFactory()
+    opened, queries, timings = [], [], []
+
+    def count_connection(**kwargs):
+        opened[-1] += 1
+
+    def count_query(execute, *args):
+        queries[-1] += 1
+        return execute(*args)
+
+    connection_created.connect(count_connection)
+    try:
+        for i in range(rounds + 1):
+            cache.clear()
+            opened.append(0)
+            queries.append(0)
+            environ = factory.get(URL).environ
+            with connection.execute_wrapper(count_query):
+                start = time.perf_counter()
+                response = handler(environ, lambda status, headers: None)
+                b"".join(response)
+                # close() emite request_finished -> close_old_connections
+                response.close()
+                timings.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+    finally:
+        connection_created.disconnect(count_connection)
+    return {
+        "queries": max(queries[1:]),
+        "connections": max(opened[1:]),
+        "ms": round(statistics.median(timings[1:]), 2),
+    }
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_list_connection_reuse(scenario, small_catalog, scenario_connection, check_benchmark):
+    result = measure_requests(WSGIHandler(), CONNECTION_ROUNDS)
+
+    expected_connections = 0 if SCENARIOS[scenario]["CONN_MAX_AGE"] else 1
+    assert result["connections"] == expected_connections, result
+    check_benchmark(f"list_connections[{scenario}]", result)
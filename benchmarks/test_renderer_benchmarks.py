@@ -0,0 +1,60 @@
+"""
+Render JSON de 10k productos ya serializados: JSONRenderer de DRF (json de
+la librería estándar) contra FastJSONRenderer (orjson). Sin base de datos.
+"""
+
+import decimal
+import statistics
+import time
+
+import pytest
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.product.models import Product
+from apps.product.serializer import ProductSerializer
+from l_atelier.renderers import FastJSONRenderer, orjson
+
+from .conftest import NAMES, ROUNDS
+
+pytestmark = pytest.mark.benchmark
+
+SIZE = 10_000
+RENDERERS = {"stdlib": JSONRenderer, "orjson": FastJSONRenderer}
+
+
+@pytest.fixture(scope="module")
+def serialized_products():
+    now = timezone.now()
+    products = [
+        Product(
+            id=i,
+            code=f"BENCH-{i}",
+            name=f"{NAMES[i % len(NAMES)]} {i}",
+            slug=f"bench-{i}",
+            description=f"Producto de prueba número {i}",
+            price=decimal.Decimal(i % 500 + 1) / 4,
+            stock=i % 50,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(SIZE)
+    ]
+    return ProductSerializer(products, many=True).data
+
+
+@pytest.mark.parametrize("name", RENDERERS)
+def test_render_10k(name, serialized_products, check_benchmark):
+    if name == "orjson" and orjson is None:
+        pytest.skip("orjson no está instalado")
+    renderer = RENDERERS[name]()
+    content = renderer.render(serialized_products)
+    assert content == JSONRenderer().render(serialized_products)
+
+    timings = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        renderer.render(serialized_products)
+        timings.append((time.perf_counter() - start) * 1000)
+    check_benchmark(f"render_10k[{name}]", {
+        "queries": 0, "ms": round(statistics.median(timings), 2), "bytes": len(content)})
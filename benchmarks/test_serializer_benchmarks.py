@@ -0,0 +1,41 @@
+"""
+Serialización del catálogo completo: ``ProductSerializer(many=True)`` sobre
+modelos contra ``ProductRowSerializer`` sobre ``.values()``. Incluye la
+consulta; registra filas por segundo además de la mediana en ms.
+"""
+
+import pytest
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from apps.product.models import Product
+from apps.product.rows import ProductRowSerializer
+from apps.product.serializer import ProductSerializer
+
+from .conftest import measure
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.django_db]
+
+
+def serialize_models(request):
+    return lambda: ProductSerializer(
+        Product.objects.order_by("id"), many=True, context={"request": request}).data
+
+
+def serialize_rows(request):
+    rows = ProductRowSerializer(ProductSerializer, request=request)
+    return lambda: rows.serialize(Product.objects.order_by("id").values(*rows.columns))
+
+
+SERIALIZERS = {"drf": serialize_models, "rows": serialize_rows}
+
+
+@pytest.mark.parametrize("name", SERIALIZERS)
+def test_serialize_catalog(name, catalog, check_benchmark):
+    request = Request(RequestFactory().get("/api/products/"))
+    serialize = SERIALIZERS[name](request)
+    assert len(serialize()) == catalog.size
+
+    result = measure(lambda i: serialize())
+    result["rows_per_s"] = round(catalog.size / result["ms"] * 1000)
+    check_benchmark(f"serialize[{name}-{catalog.size}]", result)
@@ -0,0 +1,10 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset_auth_throttle():
+    """Cada prueba empieza con los baldes de login/registro llenos."""
+    from apps.user.throttling import get_store
+
+    get_store().reset()
+    yield
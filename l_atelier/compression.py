@@ -0,0 +1,170 @@
+"""
+Compresión negociada (zstd, brotli, gzip) de las respuestas JSON de la API.
+
+``CompressionMiddleware`` comprime según ``Accept-Encoding`` las respuestas
+de ``PATH_PREFIXES`` con un tipo de ``CONTENT_TYPES`` y al menos
+``MIN_SIZE`` bytes. brotli y zstandard son opcionales: sin ellos solo se
+ofrece gzip. Las respuestas que ya traen ``Content-Encoding`` (por ejemplo
+las precomprimidas de la caché de productos) pasan sin cambios.
+
+Las rutas de autenticación quedan fuera por defecto: devuelven tokens y
+comprimirlas junto con datos del cliente expone a ataques tipo BREACH.
+"""
+
+import gzip
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependencia opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - dependencia opcional
+    zstandard = None
+
+IDENTITY = "identity"
+
+DEFAULTS = {
+    "ENABLED": True,
+    "MIN_SIZE": 1024,
+    # Preferencia del servidor cuando el cliente acepta varias con el mismo q
+    "ENCODINGS": ("zstd", "br", "gzip"),
+    "PATH_PREFIXES": ("/api/",),
+    "EXCLUDED_PATH_PREFIXES": ("/api/auth/",),
+    "CONTENT_TYPES": ("application/json",),
+    "GZIP_LEVEL": 6,
+    "BROTLI_QUALITY": 4,
+    "ZSTD_LEVEL": 3,
+}
+
+
+def get_compression_settings():
+    return {**DEFAULTS, **getattr(settings, "API_COMPRESSION", {})}
+
+
+def available_encodings(config):
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    return [name for name in config["ENCODINGS"] if installed.get(name)]
+
+
+def parse_accept_encoding(header):
+    """``{"gzip": 1.0, "br": 0.5, ...}`` a partir de ``Accept-Encoding``."""
+    accepted = {}
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+
+def negotiate_encoding(request, config=None):
+    """Codificación a usar para ``request`` o None (sin comprimir)."""
+    config = config or get_compression_settings()
+    accepted = parse_accept_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+    best, best_quality = None, 0.0
+    for name in available_encodings(config):
+        quality = accepted.get(name, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def compress(content, encoding, config=None):
+    config = config or get_compression_settings()
+    if encoding == "gzip":
+        # mtime fijo: los mismos bytes de entrada dan los mismos bytes comprimidos
+        return gzip.compress(content, compresslevel=config["GZIP_LEVEL"], mtime=0)
+    if encoding == "br":
+        return brotli.compress(content, quality=config["BROTLI_QUALITY"])
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=config["ZSTD_LEVEL"]).compress(content)
+    raise ValueError(f"Codificación no soportada: {encoding}")
+
+
+def applies_to(request, response, config):
+    """La respuesta es de un tipo y una ruta que se comprimen (sin mirar el tamaño)."""
+    path = request.path
+    content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+    return (
+        config["ENABLED"]
+        and path.startswith(tuple(config["PATH_PREFIXES"]))
+        and not path.startswith(tuple(config["EXCLUDED_PATH_PREFIXES"]))
+        and content_type in config["CONTENT_TYPES"]
+    )
+
+
+def is_compressible(request, response, config=None):
+    config = config or get_compression_settings()
+    return (
+        not response.streaming
+        and response.status_code == 200
+        and not response.has_header("Content-Encoding")
+        and applies_to(request, response, config)
+        and len(response.content) >= config["MIN_SIZE"]
+    )
+
+
+def encode_response(response, encoding, body):
+    """Reemplaza el cuerpo por ``body`` ya comprimido con ``encoding``."""
+    response.content = body
+    response["Content-Length"] = str(len(body))
+    response["Content-Encoding"] = encoding
+    patch_vary_headers(response, ("Accept-Encoding",))
+    # Los bytes cambian: el ETag deja de ser fuerte (como GZipMiddleware)
+    etag = response.get("ETag")
+    if etag and etag.startswith('"'):
+        response["ETag"] = "W/" + etag
+
+
+def compress_response(request, response, config=None):
+    """Comprime ``response`` con la codificación negociada si corresponde."""
+    config = config or get_compression_settings()
+    if (response.streaming or response.has_header("Content-Encoding")
+            or not applies_to(request, response, config)):
+        return response
+    # Aunque esta no se comprima, otra petición de la misma URL sí podría
+    patch_vary_headers(response, ("Accept-Encoding",))
+    if not is_compressible(request, response, config):
+        return response
+    encoding = negotiate_encoding(request, config)
+    if encoding is None:
+        return response
+    body = compress(response.content, encoding, config)
+    if len(body) < len(response.content):
+        encode_response(response, encoding, body)
+    return response
+
+
+class CompressionMiddleware:
+    """Va justo después de RequestMetricsMiddleware para comprimir la respuesta final."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return compress_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return compress_response(request, await self.get_response(request))
@@ -0,0 +1,187 @@
+"""
+Lecturas desde réplicas de PostgreSQL.
+
+Solo las vistas con ``ReplicaReadMixin`` leen de una réplica, y solo en
+peticiones GET/HEAD/OPTIONS. Todo lo demás va al primario:
+
+- Cualquier escritura fija el resto de la petición al primario (lectura
+  tras escritura).
+- ``DatabaseRoutingMiddleware`` mantiene al cliente en el primario durante
+  ``STICKY_SECONDS`` después de escribir, por cookie y por usuario. La
+  marca por usuario está en la caché: requiere una caché compartida entre
+  workers (ver ``DB_REPLICA_READS`` en settings).
+- La cabecera ``X-DB-Primary`` o ``use_primary()`` en código fuerzan el
+  primario.
+
+Sin réplicas configuradas (``DATABASE_ROUTING["REPLICAS"]`` vacío) todo
+va a ``default``.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+PRIMARY = DEFAULT_DB_ALIAS
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+DEFAULTS = {
+    "REPLICAS": [],
+    "STICKY_SECONDS": 10,
+    "PRIMARY_HEADER": "HTTP_X_DB_PRIMARY",
+    "STICKY_COOKIE": "db_primary",
+}
+
+
+class RoutingState:
+    """Estado de enrutamiento de una petición."""
+
+    __slots__ = ("replica_reads", "forced", "wrote", "used_replica")
+
+    def __init__(self, forced=False):
+        self.replica_reads = False
+        self.forced = int(forced)
+        self.wrote = False
+        self.used_replica = False
+
+    def reads_from_replica(self):
+        return self.replica_reads and not self.forced and not self.wrote
+
+
+_state = ContextVar("db_routing_state", default=None)
+
+
+def get_routing_settings():
+    return {**DEFAULTS, **getattr(settings, "DATABASE_ROUTING", {})}
+
+
+def get_routing_state():
+    return _state.get()
+
+
+def sticky_key(user_id):
+    return f"db:primary:user:{user_id}"
+
+
+@contextmanager
+def routing_state(forced=False):
+    state = RoutingState(forced)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+@contextmanager
+def use_primary():
+    """Fuerza el primario para las lecturas dentro del bloque."""
+    state = _state.get()
+    if state is None:
+        yield
+        return
+    state.forced += 1
+    try:
+        yield
+    finally:
+        state.forced -= 1
+
+
+def read_from_replica():
+    """True si la petición actual ya leyó de una réplica."""
+    state = _state.get()
+    return state is not None and state.used_replica
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _state.get()
+        if state is None or not state.reads_from_replica():
+            return PRIMARY
+        replicas = get_routing_settings()["REPLICAS"]
+        if not replicas:
+            return PRIMARY
+        state.used_replica = True
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Las réplicas contienen los mismos datos que el primario
+        aliases = {PRIMARY, *get_routing_settings()["REPLICAS"]}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_routing_settings()["REPLICAS"]:
+            return False
+        return None
+
+
+class DatabaseRoutingMiddleware:
+    """Crea el estado de enrutamiento de cada petición y la mantiene en el primario si escribió."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        config = get_routing_settings()
+        with routing_state(self.is_forced(request, config)) as state:
+            response = self.get_response(request)
+        return self.remember_write(request, response, state, config)
+
+    async def __acall__(self, request):
+        config = get_routing_settings()
+        with routing_state(self.is_forced(request, config)) as state:
+            response = await self.get_response(request)
+        return self.remember_write(request, response, state, config)
+
+    def is_forced(self, request, config):
+        return (
+            request.method not in SAFE_METHODS
+            or bool(request.META.get(config["PRIMARY_HEADER"]))
+            or config["STICKY_COOKIE"] in request.COOKIES
+        )
+
+    def remember_write(self, request, response, state, config):
+        if state.wrote and config["REPLICAS"]:
+            seconds = config["STICKY_SECONDS"]
+            # El frontend está en otro sitio: con Lax el navegador no la enviaría en fetch
+            response.set_cookie(
+                config["STICKY_COOKIE"], "1", max_age=seconds, httponly=True,
+                samesite="None", secure=True)
+            # Los clientes con JWT no siempre guardan cookies
+            user = getattr(request, "user", None)
+            if user is not None and user.is_authenticated:
+                cache.set(sticky_key(user.pk), True, seconds)
+        return response
+
+
+class ReplicaReadMixin:
+    """Vistas DRF cuyas lecturas seguras pueden ir a una réplica."""
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        state = _state.get()
+        if (state is None or request.method not in SAFE_METHODS
+                or not get_routing_settings()["REPLICAS"]):
+            return
+        user = request.user
+        state.replica_reads = not (
+            user.is_authenticated and cache.get(sticky_key(user.pk)))
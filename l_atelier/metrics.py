@@ -0,0 +1,165 @@
+"""
+Métricas por petición: consultas SQL, tiempo de BD, autenticación, vista,
+serializer (serialize) y codificación JSON (render).
+
+Solo se instrumenta una fracción de las peticiones (``SAMPLE_RATE``); en las
+demás el costo es un ``random()``. Las muestreadas dejan una línea de log
+``clave=valor``; la cabecera ``Server-Timing`` expone tiempos internos, así
+que solo la reciben usuarios staff salvo que ``SERVER_TIMING`` la habilite
+para todos (por defecto, con ``DEBUG``).
+"""
+
+import logging
+import random
+import time
+from contextlib import ExitStack, contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.utils.functional import LazyObject, empty
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "ENABLED": True,
+    "SAMPLE_RATE": 0.1,
+    "SERVER_TIMING": False,
+}
+PHASES = ("auth", "view", "serialize", "render")
+
+
+def get_metrics_settings():
+    return {**DEFAULTS, **getattr(settings, "REQUEST_METRICS", {})}
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.view_start = None
+        self.queries = 0
+        self.db_ms = 0.0
+        self.timings = dict.fromkeys(PHASES, 0.0)
+
+    def __call__(self, execute, sql, params, many, context):
+        """``execute_wrapper`` que cuenta las consultas y su duración."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_ms += (time.perf_counter() - start) * 1000
+
+    def finish(self):
+        end = time.perf_counter()
+        self.total_ms = (end - self.start) * 1000
+        if self.view_start is not None:
+            # La vista incluye su tiempo de BD; serialize y render se miden aparte
+            view_ms = (end - self.view_start) * 1000 - sum(
+                self.timings[name] for name in ("auth", "serialize", "render"))
+            self.timings["view"] = max(view_ms, 0.0)
+
+    def server_timing(self):
+        entries = [f'db;dur={self.db_ms:.1f};desc="{self.queries} queries"']
+        entries += [f"{name};dur={self.timings[name]:.1f}" for name in PHASES]
+        entries.append(f"total;dur={self.total_ms:.1f}")
+        return ", ".join(entries)
+
+
+def is_staff_request(request):
+    """Staff ya autenticado; no fuerza la carga perezosa del usuario de sesión."""
+    user = getattr(request, "user", None)
+    if isinstance(user, LazyObject) and user._wrapped is empty:
+        return False
+    return bool(user is not None and user.is_staff)
+
+
+def get_metrics(request):
+    """Métricas de la petición (acepta el Request de DRF) o None si no se muestrea."""
+    request = getattr(request, "_request", request)
+    return getattr(request, "_metrics", None)
+
+
+@contextmanager
+def timed(request, phase):
+    """Acumula la duración del bloque en ``phase`` si la petición se muestrea."""
+    metrics = get_metrics(request) if request is not None else None
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[phase] += (time.perf_counter() - start) * 1000
+
+
+class RequestMetricsMiddleware:
+    """Debe ir primero en MIDDLEWARE para que ``total`` cubra toda la petición."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_metrics_settings()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = self.sample(request)
+        if metrics is None:
+            return self.get_response(request)
+        with self.instrument(metrics):
+            response = self.get_response(request)
+        return self.report(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = self.sample(request)
+        if metrics is None:
+            return await self.get_response(request)
+        # El ORM asíncrono consulta desde el hilo thread-sensitive de la
+        # petición, con sus propias conexiones: el wrapper se instala allí.
+        stack = ExitStack()
+        await sync_to_async(stack.enter_context)(self.instrument(metrics))
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.report(request, response, metrics)
+
+    def sample(self, request):
+        config = self.config
+        if not config["ENABLED"] or random.random() >= config["SAMPLE_RATE"]:
+            return None
+        metrics = request._metrics = RequestMetrics()
+        return metrics
+
+    @contextmanager
+    def instrument(self, metrics):
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics))
+            yield
+
+    def report(self, request, response, metrics):
+        metrics.finish()
+        if self.config["SERVER_TIMING"] or is_staff_request(request):
+            response["Server-Timing"] = metrics.server_timing()
+        logger.info(
+            "request method=%s path=%s status=%s total_ms=%.1f db_ms=%.1f "
+            "queries=%d auth_ms=%.1f view_ms=%.1f serialize_ms=%.1f render_ms=%.1f",
+            request.method, request.path, response.status_code,
+            metrics.total_ms, metrics.db_ms, metrics.queries,
+            metrics.timings["auth"], metrics.timings["view"],
+            metrics.timings["serialize"], metrics.timings["render"],
+        )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = getattr(request, "_metrics", None)
+        if metrics is not None:
+            metrics.view_start = time.perf_counter()
+        return None
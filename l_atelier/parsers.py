@@ -0,0 +1,28 @@
+import io
+
+from django.conf import settings
+from rest_framework.parsers import JSONParser
+
+from .renderers import FastJSONRenderer, orjson
+
+UTF8_NAMES = {"utf-8", "utf8"}
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser con orjson para cuerpos UTF-8. Si orjson rechaza el cuerpo se
+    reintenta con el parser de DRF, que acepta enteros de más de 64 bits y
+    da los mismos mensajes de error.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or encoding.lower() not in UTF8_NAMES:
+            return super().parse(stream, media_type, parser_context)
+        body = stream.read()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type, parser_context)
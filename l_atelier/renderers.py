@@ -0,0 +1,56 @@
+"""
+Renderers JSON de la API.
+
+``FastJSONRenderer`` usa orjson cuando está instalado y produce los mismos
+bytes que ``JSONRenderer`` de DRF (separadores compactos, UTF-8 sin
+escapar, ``\\u2028``/``\\u2029`` escapados, fechas con ``Z``). Sin orjson,
+o si se pide indentación, usa el renderer de DRF.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+from .metrics import timed
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson es opcional
+    orjson = None
+
+LINE_SEPARATORS = (("\u2028".encode(), b"\\u2028"), ("\u2029".encode(), b"\\u2029"))
+
+
+class TimedJSONRenderer(JSONRenderer):
+    """JSONRenderer que reporta su duración como fase ``render`` de las métricas."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        request = (renderer_context or {}).get("request")
+        with timed(request, "render"):
+            return self.render_json(data, accepted_media_type, renderer_context)
+
+    def render_json(self, data, accepted_media_type, renderer_context):
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class FastJSONRenderer(TimedJSONRenderer):
+    """TimedJSONRenderer con orjson; la salida es idéntica byte a byte."""
+
+    # orjson serializa datetime, date, UUID y subclases de dict/list/str; el
+    # resto (Decimal, Promise, generadores...) pasa por el encoder de DRF.
+    default = staticmethod(JSONEncoder().default)
+
+    def render_json(self, data, accepted_media_type, renderer_context):
+        if (orjson is None or data is None or self.ensure_ascii or not self.compact
+                or self.get_indent(accepted_media_type, renderer_context or {}) is not None):
+            return super().render_json(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(
+                data, default=self.default,
+                option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # Enteros de más de 64 bits y tipos que DRF tampoco sabe serializar
+            return super().render_json(data, accepted_media_type, renderer_context)
+        for separator, escaped in LINE_SEPARATORS:
+            if separator in content:
+                content = content.replace(separator, escaped)
+        return content
@@ -14,12 +14,48 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
-from decouple import config
+from decouple import Csv, config
+from django.core.exceptions import ImproperlyConfigured
 
 # Detectar si estamos en CI/CD
 IS_CI = (os.environ.get("CI", False) ==
          "true" or os.environ.get("GITHUB_ACTIONS") == "true")
 
+# Conexiones a PostgreSQL (CI y producción). Por defecto cada worker
+# reutiliza su conexión hasta DB_CONN_MAX_AGE segundos y la verifica al
+# inicio de cada petición, en lugar de abrir una (TCP + TLS + auth) por
+# petición. Con DB_POOL=True se usa el pool de psycopg 3
+# ("psycopg[binary,pool]" en requirements.txt); Django exige entonces
+# CONN_MAX_AGE = 0, porque es el pool quien conserva las conexiones.
+# Bajo ASGI cada petición tiene su propia conexión, así que las
+# persistentes no se reutilizan y quedan abiertas: se desactivan y conviene
+# el pool.
+ASGI_MODE = config("ASGI_MODE", default=False, cast=bool)
+DB_POOL = config("DB_POOL", default=False, cast=bool)
+if DB_POOL:
+    try:
+        import psycopg_pool  # noqa: F401
+    except ImportError as exc:
+        # Con solo psycopg2 la opción "pool" rompería la conexión con un error confuso
+        raise ImproperlyConfigured(
+            'DB_POOL=True requiere psycopg 3 con pool: pip install "psycopg[binary,pool]"'
+        ) from exc
+DB_CONNECTION = {
+    "CONN_MAX_AGE": 0 if DB_POOL or ASGI_MODE else config(
+        "DB_CONN_MAX_AGE", default=60, cast=int),
+    "CONN_HEALTH_CHECKS": config("DB_CONN_HEALTH_CHECKS", default=True, cast=bool),
+    "OPTIONS": {
+        "pool": {
+            "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+            "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+            # Segundos de espera por una conexión libre antes de fallar
+            "timeout": config("DB_POOL_TIMEOUT", default=10, cast=float),
+            "max_idle": config("DB_POOL_MAX_IDLE", default=300, cast=float),
+            "max_lifetime": config("DB_POOL_MAX_LIFETIME", default=1800, cast=float),
+        },
+    } if DB_POOL else {},
+}
+
 # CONFIGURACIÓN SEGÚN ENTORNO
 
 if IS_CI:
@@ -39,8 +75,17 @@ if IS_CI:
             "PASSWORD": os.environ.get("POSTGRES_PASSWORD", "postgres"),
             "HOST": os.environ.get("POSTGRES_HOST", "localhost"),
             "PORT": os.environ.get("POSTGRES_PORT", "5432"),
+            **DB_CONNECTION,
         }
     }
+    # Réplica para las pruebas del router: espejo de default mientras corren las pruebas
+    DATABASES["replica"] = {**DATABASES["default"], "TEST": {"MIRROR": "default"}}
+    DATABASE_REPLICAS = []
+
+    # Caché local en CI
+    CACHE_BACKEND = os.environ.get(
+        "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache")
+    CACHE_LOCATION = os.environ.get("CACHE_LOCATION", "")
 
     print("🔧 Usando configuración de CI/CD")
 
@@ -63,9 +108,26 @@ else:
             "PASSWORD": config("DB_PASSWORD"),
             "HOST": config("DB_HOST", default="localhost"),
             "PORT": config("DB_PORT", default=5432, cast=int),
+            **DB_CONNECTION,
         }
     }
 
+    # Réplicas de solo lectura con las mismas credenciales: DB_REPLICA_HOSTS=host1,host2
+    DATABASE_REPLICAS = []
+    for number, replica_host in enumerate(
+            config("DB_REPLICA_HOSTS", default="", cast=Csv()), start=1):
+        DATABASES[f"replica{number}"] = {**DATABASES["default"], "HOST": replica_host}
+        DATABASE_REPLICAS.append(f"replica{number}")
+
+    # Caché: memoria local por defecto. Con varios workers de gunicorn usar
+    # una caché compartida, p. ej. (LocMemCache es por proceso: la caché de
+    # productos y las lecturas de réplicas quedan apagadas, ver CACHE_IS_SHARED)
+    # CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+    # CACHE_LOCATION=redis://localhost:6379/0
+    CACHE_BACKEND = config(
+        "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache")
+    CACHE_LOCATION = config("CACHE_LOCATION", default="")
+
     print("🔧 Usando configuración de Desarrollo/Producción")
 
 
@@ -90,21 +152,26 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework_simplejwt',
     'rest_framework',
     'apps.user',
     'apps.product',
+    'apps.jobs',
     'corsheaders',
 
 ]
 
 MIDDLEWARE = [
+    "l_atelier.metrics.RequestMetricsMiddleware",
+    "l_atelier.compression.CompressionMiddleware",
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    "l_atelier.db_router.DatabaseRoutingMiddleware",
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     "corsheaders.middleware.CorsMiddleware",
@@ -128,6 +195,7 @@ CORS_ALLOW_HEADERS = [
     "origin",
     "user-agent",
     "x-csrftoken",
+    "x-db-primary",
 ]
 
 REST_FRAMEWORK = {
@@ -179,6 +247,16 @@ DATABASES = {
 }
 """
 
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKEND,
+        "LOCATION": CACHE_LOCATION,
+    }
+}
+# LocMemCache es por proceso: lo que un worker guarda o invalida no lo ven
+# los demás. Las funciones que dependen de eso se activan solo si es compartida.
+CACHE_IS_SHARED = not CACHE_BACKEND.endswith(".LocMemCache")
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -229,14 +307,24 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # REST Framework settings
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.user.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [ 
         "rest_framework.permissions.IsAuthenticated",
     ],
+    # orjson si está instalado (misma salida que el JSON de DRF)
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "l_atelier.renderers.FastJSONRenderer",
     ],
+    "DEFAULT_PARSER_CLASSES": [
+        "l_atelier.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    # Proxies de confianza delante de la app: la IP de los throttles es el
+    # salto de X-Forwarded-For que agregó el último de ellos (0 = REMOTE_ADDR).
+    # Sin este valor DRF usa la cabecera completa y el cliente puede rotarla.
+    "NUM_PROXIES": config("NUM_PROXIES", default=1 if RENDER_EXTERNAL_HOSTNAME else 0, cast=int),
 }
 
 # JWT Settings
@@ -245,3 +333,131 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
     "ROTATE_REFRESH_TOKENS": True,
 }
+
+# Paginación por cursor de productos (opcional: ?page_size= o ?cursor=)
+PRODUCT_PAGE_SIZE = 20
+PRODUCT_MAX_PAGE_SIZE = 100
+
+# Listados serializados desde .values() (apps/product/rows.py)
+PRODUCT_FAST_SERIALIZER = config("PRODUCT_FAST_SERIALIZER", default=True, cast=bool)
+
+# Búsqueda de productos: configuración de texto de PostgreSQL
+PRODUCT_SEARCH_CONFIG = "spanish"
+PRODUCT_AUTOCOMPLETE_LIMIT = 10
+PRODUCT_AUTOCOMPLETE_MAX_LIMIT = 25
+
+# Caché de lectura de productos (list/retrieve), invalidada por versión. La
+# versión vive en CACHE_BACKEND: con LocMemCache cada worker tiene la suya y
+# los demás servirían datos viejos hasta TIMEOUT, así que por defecto solo se
+# activa con una caché compartida.
+PRODUCT_CACHE = {
+    "ENABLED": config(
+        "PRODUCT_CACHE_ENABLED", default=CACHE_IS_SHARED, cast=bool),
+    "ALIAS": "default",
+    "TIMEOUT": 300,
+}
+
+# Importación masiva de productos: filas por bulk_create y errores reportados
+PRODUCT_IMPORT_BATCH_SIZE = 500
+PRODUCT_IMPORT_MAX_REPORTED_ERRORS = 1000
+
+# Exportación del catálogo: filas por lote del cursor del servidor
+PRODUCT_EXPORT_CHUNK_SIZE = 2000
+
+# Métricas por petición (Server-Timing + log): fracción de peticiones muestreadas.
+# Server-Timing solo va a staff salvo SERVER_TIMING (activo con DEBUG).
+REQUEST_METRICS = {
+    "ENABLED": config("REQUEST_METRICS_ENABLED", default=True, cast=bool),
+    "SAMPLE_RATE": config("REQUEST_METRICS_SAMPLE_RATE", default=0.1, cast=float),
+    "SERVER_TIMING": config("REQUEST_METRICS_SERVER_TIMING", default=DEBUG, cast=bool),
+}
+
+# Logs de la aplicación (apps.* y l_atelier.*) a consola
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {"class": "logging.StreamHandler"},
+    },
+    "loggers": {
+        "apps": {"handlers": ["console"], "level": config("LOG_LEVEL", default="INFO")},
+        "l_atelier": {"handlers": ["console"], "level": config("LOG_LEVEL", default="INFO")},
+    },
+}
+
+# Derivados de Product.image: anchos y formatos (los que Pillow no soporte se omiten)
+PRODUCT_IMAGE_WIDTHS = (160, 320, 640, 1280)
+PRODUCT_IMAGE_FORMATS = ("avif", "webp", "jpeg")
+
+# Cola de tareas en la base de datos (worker: python manage.py run_jobs)
+JOBS = {
+    "EAGER": config("JOBS_EAGER", default=False, cast=bool),
+    "MAX_ATTEMPTS": 3,
+    "RETRY_DELAY": 30,
+    "LOCK_TIMEOUT": 600,
+    "POLL_INTERVAL": 2,
+    "BATCH_SIZE": 10,
+}
+
+# Límites de subida de Product.image (bytes y píxeles, verificados antes de decodificar)
+PRODUCT_IMAGE_MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+PRODUCT_IMAGE_MAX_PIXELS = 40_000_000
+
+# Caché del usuario autenticado por JWT (segundos; 0 la desactiva). La
+# invalidación al desactivar un usuario o quitarle is_staff solo llega a los
+# demás workers con una caché compartida: sin ella queda desactivada.
+AUTH_USER_CACHE_TIMEOUT = config(
+    "AUTH_USER_CACHE_TIMEOUT", default=60 if CACHE_IS_SHARED else 0, cast=int)
+
+# Hashing de contraseñas (apps.user.hashers): pbkdf2, scrypt o argon2 (requiere
+# argon2-cffi). Al cambiar el costo, los hashes se regeneran en el siguiente login.
+PASSWORD_HASHING = {
+    "ALGORITHM": config("PASSWORD_HASHER", default="pbkdf2"),
+    "PBKDF2_ITERATIONS": config("PBKDF2_ITERATIONS", default=1_000_000, cast=int),
+    "SCRYPT_WORK_FACTOR": config("SCRYPT_WORK_FACTOR", default=2**14, cast=int),
+    "SCRYPT_BLOCK_SIZE": 8,
+    "SCRYPT_PARALLELISM": 1,
+    "ARGON2_TIME_COST": config("ARGON2_TIME_COST", default=2, cast=int),
+    "ARGON2_MEMORY_COST": config("ARGON2_MEMORY_COST", default=102400, cast=int),
+    "ARGON2_PARALLELISM": 8,
+}
+PASSWORD_HASHERS = [
+    f"apps.user.hashers.{name}PasswordHasher"
+    for name in {
+        "pbkdf2": ("PBKDF2", "Scrypt", "Argon2"),
+        "scrypt": ("Scrypt", "PBKDF2", "Argon2"),
+        "argon2": ("Argon2", "PBKDF2", "Scrypt"),
+    }[PASSWORD_HASHING["ALGORITHM"]]
+]
+
+# Límite de intentos de login/registro (token bucket "capacidad/periodo").
+# STORE compartido entre workers: "apps.user.throttling.CacheBucketStore"
+AUTH_THROTTLE = {
+    "ENABLED": config("AUTH_THROTTLE_ENABLED", default=True, cast=bool),
+    "STORE": config("AUTH_THROTTLE_STORE", default="apps.user.throttling.LocalMemoryBucketStore"),
+    "CACHE_ALIAS": "default",
+    "RATES": {
+        "login_ip": "20/min",
+        "login_username": "5/min",
+        "register_ip": "10/hour",
+    },
+}
+
+# Lecturas de productos y usuarios desde réplicas (ver l_atelier/db_router.py).
+# Tras escribir, el cliente lee del primario durante DB_REPLICA_STICKY_SECONDS;
+# la marca por usuario vive en la caché, así que sin caché compartida otro
+# worker leería de la réplica atrasada: por defecto solo se activa con ella.
+DB_REPLICA_READS = config("DB_REPLICA_READS", default=CACHE_IS_SHARED, cast=bool)
+DATABASE_ROUTERS = ["l_atelier.db_router.ReplicaRouter"]
+DATABASE_ROUTING = {
+    "REPLICAS": DATABASE_REPLICAS if DB_REPLICA_READS else [],
+    "STICKY_SECONDS": config("DB_REPLICA_STICKY_SECONDS", default=10, cast=int),
+}
+
+# Compresión de respuestas JSON de la API (ver l_atelier/compression.py).
+# zstd y br solo se ofrecen si zstandard/brotli están instalados.
+API_COMPRESSION = {
+    "ENABLED": config("API_COMPRESSION_ENABLED", default=True, cast=bool),
+    "MIN_SIZE": config("API_COMPRESSION_MIN_SIZE", default=1024, cast=int),
+    "ENCODINGS": ("zstd", "br", "gzip"),
+}